@@ -19,4 +19,6 @@ until elastic_ready; do
 done
 >&2 echo 'Elasticsearch is available.'
 
-gunicorn main:app --bind 0.0.0.0:8000 -k uvicorn.workers.UvicornWorker
\ No newline at end of file
+python -m db.indices
+
+gunicorn main:app --bind 0.0.0.0:8000 --config gunicorn_conf.py
\ No newline at end of file
@@ -0,0 +1,45 @@
+from http import HTTPStatus
+from typing import Dict
+
+import jwt
+from fastapi import Header, HTTPException
+
+from core.config import CONFIG
+
+ADMIN_ROLE = 'admin'
+
+
+def decode_token(authorization: str) -> Dict:
+    """
+    Decode the bearer token of the Authorization header.
+
+    Args:
+        authorization: Authorization header in the Bearer <token> format
+
+    Raises:
+        HTTPException: If the scheme is not Bearer or the token is invalid, return an HTTP 401 status.
+
+    Returns:
+        Dict: Claims of the token
+    """
+    scheme, _, token = authorization.partition(' ')
+    if scheme.lower() != 'bearer' or not token:
+        raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED, headers={'WWW-Authenticate': 'Bearer'})
+    try:
+        return jwt.decode(jwt=token, key=CONFIG.fastapi.secret_key, algorithms=['HS256'])
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED, headers={'WWW-Authenticate': 'Bearer'})
+
+
+async def authorize_admin(authorization: str = Header(default='')):
+    """
+    Allow the service endpoints only to administrators, whose token has the admin role, even in debug mode.
+
+    Args:
+        authorization: Authorization header with the bearer token
+
+    Raises:
+        HTTPException: If the token is invalid, return an HTTP 401 status, and if it has no admin role, HTTP 403.
+    """
+    if ADMIN_ROLE not in decode_token(authorization).get('roles', []):
+        raise HTTPException(status_code=HTTPStatus.FORBIDDEN)
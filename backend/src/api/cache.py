@@ -0,0 +1,30 @@
+from typing import Dict, Union
+
+from fastapi import APIRouter, Depends
+
+from api.auth import authorize_admin
+from services.entries import count_entries
+from db.backends import CacheBackend
+from db.redis import RedisStorage, get_redis
+
+router = APIRouter(prefix='/cache', tags=['cache'], dependencies=[Depends(authorize_admin)])
+
+
+@router.post(
+    '/purge/{tag}',
+    summary='Purge by Surrogate Key',
+    description='Delete all cached responses tagged with the surrogate key, e.g. movies:{film_id}. For administrators',
+    response_description='Number of deleted cache entries')
+async def purge(tag: str, redis: CacheBackend = Depends(get_redis)) -> Dict[str, Union[str, int]]:
+    """
+    Purge the Redis cache by a surrogate key from the Surrogate-Key header of the responses.
+
+    Args:
+        tag: Surrogate key
+        redis: Connection to Redis for data caching
+
+    Returns:
+        Dict[str, Union[str, int]]: Surrogate key and number of deleted cache entries
+    """
+    keys = await RedisStorage(redis=redis).purge_redis_tag(tag)
+    return {'tag': tag, 'purged': count_entries(keys)}
@@ -0,0 +1,120 @@
+import asyncio
+import os
+import threading
+from http import HTTPStatus
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from api.auth import authorize_admin
+from core.config import CONFIG
+from core.profiler import CpuProfiler, MemoryTracer
+
+profiler = CpuProfiler(interval=CONFIG.debugger.interval)
+tracer = MemoryTracer(frames=CONFIG.debugger.frames, limit=CONFIG.debugger.snapshots)
+
+
+def check_worker(pid: int = Query(description='Process ID of the worker that took the snapshots')):
+    """
+    Allow the requests about the snapshots only to the worker that took them, as every worker has its own snapshots.
+
+    Args:
+        pid: Process ID of the worker returned with the snapshot
+
+    Raises:
+        HTTPException: If another worker answers, return an HTTP 421 status, so that the request is retried.
+    """
+    if pid != os.getpid():
+        raise HTTPException(
+            status_code=HTTPStatus.MISDIRECTED_REQUEST,
+            detail=f'Snapshots of worker {pid} are not kept by worker {os.getpid()}',
+        )
+
+
+router = APIRouter(prefix='/debug', tags=['debug'], dependencies=[Depends(authorize_admin)])
+
+
+@router.get(
+    '/profile',
+    response_class=PlainTextResponse,
+    summary='CPU Profile',
+    description='Sample the stack of the event loop for the given time, in the collapsed format of flamegraph tools',
+    response_description='Folded stacks with the number of samples')
+async def profile(seconds: float = Query(default=10, gt=0, le=CONFIG.debugger.seconds)) -> str:
+    """
+    Profile the CPU of the worker by sampling the stack of the event loop from another thread.
+
+    Args:
+        seconds: Duration of the profiling
+
+    Raises:
+        HTTPException: If another profile is being taken, return an HTTP 409 status.
+
+    Returns:
+        str: Folded stacks with the number of samples, one per line
+    """
+    stacks = await asyncio.get_running_loop().run_in_executor(
+        None, profiler.profile, threading.get_ident(), seconds,
+    )
+    if stacks is None:
+        raise HTTPException(status_code=HTTPStatus.CONFLICT, detail='Another profile is being taken')
+    return stacks
+
+
+@router.post(
+    '/memory/snapshots',
+    summary='Memory Snapshot',
+    description='Take a tracemalloc snapshot, starting the tracing of allocations with the first one',
+    response_description='Identifier of the snapshot and process ID of the worker that keeps it')
+async def take_snapshot() -> Dict[str, int]:
+    """
+    Take a snapshot of the memory allocations of the worker outside the event loop.
+
+    Returns:
+        Dict[str, int]: Identifier of the snapshot and process ID of the worker
+    """
+    snapshot_id = await asyncio.get_running_loop().run_in_executor(None, tracer.snapshot)
+    return {'id': snapshot_id, 'pid': os.getpid()}
+
+
+@router.get(
+    '/memory/snapshots/{snapshot_id}',
+    summary='Memory Allocations',
+    description='Source lines that allocated the most memory, or that grew the most since the base snapshot',
+    response_description='Allocations by source line',
+    dependencies=[Depends(check_worker)])
+async def compare_snapshots(
+    snapshot_id: int,
+    base: Optional[int] = Query(default=None, description='Snapshot to compare with'),
+    top: int = Query(default=25, gt=0, le=1000),
+) -> List[Dict]:
+    """
+    Get the top allocations of a snapshot, or their difference from the base snapshot, outside the event loop.
+
+    Args:
+        snapshot_id: Identifier of the snapshot
+        base: Identifier of the earlier snapshot
+        top: Number of source lines
+
+    Raises:
+        HTTPException: If any of the snapshots is not kept, return an HTTP 404 status.
+
+    Returns:
+        List[Dict]: Allocation size, its growth and the number of blocks by the source line
+    """
+    stats = await asyncio.get_running_loop().run_in_executor(None, tracer.top, snapshot_id, base, top)
+    if stats is None:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND)
+    return stats
+
+
+@router.delete(
+    '/memory/snapshots',
+    status_code=HTTPStatus.NO_CONTENT,
+    summary='Stop Memory Tracing',
+    description='Stop tracing the allocations and forget the snapshots',
+    dependencies=[Depends(check_worker)])
+async def stop_tracing():
+    """Stop tracing the memory allocations outside the event loop, so that they are no longer slowed down."""
+    await asyncio.get_running_loop().run_in_executor(None, tracer.stop)
@@ -0,0 +1,73 @@
+from http import HTTPStatus
+from typing import Dict
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import ORJSONResponse
+
+from api.auth import authorize_admin
+from core.bulkhead import BULKHEADS
+from core import monitor
+from core.calls import REQUESTS, TOTALS
+from db import connections, pooling, reads
+
+router = APIRouter(prefix='/health', tags=['health'])
+
+
+@router.get(
+    '/live',
+    summary='Liveness',
+    description='The worker process is running',
+    response_description='Liveness status')
+async def live() -> Dict[str, str]:
+    """
+    Report that the worker process is alive.
+
+    Returns:
+        Dict[str, str]: Liveness status
+    """
+    return {'status': 'alive'}
+
+
+@router.get(
+    '/ready',
+    summary='Readiness',
+    description='The worker has verified its connections and finished the warmup',
+    response_description='Readiness status')
+async def ready(request: Request) -> ORJSONResponse:
+    """
+    Report whether the worker can accept traffic from the load balancer.
+
+    Args:
+        request: The client's request
+
+    Returns:
+        ORJSONResponse: Readiness status, HTTP 503 until the worker is ready
+    """
+    if not request.app.state.ready or not await connections.verify_connections():
+        return ORJSONResponse({'status': 'unavailable'}, status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+    return ORJSONResponse({'status': 'ready'})
+
+
+@router.get(
+    '/load',
+    summary='Load',
+    description='State of the limits, pools and bulkheads, the database calls of the requests and the loop lag. '
+                'For administrators',
+    response_description='Load of the worker',
+    dependencies=[Depends(authorize_admin)])
+async def load() -> Dict[str, Dict]:
+    """
+    Report the load of the worker for monitoring.
+
+    Returns:
+        Dict[str, Dict]: Requests in progress, waiting and rejected by the limiter, each node pool and bulkhead, and
+            the database calls of the requests, and the lag of the event loop
+    """
+    return {
+        'limiter': reads.limiter.stats() if reads.limiter else {},
+        'elastic': pooling.elasticsearch_stats(),
+        'hedging': reads.hedger.stats() if reads.hedger else {},
+        'calls': {**TOTALS.stats(), 'requests': dict(REQUESTS)},
+        'loop': monitor.monitor.stats() if monitor.monitor else {},
+        'bulkheads': {name: bulkhead.stats() for name, bulkhead in BULKHEADS.items()},
+    }
@@ -0,0 +1,109 @@
+import logging
+from contextlib import ExitStack
+from http import HTTPStatus
+from typing import Callable
+
+from fastapi import Request, Response
+
+from core.bulkhead import BulkheadFull
+from core.calls import REQUESTS, TOTALS, CallStats, current_calls
+from core.config import CONFIG
+from core.deadline import DeadlineExceeded
+from db import reads
+
+
+async def cache_control(request: Request, call_next: Callable) -> Response:
+    """Declare how shared caches may store catalog responses.
+
+    Anonymous movie lists may be microcached by NGINX, while the other responses are private to the authorized user
+    and must be revalidated with their entity tag.
+
+    Args:
+        request (Request): The client's request.
+        call_next (Callable): The request handler function.
+
+    Returns:
+        Response: The server's response.
+    """
+    response = await call_next(request)
+    if 'etag' in response.headers and 'cache-control' not in response.headers:
+        if request.scope['path'] == request.app.url_path_for('films'):
+            response.headers['Cache-Control'] = f'public, max-age={CONFIG.fastapi.microcache_expire_in_seconds}'
+        else:
+            response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+async def elastic_memo(request: Request, call_next: Callable) -> Response:
+    """Share the results of identical Elasticsearch reads within the lifetime of the request.
+
+    Args:
+        request (Request): The client's request.
+        call_next (Callable): The request handler function.
+
+    Returns:
+        Response: The server's response.
+    """
+    with ExitStack() as memo:
+        memo.callback(reads.memo.reset, reads.memo.set({}))
+        response = await call_next(request)
+    return response
+
+
+async def count_calls(request: Request, call_next: Callable) -> Response:
+    """Count the database calls of the request, warning about the requests beyond the query budget.
+
+    Args:
+        request (Request): The client's request.
+        call_next (Callable): The request handler function.
+
+    Returns:
+        Response: The server's response, with the calls in debug headers if they are enabled.
+    """
+    calls = CallStats()
+    with ExitStack() as counting:
+        counting.callback(current_calls.reset, current_calls.set(calls))
+        response = await call_next(request)
+    TOTALS.merge(calls)
+    REQUESTS['total'] += 1
+    if calls.counts['elastic'] > CONFIG.calls.budget:
+        REQUESTS['over_budget'] += 1
+        logging.warning(
+            f'{request.url.path} made {calls.counts["elastic"]} Elasticsearch calls, '
+            f'over the budget of {CONFIG.calls.budget}!',
+        )
+    if CONFIG.calls.headers:
+        response.headers.update(calls.headers())
+    return response
+
+
+async def bulkhead_full(request: Request, exc: BulkheadFull) -> Response:
+    """Shed the request whose workload has exhausted its bulkhead.
+
+    Args:
+        request (Request): The client's request.
+        exc (BulkheadFull): The exception with the name of the bulkhead.
+
+    Returns:
+        Response: The server's response with the time to retry.
+    """
+    logging.warning(f'{exc}, the request is rejected.')
+    return Response(
+        'The service is overloaded!',
+        status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+        headers={'Retry-After': str(CONFIG.limiter.retry)},
+    )
+
+
+async def deadline_exceeded(request: Request, exc: DeadlineExceeded) -> Response:
+    """Stop the request whose latency budget has run out.
+
+    Args:
+        request (Request): The client's request.
+        exc (DeadlineExceeded): The exception of the expired deadline.
+
+    Returns:
+        Response: The server's response.
+    """
+    logging.warning(f'Latency budget of {request.url.path} has run out, the request is stopped.')
+    return Response('The request took too long!', status_code=HTTPStatus.GATEWAY_TIMEOUT)
@@ -0,0 +1,139 @@
+import json
+import re
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from api.v1.base import Identifiers, Paginator
+from api.v1.films import FilmFilter, get_film_details, get_film_list, get_film_search, get_film_suggest
+from api.v1.genres import get_genre_details, get_genre_list
+from api.v1.persons import (
+    get_person_details, get_person_films, get_person_list, get_person_search, get_person_suggest,
+)
+from services.base import BaseService
+
+API_PREFIX = '/api/v1'
+
+
+def paginate(params: Dict[str, str]) -> Paginator:
+    """
+    Get a paginator from the query parameters of the URL.
+
+    Args:
+        params: Query parameters in the URL
+
+    Returns:
+        Paginator: Page number and page size
+    """
+    return Paginator(
+        page_number=int(params.get('page[number]', 1)),
+        page_size=int(params.get('page[size]', 50)),
+    )
+
+
+def identify(params: Dict[str, str]) -> Identifiers:
+    """
+    Get the IDs of several requested objects from the query parameters of the URL.
+
+    Args:
+        params: Query parameters in the URL
+
+    Returns:
+        Identifiers: IDs of the objects
+    """
+    return Identifiers(ids=params.get('ids'))
+
+
+Route = Tuple[re.Pattern, Callable[..., BaseService]]
+
+ROUTES: Tuple[Route, ...] = (
+    (re.compile('^/films$'), lambda dependencies, params: get_film_list(
+        film_filter=FilmFilter(filter_genre=params.get('filter[genre]'), sort=params.get('sort')),
+        paginator=paginate(params), identifiers=identify(params), **dependencies,
+    )),
+    (re.compile('^/films/search$'), lambda dependencies, params: get_film_search(
+        query=params.get('query'), paginator=paginate(params), **dependencies,
+    )),
+    (re.compile('^/films/suggest$'), lambda dependencies, params: get_film_suggest(
+        query=params.get('query'), **dependencies,
+    )),
+    (re.compile('^/films/(?P<film_id>[^/]+)$'), lambda dependencies, params, film_id: get_film_details(
+        film_id=film_id, fields=params.get('fields[films]'), include=params.get('include'), **dependencies,
+    )),
+    (re.compile('^/persons$'), lambda dependencies, params: get_person_list(
+        paginator=paginate(params), identifiers=identify(params), **dependencies,
+    )),
+    (re.compile('^/persons/search$'), lambda dependencies, params: get_person_search(
+        query=params.get('query'), paginator=paginate(params), **dependencies,
+    )),
+    (re.compile('^/persons/suggest$'), lambda dependencies, params: get_person_suggest(
+        query=params.get('query'), **dependencies,
+    )),
+    (re.compile('^/persons/(?P<person_id>[^/]+)$'), lambda dependencies, params, person_id: get_person_details(
+        person_id=person_id, fields=params.get('fields[persons]'), **dependencies,
+    )),
+    (re.compile('^/persons/(?P<person_id>[^/]+)/film$'), lambda dependencies, params, person_id: get_person_films(
+        person_id=person_id, **dependencies,
+    )),
+    (re.compile('^/genres$'), lambda dependencies, params: get_genre_list(
+        paginator=paginate(params), identifiers=identify(params), **dependencies,
+    )),
+    (re.compile('^/genres/(?P<genre_id>[^/]+)$'), lambda dependencies, params, genre_id: get_genre_details(
+        genre_id=genre_id, fields=params.get('fields[genres]'), **dependencies,
+    )),
+)
+
+
+def read_access_log(path: str, top: int) -> List[str]:
+    """
+    Find the most requested API pages in the NGINX access log in JSON format.
+
+    Args:
+        path: Path to the access log
+        top: Number of pages to return
+
+    Returns:
+        List[str]: URL paths of the API pages, starting with the most requested
+    """
+    counter: Counter = Counter()
+    with open(path) as access_log:
+        for line in access_log:
+            try:
+                method, url, *_ = json.loads(line)['request'].split()
+            except (ValueError, KeyError):
+                continue
+            if method == 'GET' and url.startswith(API_PREFIX):
+                counter[url[len(API_PREFIX):]] += 1
+    return [url for url, _ in counter.most_common(top)]
+
+
+def resolve(url: str, dependencies: Dict) -> Optional[BaseService]:
+    """
+    Get the service serving the API page.
+
+    Args:
+        url: URL path of the API page with query parameters
+        dependencies: Database and representation of the response given to the service
+
+    Returns:
+        Optional[BaseService]: Service that refreshes the cache instead of reading it, or None for unknown pages
+    """
+    path, params = urlsplit(url).path, dict(parse_qsl(urlsplit(url).query))
+    for pattern, provider in ROUTES:
+        match = pattern.match(path)
+        if match:
+            return provider(dependencies, params, **match.groupdict()).copy(update={'cache_refresh': True})
+    return None
+
+
+async def refresh(url: str, dependencies: Dict):
+    """
+    Precompute the cache of the API page with the service that serves it.
+
+    Args:
+        url: URL path of the API page
+        dependencies: Database and representation of the response given to the service
+    """
+    service = resolve(url, dependencies)
+    if service:
+        await service.get()
@@ -1,7 +1,12 @@
-from aioredis import Redis
+from typing import Iterable, List, Optional
+from uuid import UUID
+
 from elasticsearch import AsyncElasticsearch
-from fastapi import Depends, Query
+from fastapi import Depends, Header, Query
 
+from core import deadline
+from core.config import CONFIG
+from db.backends import CacheBackend
 from db.elastic import get_elastic
 from db.redis import get_redis
 
@@ -25,13 +30,63 @@ class Paginator:
         self.size = page_size
 
 
+UUID_PATTERN = '[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+
+
+def choices_pattern(choices: Iterable[str]) -> str:
+    """
+    Get a regular expression for a comma-separated list of the allowed values.
+
+    Args:
+        choices: Allowed values
+
+    Returns:
+        str: Regular expression for the query parameter
+    """
+    choice = '|'.join(choices)
+    return f'^({choice})(,({choice}))*$'
+
+
+def split_choices(value: Optional[str]) -> Optional[List[str]]:
+    """
+    Split a comma-separated query parameter into sorted unique values, so that equal requests share a cache key.
+
+    Args:
+        value: Comma-separated values
+
+    Returns:
+        Optional[List[str]]: Values, or None if the parameter is not set
+    """
+    return sorted(set(value.split(','))) if value else None
+
+
+class Identifiers:
+    """Class for retrieving the IDs of several objects requested at once."""
+
+    def __init__(
+        self,
+        ids: Optional[str] = Query(
+            default=None,
+            description='Comma-separated IDs of up to 100 objects to retrieve at once',
+            regex=f'^{UUID_PATTERN}(,{UUID_PATTERN}){{0,99}}$',
+        ),
+    ):
+        """
+        When initializing the class, it accepts the comma-separated IDs as a parameter in the request.
+
+        Args:
+            ids: Comma-separated IDs
+        """
+        self.ids: List[UUID] = [UUID(obj_id) for obj_id in ids.split(',')] if ids else []
+
+
 class Database:
     """Class with dependencies for working with Elasticsearch and Redis databases."""
 
     def __init__(
         self,
         elastic: AsyncElasticsearch = Depends(get_elastic),
-        redis: Redis = Depends(get_redis),
+        redis: CacheBackend = Depends(get_redis),
     ):
         """
         When initializing the class, it injects dependencies for connections to Elasticsearch and Redis.
@@ -42,3 +97,43 @@ class Database:
         """
         self.redis = redis
         self.elastic = elastic
+
+
+class Representation:
+    """Class for retrieving the representation of the response preferred by the client."""
+
+    def __init__(
+        self,
+        accept_encoding: str = Header(default='', alias='Accept-Encoding', include_in_schema=False),
+        if_none_match: Optional[str] = Header(default=None, alias='If-None-Match', include_in_schema=False),
+        cache_control: str = Header(default='', alias='Cache-Control', include_in_schema=False),
+    ):
+        """
+        When initializing the class, it accepts the content negotiation, conditional and cache control headers.
+
+        Args:
+            accept_encoding: Content encodings accepted by the client
+            if_none_match: Entity tags of the representations the client already has
+            cache_control: Cache directives of the client, whose no-cache refreshes the cache while the debug headers
+                of the database calls are enabled, so that the calls of a page can be measured
+        """
+        self.accept_encoding = accept_encoding
+        self.if_none_match = if_none_match
+        self.cache_refresh = CONFIG.calls.headers and 'no-cache' in cache_control
+
+
+class Deadline:
+    """Class for setting the latency budget of the endpoint, within which all its downstream calls must complete."""
+
+    def __init__(self, budget: float):
+        """
+        When initializing the class, it accepts the latency budget of the endpoint.
+
+        Args:
+            budget: Latency budget in seconds
+        """
+        self.budget = budget
+
+    async def __call__(self):
+        """Start the deadline of the request when the endpoint is resolved."""
+        deadline.start(self.budget)
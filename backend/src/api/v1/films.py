@@ -1,38 +1,70 @@
 from functools import lru_cache
+from typing import Optional, Union
 
 from fastapi import Depends, Path, Query
 
-from api.v1.base import Database, Paginator
-from services.filters import FilterGenreFilms, QuerySearch
+from api.v1.base import Database, Identifiers, Paginator, Representation, choices_pattern, split_choices
+from services.filters import FilterGenreFilms, QuerySearch, QuerySuggest
 from services.list import ListService
-from services.retrieve import RetrieveService
+from services.retrieve import RELATIONS, MultiRetrieveService, RetrieveService
+from core.config import CONFIG
 from models.film import Film, FilmList
 
 
+class FilmFilter:
+    """Class for retrieving the filtering and sorting of the movie list."""
+
+    def __init__(
+        self,
+        filter_genre: Optional[str] = Query(default=None, alias='filter[genre]', description='Filter by genre'),
+        sort: Optional[str] = Query(default=None, description='Sorting parameter'),
+    ):
+        """
+        When initializing the class, it accepts the genre filter and the sorting as parameters in the request.
+
+        Args:
+            filter_genre: Genre ID to filter the movies by
+            sort: Sorting parameter
+        """
+        self.genre = filter_genre
+        self.sort = sort
+
+
 @lru_cache()
 def get_film_list(
-    filter_genre: str = Query(default=None, alias='filter[genre]', description='Filter by genre'),
-    sort: str = Query(default=None, description='Sorting parameter'),
+    film_filter: FilmFilter = Depends(),
     paginator: Paginator = Depends(),
+    identifiers: Identifiers = Depends(),
     database: Database = Depends(),
-) -> ListService:
+    representation: Representation = Depends(),
+) -> Union[ListService, MultiRetrieveService]:
     """
-    Retrieve a list of films using the ListService provider.
+    Retrieve a list of films using the ListService provider, or the films with the requested IDs.
 
     Args:
-        filter_genre: Filter films by genre.
-        sort: Specify the sorting parameter.
+        film_filter: Filtering and sorting of the films.
         paginator: Pagination settings.
+        identifiers: IDs of the films to retrieve at once.
         database: Database connections.
+        representation: Preferred response representation.
 
     Returns:
-        ListService: A service for obtaining a list of cinema objects.
+        Union[ListService, MultiRetrieveService]: A service for obtaining a list of cinema objects.
     """
+    if identifiers.ids:
+        return MultiRetrieveService(
+            elastic=database.elastic, redis=database.redis,
+            accept_encoding=representation.accept_encoding, if_none_match=representation.if_none_match,
+            cache_refresh=representation.cache_refresh,
+            index='movies', model=Film, ids=identifiers.ids,
+        )
     return ListService(
         elastic=database.elastic, redis=database.redis,
+        accept_encoding=representation.accept_encoding, if_none_match=representation.if_none_match,
+        cache_refresh=representation.cache_refresh,
         index='movies', model=FilmList,
-        filter=FilterGenreFilms(genre_id=filter_genre),
-        page_size=paginator.size, page_number=paginator.page, sort=sort,
+        filter=FilterGenreFilms(genre_id=film_filter.genre),
+        page_size=paginator.size, page_number=paginator.page, sort=film_filter.sort,
     )
 
 
@@ -41,6 +73,7 @@ def get_film_search(
     query: str = Query(default=None, description='Search query'),
     paginator: Paginator = Depends(),
     database: Database = Depends(),
+    representation: Representation = Depends(),
 ) -> ListService:
     """
     Retrieve search results for films using ListService.
@@ -49,34 +82,79 @@ def get_film_search(
         query: Search query
         paginator: Paginator
         database: Database connections
+        representation: Preferred response representation
 
     Returns:
         ListService: Service for obtaining a list of cinema objects
     """
     return ListService(
         elastic=database.elastic, redis=database.redis,
+        accept_encoding=representation.accept_encoding, if_none_match=representation.if_none_match,
+        cache_refresh=representation.cache_refresh,
         index='movies', model=FilmList,
         page_size=paginator.size, page_number=paginator.page,
         query=QuerySearch(q_string=query, fields=['title']),
     )
 
 
+@lru_cache()
+def get_film_suggest(
+    query: str = Query(..., min_length=1, description='Beginning of the movie title'),
+    database: Database = Depends(),
+    representation: Representation = Depends(),
+) -> ListService:
+    """
+    Retrieve autocompletion suggestions for film titles using ListService.
+
+    Args:
+        query: Beginning of the movie title
+        database: Database connections
+        representation: Preferred response representation
+
+    Returns:
+        ListService: Service for obtaining a list of cinema objects
+    """
+    return ListService(
+        elastic=database.elastic, redis=database.redis,
+        accept_encoding=representation.accept_encoding, if_none_match=representation.if_none_match,
+        cache_refresh=representation.cache_refresh,
+        index='movies', model=FilmList,
+        page_size=CONFIG.fastapi.suggest_size, page_number=1,
+        query=QuerySuggest(q_string=query, fields=['title.suggest']),
+    )
+
+
 @lru_cache()
 def get_film_details(
     film_id: str = Path(title='Film ID'),
+    fields: Optional[str] = Query(
+        default=None, alias='fields[films]', regex=choices_pattern(Film.__fields__),
+        description='Comma-separated fields of the movie to return',
+    ),
+    include: Optional[str] = Query(
+        default=None, regex=choices_pattern(RELATIONS[Film]),
+        description='Comma-separated related objects to embed in full',
+    ),
     database: Database = Depends(),
+    representation: Representation = Depends(),
 ) -> RetrieveService:
     """
     Retrieve film details by Film ID using the RetrieveService.
 
     Args:
         film_id (str): Film ID
+        fields (Optional[str]): Sparse fieldset of the film
+        include (Optional[str]): Relations of the film to embed
         database (Database): Database connections
+        representation (Representation): Preferred response representation
 
     Returns:
         RetrieveService: Service for retrieving a cinema object by ID
     """
     return RetrieveService(
         elastic=database.elastic, redis=database.redis,
+        accept_encoding=representation.accept_encoding, if_none_match=representation.if_none_match,
+        cache_refresh=representation.cache_refresh,
         index='movies', model=Film, id=film_id,
+        fields=split_choices(fields), include=split_choices(include),
     )
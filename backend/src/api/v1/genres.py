@@ -1,30 +1,44 @@
 from functools import lru_cache
+from typing import Optional, Union
 
-from fastapi import Depends, Path
+from fastapi import Depends, Path, Query
 
-from api.v1.base import Database, Paginator
+from api.v1.base import Database, Identifiers, Paginator, Representation, choices_pattern, split_choices
 from services.list import ListService
-from services.retrieve import RetrieveService
+from services.retrieve import MultiRetrieveService, RetrieveService
 from models.genre import Genre, GenreList
 
 
 @lru_cache()
 def get_genre_list(
     paginator: Paginator = Depends(),
+    identifiers: Identifiers = Depends(),
     database: Database = Depends(),
-) -> ListService:
+    representation: Representation = Depends(),
+) -> Union[ListService, MultiRetrieveService]:
     """
-    Retrieve a list of genres using the ListService.
+    Retrieve a list of genres using the ListService, or the genres with the requested IDs.
 
     Args:
         paginator (Paginator): The pagination settings.
+        identifiers (Identifiers): IDs of the genres to retrieve at once.
         database (Database): Database connections.
+        representation (Representation): Preferred response representation.
 
     Returns:
-        ListService: A service for fetching a list of cinema objects.
+        Union[ListService, MultiRetrieveService]: A service for fetching a list of cinema objects.
     """
+    if identifiers.ids:
+        return MultiRetrieveService(
+            elastic=database.elastic, redis=database.redis,
+            accept_encoding=representation.accept_encoding, if_none_match=representation.if_none_match,
+            cache_refresh=representation.cache_refresh,
+            index='genres', model=Genre, ids=identifiers.ids,
+        )
     return ListService(
         elastic=database.elastic, redis=database.redis,
+        accept_encoding=representation.accept_encoding, if_none_match=representation.if_none_match,
+        cache_refresh=representation.cache_refresh,
         index='genres', model=GenreList,
         page_size=paginator.size, page_number=paginator.page,
     )
@@ -33,19 +47,28 @@ def get_genre_list(
 @lru_cache()
 def get_genre_details(
     genre_id: str = Path(title='Genre ID'),
+    fields: Optional[str] = Query(
+        default=None, alias='fields[genres]', regex=choices_pattern(Genre.__fields__),
+        description='Comma-separated fields of the genre to return',
+    ),
     database: Database = Depends(),
+    representation: Representation = Depends(),
 ) -> RetrieveService:
     """
     Get a genre's details by its ID.
 
     Args:
         genre_id: Genre ID
+        fields: Sparse fieldset of the genre
         database: Database connections
+        representation: Preferred response representation
 
     Returns:
         RetrieveService: Service for retrieving a cinema object by ID
     """
     return RetrieveService(
         elastic=database.elastic, redis=database.redis,
-        index='genres', model=Genre, id=genre_id,
+        accept_encoding=representation.accept_encoding, if_none_match=representation.if_none_match,
+        cache_refresh=representation.cache_refresh,
+        index='genres', model=Genre, id=genre_id, fields=split_choices(fields),
     )
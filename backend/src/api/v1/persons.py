@@ -1,32 +1,47 @@
 from functools import lru_cache
+from typing import Optional, Union
 
 from fastapi import Depends, Path, Query
 
-from api.v1.base import Database, Paginator
-from services.filters import FilterPersonFilms, QuerySearch
+from api.v1.base import Database, Identifiers, Paginator, Representation, choices_pattern, split_choices
+from services.filters import FilterPersonFilms, QuerySearch, QuerySuggest
 from services.list import ListService
-from services.retrieve import RetrieveService
+from services.retrieve import MultiRetrieveService, RetrieveService
+from core.config import CONFIG
 from models.film import FilmList
-from models.person import Person, PersonList
+from models.person import Person, PersonList, PersonModifiedList
 
 
 @lru_cache()
 def get_person_list(
     paginator: Paginator = Depends(),
+    identifiers: Identifiers = Depends(),
     database: Database = Depends(),
-) -> ListService:
+    representation: Representation = Depends(),
+) -> Union[ListService, MultiRetrieveService]:
     """
-    Retrieve a list of persons using the ListService provider.
+    Retrieve a list of persons using the ListService provider, or the persons with the requested IDs.
 
     Args:
         paginator: Paginator
+        identifiers: IDs of the persons to retrieve at once
         database: Database connections
+        representation: Preferred response representation
 
     Returns:
-        ListService: Service for retrieving a list of cinema objects
+        Union[ListService, MultiRetrieveService]: Service for retrieving a list of cinema objects
     """
+    if identifiers.ids:
+        return MultiRetrieveService(
+            elastic=database.elastic, redis=database.redis,
+            accept_encoding=representation.accept_encoding, if_none_match=representation.if_none_match,
+            cache_refresh=representation.cache_refresh,
+            index='persons', model=Person, ids=identifiers.ids,
+        )
     return ListService(
         elastic=database.elastic, redis=database.redis,
+        accept_encoding=representation.accept_encoding, if_none_match=representation.if_none_match,
+        cache_refresh=representation.cache_refresh,
         index='persons', model=PersonList,
         page_size=paginator.size, page_number=paginator.page,
     )
@@ -37,6 +52,7 @@ def get_person_search(
     query: str = Query(default=None, description='Search query'),
     paginator: Paginator = Depends(),
     database: Database = Depends(),
+    representation: Representation = Depends(),
 ) -> ListService:
     """
     Retrieve search results for persons using the ListService provider function.
@@ -45,22 +61,53 @@ def get_person_search(
         query: Search query
         paginator: Paginator
         database: Database connections
+        representation: Preferred response representation
 
     Returns:
         ListService: Service for retrieving a list of cinema objects
     """
     return ListService(
         elastic=database.elastic, redis=database.redis,
+        accept_encoding=representation.accept_encoding, if_none_match=representation.if_none_match,
+        cache_refresh=representation.cache_refresh,
         index='persons', model=PersonList,
         page_size=paginator.size, page_number=paginator.page,
         query=QuerySearch(q_string=query, fields=['full_name']),
     )
 
 
+@lru_cache()
+def get_person_suggest(
+    query: str = Query(..., min_length=1, description='Beginning of the full name'),
+    database: Database = Depends(),
+    representation: Representation = Depends(),
+) -> ListService:
+    """
+    Retrieve autocompletion suggestions for person names using the ListService provider function.
+
+    Args:
+        query: Beginning of the full name
+        database: Database connections
+        representation: Preferred response representation
+
+    Returns:
+        ListService: Service for retrieving a list of cinema objects
+    """
+    return ListService(
+        elastic=database.elastic, redis=database.redis,
+        accept_encoding=representation.accept_encoding, if_none_match=representation.if_none_match,
+        cache_refresh=representation.cache_refresh,
+        index='persons', model=PersonModifiedList,
+        page_size=CONFIG.fastapi.suggest_size, page_number=1,
+        query=QuerySuggest(q_string=query, fields=['full_name.suggest']),
+    )
+
+
 @lru_cache()
 def get_person_films(
     person_id: str = Path(title='Person ID'),
     database: Database = Depends(),
+    representation: Representation = Depends(),
 ) -> ListService:
     """
     Retrieve films associated with a person using ListService.
@@ -68,12 +115,15 @@ def get_person_films(
     Args:
         person_id (str): Person ID for filtering films
         database (Database): Database connections
+        representation (Representation): Preferred response representation
 
     Returns:
         ListService: Service for retrieving a list of cinema objects
     """
     return ListService(
         elastic=database.elastic, redis=database.redis,
+        accept_encoding=representation.accept_encoding, if_none_match=representation.if_none_match,
+        cache_refresh=representation.cache_refresh,
         index='movies', model=FilmList,
         filter=FilterPersonFilms(person_id=person_id),
     )
@@ -82,19 +132,28 @@ def get_person_films(
 @lru_cache()
 def get_person_details(
     person_id: str = Path(title='Person ID'),
+    fields: Optional[str] = Query(
+        default=None, alias='fields[persons]', regex=choices_pattern(Person.__fields__),
+        description='Comma-separated fields of the person to return',
+    ),
     database: Database = Depends(),
+    representation: Representation = Depends(),
 ) -> RetrieveService:
     """
     Retrieve a person by ID using the RetrieveService.
 
     Args:
         person_id: Person ID
+        fields: Sparse fieldset of the person
         database: Database connections
+        representation: Preferred response representation
 
     Returns:
         RetrieveService: Service for retrieving a cinema object by ID
     """
     return RetrieveService(
         elastic=database.elastic, redis=database.redis,
-        index='persons', model=Person, id=person_id,
+        accept_encoding=representation.accept_encoding, if_none_match=representation.if_none_match,
+        cache_refresh=representation.cache_refresh,
+        index='persons', model=Person, id=person_id, fields=split_choices(fields),
     )
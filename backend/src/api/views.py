@@ -1,13 +1,17 @@
-from typing import List
+from typing import List, Union
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
-from api.v1.films import get_film_details, get_film_list, get_film_search
+from api.v1.base import Deadline
+from api.v1.films import get_film_details, get_film_list, get_film_search, get_film_suggest
 from api.v1.genres import get_genre_details, get_genre_list
-from api.v1.persons import get_person_details, get_person_films, get_person_list, get_person_search
-from models.film import Film, FilmList, FilmModified
+from api.v1.persons import (
+    get_person_details, get_person_films, get_person_list, get_person_search, get_person_suggest,
+)
+from core.config import CONFIG
+from models.film import Film, FilmList
 from models.genre import Genre, GenreList
-from models.person import Person, PersonList
+from models.person import Person, PersonList, PersonModifiedList
 from services.list import ListService
 from services.retrieve import RetrieveService
 
@@ -16,13 +20,14 @@ router = APIRouter()
 
 @router.get(
     '/films',
-    response_model=FilmList,
+    response_model=Union[FilmList, List[Film]],
     response_model_by_alias=False,
     summary='Homepage',
-    description='Popular movies and filtering by genres',
-    response_description='Movie titles and ratings',
+    description='Popular movies, filtering by genres, or complete information about the movies with the given IDs',
+    response_description='Movie titles and ratings, or complete movie information when the IDs are given',
+    dependencies=[Depends(Deadline(CONFIG.deadlines.list))],
     tags=['films'])
-async def films(films_list: ListService = Depends(get_film_list)) -> List[FilmModified]:
+async def films(films_list: ListService = Depends(get_film_list)) -> Response:
     return await films_list.get()
 
 
@@ -33,20 +38,35 @@ async def films(films_list: ListService = Depends(get_film_list)) -> List[FilmMo
     summary='Search Movies',
     description='Full-text search by movie titles',
     response_description='Movie titles and ratings',
+    dependencies=[Depends(Deadline(CONFIG.deadlines.search))],
     tags=['films'])
-async def films_search(films_by_search: ListService = Depends(get_film_search)) -> List[FilmModified]:
+async def films_search(films_by_search: ListService = Depends(get_film_search)) -> Response:
     return await films_by_search.get()
 
 
+@router.get(
+    '/films/suggest',
+    response_model=FilmList,
+    response_model_by_alias=False,
+    summary='Suggest Movies',
+    description='Autocompletion of movie titles as they are typed',
+    response_description='Movie titles and ratings',
+    dependencies=[Depends(Deadline(CONFIG.deadlines.suggest))],
+    tags=['films'])
+async def films_suggest(films_by_prefix: ListService = Depends(get_film_suggest)) -> Response:
+    return await films_by_prefix.get()
+
+
 @router.get(
     '/films/{film_id}',
     response_model=Film,
     response_model_by_alias=False,
     summary='Movie Page',
-    description='Complete information about the movie',
+    description='Complete information about the movie, or its requested fields and related objects',
     response_description='Movie title, description, rating, genres, and movie personnel',
+    dependencies=[Depends(Deadline(CONFIG.deadlines.detail))],
     tags=['films'])
-async def films_pk(film_details: RetrieveService = Depends(get_film_details)) -> Film:
+async def films_pk(film_details: RetrieveService = Depends(get_film_details)) -> Response:
     return await film_details.get()
 
 
@@ -55,10 +75,11 @@ async def films_pk(film_details: RetrieveService = Depends(get_film_details)) ->
     response_model=PersonList,
     response_model_by_alias=False,
     summary='Persons',
-    description='List of individuals',
+    description='List of individuals, or the individuals with the given IDs',
     response_description='Full name, primary role, and movies involving the person',
+    dependencies=[Depends(Deadline(CONFIG.deadlines.list))],
     tags=['persons'])
-async def persons(persons_list: ListService = Depends(get_person_list)) -> List[Person]:
+async def persons(persons_list: ListService = Depends(get_person_list)) -> Response:
     return await persons_list.get()
 
 
@@ -69,11 +90,25 @@ async def persons(persons_list: ListService = Depends(get_person_list)) -> List[
     summary='Search Persons',
     description='Full-text search by individual names',
     response_description='Full name, primary role, and movies involving the person',
+    dependencies=[Depends(Deadline(CONFIG.deadlines.search))],
     tags=['persons'])
-async def persons_search(persons_by_search: ListService = Depends(get_person_search)) -> List[Person]:
+async def persons_search(persons_by_search: ListService = Depends(get_person_search)) -> Response:
     return await persons_by_search.get()
 
 
+@router.get(
+    '/persons/suggest',
+    response_model=PersonModifiedList,
+    response_model_by_alias=False,
+    summary='Suggest Persons',
+    description='Autocompletion of individual names as they are typed',
+    response_description='Full name of the person',
+    dependencies=[Depends(Deadline(CONFIG.deadlines.suggest))],
+    tags=['persons'])
+async def persons_suggest(persons_by_prefix: ListService = Depends(get_person_suggest)) -> Response:
+    return await persons_by_prefix.get()
+
+
 @router.get(
     '/persons/{person_id}',
     response_model=Person,
@@ -81,8 +116,9 @@ async def persons_search(persons_by_search: ListService = Depends(get_person_sea
     summary='Person Page',
     description='Complete information about the individual',
     response_description='Full name, primary role, and movies involving the person',
+    dependencies=[Depends(Deadline(CONFIG.deadlines.detail))],
     tags=['persons'])
-async def persons_pk(person_details: RetrieveService = Depends(get_person_details)) -> Person:
+async def persons_pk(person_details: RetrieveService = Depends(get_person_details)) -> Response:
     return await person_details.get()
 
 
@@ -93,8 +129,9 @@ async def persons_pk(person_details: RetrieveService = Depends(get_person_detail
     summary='Movies by Person',
     description='Movies involving the individual, sorted by popularity',
     response_description='Movie titles and ratings for movies involving the person',
+    dependencies=[Depends(Deadline(CONFIG.deadlines.list))],
     tags=['persons'])
-async def persons_pk_film(films_by_person: ListService = Depends(get_person_films)) -> List[FilmModified]:
+async def persons_pk_film(films_by_person: ListService = Depends(get_person_films)) -> Response:
     return await films_by_person.get()
 
 
@@ -103,10 +140,11 @@ async def persons_pk_film(films_by_person: ListService = Depends(get_person_film
     response_model=GenreList,
     response_model_by_alias=False,
     summary='Genres',
-    description='List of genres',
+    description='List of genres, or the genres with the given IDs',
     response_description='Genre names and descriptions',
+    dependencies=[Depends(Deadline(CONFIG.deadlines.list))],
     tags=['genres'])
-async def genres(genres_list: ListService = Depends(get_genre_list)) -> List[Genre]:
+async def genres(genres_list: ListService = Depends(get_genre_list)) -> Response:
     return await genres_list.get()
 
 
@@ -117,6 +155,7 @@ async def genres(genres_list: ListService = Depends(get_genre_list)) -> List[Gen
     summary='Genre Page',
     description='Complete information about the genre',
     response_description='Genre name and description',
+    dependencies=[Depends(Deadline(CONFIG.deadlines.detail))],
     tags=['genres'])
-async def genres_pk(genre_details: RetrieveService = Depends(get_genre_details)) -> Genre:
+async def genres_pk(genre_details: RetrieveService = Depends(get_genre_details)) -> Response:
     return await genre_details.get()
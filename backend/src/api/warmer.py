@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import math
+from typing import List
+
+from aioredis import Redis
+from elasticsearch import AsyncElasticsearch
+
+from api.pages import read_access_log, refresh
+from api.v1.base import Database, Representation
+from core.config import CONFIG
+from db.backends import CacheBackend
+from db.elastic import ElasticStorage
+from db.redis import RedisStorage
+
+LOCK_KEY = 'warmer::lock'
+
+
+class CacheWarmer:
+    """Class for precomputing the cache of the hottest API pages with the same services that serve them."""
+
+    def __init__(self, elastic: AsyncElasticsearch, redis: CacheBackend):
+        """
+        When initializing the class, it accepts connections to Elasticsearch and Redis.
+
+        Args:
+            elastic: Connection to Elasticsearch for data storage
+            redis: Connection to Redis for data caching
+        """
+        self.database = Database(elastic=elastic, redis=redis)
+        self.dependencies = {
+            'database': self.database,
+            'representation': Representation(accept_encoding='', if_none_match=None, cache_control=''),
+        }
+        self.semaphore = asyncio.Semaphore(CONFIG.warmer.concurrency)
+
+    async def get_static_urls(self) -> List[str]:
+        """
+        Get the popular pages: top pages of films by rating, films of each genre and all pages of genres.
+
+        Returns:
+            List[str]: URL paths of the API pages
+        """
+        genres = await ElasticStorage(elastic=self.database.elastic).search_elastic_docs(
+            index='genres', queryset={'_source': ['id'], 'size': 1000},
+        )
+        urls = [
+            f'/films?sort=-imdb_rating&page[number]={page}&page[size]={CONFIG.warmer.size}'
+            for page in range(1, CONFIG.warmer.pages + 1)
+        ]
+        urls.extend(f'/films?filter[genre]={genre["id"]}' for genre in genres)
+        urls.extend(
+            f'/genres?page[number]={page}&page[size]={CONFIG.warmer.size}'
+            for page in range(1, math.ceil(len(genres) / CONFIG.warmer.size) + 1)
+        )
+        return urls + CONFIG.warmer.paths
+
+    async def get_urls(self) -> List[str]:
+        """
+        Get the pages to be warmed up from the static list and the recent access log.
+
+        Returns:
+            List[str]: Unique URL paths of the API pages
+        """
+        urls = await self.get_static_urls()
+        if CONFIG.warmer.logfile:
+            try:
+                urls.extend(await asyncio.get_running_loop().run_in_executor(
+                    None, read_access_log, CONFIG.warmer.logfile, CONFIG.warmer.top,
+                ))
+            except OSError as exc:
+                logging.error(f'Failed to read the access log: {exc}!')
+        return list(dict.fromkeys(urls))
+
+    async def warm_url(self, url: str):
+        """
+        Precompute the cache of the API page without exceeding the allowed concurrency.
+
+        Args:
+            url: URL path of the API page
+        """
+        async with self.semaphore:
+            try:
+                await refresh(url, self.dependencies)
+            except Exception as exc:
+                logging.error(f'Failed to warm up {url}: {exc}!')
+
+    async def warm(self):
+        """Precompute the cache of all pages, logging a failure instead of raising it.
+
+        The warmup must neither keep the worker from becoming ready nor stop the periodic warming.
+        """
+        try:
+            await self.warm_pages()
+        except Exception as exc:
+            logging.error(f'Cache warmup failed: {exc}!')
+
+    async def warm_pages(self):
+        """Precompute the cache of all pages, unless another worker is already doing it."""
+        locked = await RedisStorage(redis=self.database.redis).set_redis_value(
+            LOCK_KEY, '1', expire=max(CONFIG.warmer.interval - 1, 1), exist=Redis.SET_IF_NOT_EXIST,
+        )
+        if not locked:
+            return
+        urls = await self.get_urls()
+        await asyncio.gather(*[self.warm_url(url) for url in urls])
+        logging.info(f'Cache warmed up for {len(urls)} pages.')
+
+    async def run(self):
+        """Warm up the cache periodically, before the previously cached pages expire."""
+        while True:
+            await asyncio.sleep(CONFIG.warmer.interval)
+            await self.warm()
@@ -0,0 +1,104 @@
+import asyncio
+import multiprocessing
+import random
+import time
+import uuid
+from typing import Optional
+
+from aiohttp import web
+from elasticsearch import AsyncElasticsearch
+
+from benchmarks.load import free_port
+from core.hedging import Hedger
+from db import elastic, reads
+from db.pooling import HedgingTransport
+
+READS = 2000
+CONCURRENCY = 20
+STALL_CHANCE = 0.02
+STALL = 0.2
+
+
+async def get_doc(request: web.Request) -> web.Response:
+    """
+    Answer a document read as Elasticsearch does, stalling now and then like a node in a GC pause.
+
+    Args:
+        request: Read of a document
+
+    Returns:
+        web.Response: The document
+    """
+    await asyncio.sleep(STALL if random.random() < STALL_CHANCE else 0.002)
+    doc_id = request.match_info['doc_id']
+    return web.json_response({'_index': 'movies', '_id': doc_id, 'found': True, '_source': {'id': doc_id}})
+
+
+def run_node(port: int):
+    """
+    Run a stand-in Elasticsearch node in its own process, so that it does not share the event loop of the client.
+
+    Args:
+        port: Local port of the node
+    """
+    app = web.Application()
+    app.router.add_get('/{index}/_doc/{doc_id}', get_doc)
+    web.run_app(app, host='127.0.0.1', port=port, print=None)
+
+
+async def read(storage: elastic.ElasticStorage, semaphore: asyncio.Semaphore) -> float:
+    """
+    Read a document once a place among the concurrent reads is free.
+
+    Args:
+        storage: Elasticsearch storage
+        semaphore: Places of the concurrent reads
+
+    Returns:
+        float: Latency of the read in seconds
+    """
+    async with semaphore:
+        started = time.monotonic()
+        await storage.get_elastic_doc('movies', uuid.uuid4())
+        return time.monotonic() - started
+
+
+async def measure(storage: elastic.ElasticStorage, hedger: Optional[Hedger]) -> str:
+    """
+    Measure the latencies of document reads made with the given concurrency and hedging policy.
+
+    Args:
+        storage: Elasticsearch storage
+        hedger: Hedging policy, None to read without hedging
+
+    Returns:
+        str: Row of the report with the latency percentiles and the number of hedges
+    """
+    reads.hedger = hedger
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    latencies = sorted(await asyncio.gather(*[read(storage, semaphore) for _ in range(READS)]))
+    p50, p99 = (latencies[int(len(latencies) * share)] * 1000 for share in (0.5, 0.99))
+    hedges = hedger.counters['hedges'] if hedger else 0
+    return f'{p50:>10.1f}{p99:>10.1f}{latencies[-1] * 1000:>10.1f}{hedges:>10}'
+
+
+async def main():
+    """Print the latency percentiles of reads from two stand-in nodes without and with hedging."""
+    ports = [free_port() for _ in range(2)]
+    nodes = [multiprocessing.Process(target=run_node, args=(port,), daemon=True) for port in ports]
+    for node in nodes:
+        node.start()
+    await asyncio.sleep(1)
+    client = AsyncElasticsearch(hosts=[f'127.0.0.1:{port}' for port in ports], transport_class=HedgingTransport)
+    storage = elastic.ElasticStorage(elastic=client)
+    reads.limiter = None
+    print(f'{"policy":<12}{"p50, ms":>10}{"p99, ms":>10}{"max, ms":>10}{"hedges":>10}')
+    print(f'{"none":<12}{await measure(storage, None)}')
+    print(f'{"hedged":<12}{await measure(storage, Hedger(percentile=95, budget=0.05, window=1000))}')
+    await client.close()
+    for node in nodes:
+        node.terminate()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
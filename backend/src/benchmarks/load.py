@@ -0,0 +1,124 @@
+import asyncio
+import multiprocessing
+import os
+import socket
+from typing import List, Set
+
+import aiohttp
+
+CONCURRENCY = 50
+
+
+def free_port() -> int:
+    """
+    Find a free local port.
+
+    Returns:
+        int: Port number
+    """
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def is_ready(session: aiohttp.ClientSession, url: str) -> bool:
+    """
+    Check that the server answers.
+
+    Args:
+        session: HTTP session
+        url: Address of the endpoint
+
+    Returns:
+        bool: True if the endpoint answered successfully
+    """
+    try:
+        async with session.get(url) as response:
+            return response.status == 200
+    except aiohttp.ClientError:
+        return False
+
+
+async def wait_ready(url: str):
+    """
+    Wait until the server answers.
+
+    Args:
+        url: Address of the endpoint
+    """
+    async with aiohttp.ClientSession() as session:
+        while not await is_ready(session, url):
+            await asyncio.sleep(0.2)
+
+
+async def user(session: aiohttp.ClientSession, url: str, deadline: float) -> int:
+    """
+    Send requests one after another over a connection until the deadline.
+
+    Args:
+        session: HTTP session
+        url: Address of the endpoint
+        deadline: Time of the event loop at which the load stops
+
+    Returns:
+        int: Number of successful responses
+    """
+    answered = 0
+    while asyncio.get_running_loop().time() < deadline:
+        async with session.get(url) as response:
+            await response.read()
+            answered += response.status == 200
+    return answered
+
+
+async def load(url: str, seconds: float) -> int:
+    """
+    Send requests over a fixed number of connections for the given time.
+
+    Args:
+        url: Address of the endpoint
+        seconds: Duration of the load
+
+    Returns:
+        int: Number of successful responses
+    """
+    deadline = asyncio.get_running_loop().time() + seconds
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=CONCURRENCY)) as session:
+        answered = await asyncio.gather(*[user(session, url, deadline) for _ in range(CONCURRENCY)])
+    return sum(answered)
+
+
+def run_client(url: str, seconds: float, cpus: Set[int], answers: multiprocessing.Queue):
+    """
+    Run a load generator in its own process, pinned to the CPUs not used by the server.
+
+    Args:
+        url: Address of the endpoint
+        seconds: Duration of the load
+        cpus: CPUs of the load generator
+        answers: Queue receiving the number of responses
+    """
+    os.sched_setaffinity(0, cpus)
+    answers.put(asyncio.run(load(url, seconds)))
+
+
+def run_clients(url: str, seconds: float, cpus: List[int]) -> int:
+    """
+    Load the server from several processes, one per CPU.
+
+    Args:
+        url: Address of the endpoint
+        seconds: Duration of the load
+        cpus: CPUs of the load generators
+
+    Returns:
+        int: Number of successful responses of all load generators
+    """
+    answers: multiprocessing.Queue = multiprocessing.Queue()
+    clients = [multiprocessing.Process(target=run_client, args=(url, seconds, {cpu}, answers)) for cpu in cpus]
+    for client in clients:
+        client.start()
+    answered = sum(answers.get() for _ in clients)
+    for client in clients:
+        client.join()
+    return answered
@@ -0,0 +1,127 @@
+import timeit
+import uuid
+from typing import Callable, Dict, Tuple
+
+from models.base import construct
+from models.film import Film, FilmList
+from models.person import Person
+
+COUNT = 1000
+REPEAT = 5
+
+# Functions building the models with full validation and from trusted data, and the number of models they build.
+Case = Tuple[Callable[[], object], Callable[[], object], int]
+
+
+def make_id() -> str:
+    """
+    Make a document ID.
+
+    Returns:
+        str: Random UUID
+    """
+    return str(uuid.uuid4())
+
+
+def make_film() -> Dict:
+    """
+    Make the data of a movie as it comes from Elasticsearch after enrichment.
+
+    Returns:
+        Dict: Movie data
+    """
+    return {
+        'id': make_id(),
+        'uuid': make_id(),
+        'title': 'The Movie',
+        'imdb_rating': 7.5,
+        'description': 'A movie about a benchmark. ' * 10,
+        'genre': [{'id': make_id(), 'name': 'Drama', 'description': 'Drama'} for _ in range(3)],
+        'actors': [{'id': make_id(), 'name': 'Actor'} for _ in range(10)],
+        'writers': [{'id': make_id(), 'name': 'Writer'} for _ in range(3)],
+        'directors': [{'id': make_id(), 'full_name': 'Director'}],
+    }
+
+
+def make_person() -> Dict:
+    """
+    Make the data of a persona with a long filmography as it comes from Elasticsearch after enrichment.
+
+    Returns:
+        Dict: Persona data
+    """
+    return {
+        'id': make_id(),
+        'uuid': make_id(),
+        'full_name': 'Person',
+        'role': 'actor',
+        'film_ids': [make_id() for _ in range(1000)],
+    }
+
+
+def measure(build: Callable[[], object], count: int) -> float:
+    """
+    Measure the construction speed.
+
+    Args:
+        build: Function that constructs the models
+        count: Number of models constructed by a call
+
+    Returns:
+        float: Models per second for the best of the repeats
+    """
+    return count / min(timeit.repeat(build, number=1, repeat=REPEAT))
+
+
+def make_cases() -> Dict[str, Case]:
+    """
+    Make the data of the movies and personas and the ways to build their models.
+
+    Returns:
+        Dict[str, Case]: Ways to build the models by the name of the model
+    """
+    films = [make_film() for _ in range(COUNT)]
+    persons = [make_person() for _ in range(COUNT // 10)]
+    return {
+        'Film': (
+            lambda: [Film(**film) for film in films],
+            lambda: [construct(Film, film) for film in films],
+            len(films),
+        ),
+        'Person': (
+            lambda: [Person(**person) for person in persons],
+            lambda: [construct(Person, person) for person in persons],
+            len(persons),
+        ),
+        'FilmList': (
+            lambda: FilmList.parse_obj(films),
+            lambda: construct(FilmList, {'__root__': films}),
+            len(films),
+        ),
+    }
+
+
+def compare(case: Case) -> Tuple[float, float]:
+    """
+    Measure the construction speed with full validation and from trusted data.
+
+    Args:
+        case: Ways to build the models and their number
+
+    Returns:
+        Tuple[float, float]: Models per second with validation and from trusted data
+    """
+    validated, trusted, count = case
+    return measure(validated, count), measure(trusted, count)
+
+
+def main():
+    """Print the number of models per second built with full validation and from trusted data."""
+    print(f'{"model":<10}{"validated/s":>15}{"trusted/s":>15}{"speedup":>10}')
+    for name, case in make_cases().items():
+        slow, fast = compare(case)
+        print(f'{name:<10}{slow:>15,.0f}{fast:>15,.0f}{fast / slow:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+import asyncio
+import os
+import subprocess
+import sys
+from contextlib import ExitStack
+from typing import List, Set, Tuple
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+from benchmarks.load import free_port, run_clients, wait_ready
+from benchmarks.models import make_film
+from models.film import FilmList
+
+DURATION = 10
+PAGE = 50
+
+app = FastAPI(default_response_class=ORJSONResponse)
+films = [make_film() for _ in range(PAGE)]
+
+
+@app.get('/films')
+async def get_films() -> FilmList:
+    """
+    Answer a page of movies validated and serialized as the API does, which keeps the worker busy on its CPU.
+
+    Returns:
+        FilmList: Page of movies
+    """
+    return FilmList.parse_obj(films)
+
+
+def serve(workers: int, port: int, cpus: Set[int]) -> subprocess.Popen:
+    """
+    Start Gunicorn with the production settings, pinned to the CPUs of the server.
+
+    Args:
+        workers: Number of workers
+        port: Local port of the server
+        cpus: CPUs of the server
+
+    Returns:
+        subprocess.Popen: Master process of the server
+    """
+    command = [
+        sys.executable, '-m', 'gunicorn', 'benchmarks.serving:app', '--config', 'gunicorn_conf.py',
+        '--bind', f'127.0.0.1:{port}', '--workers', str(workers), '--log-level', 'warning',
+    ]
+    return subprocess.Popen(command, preexec_fn=lambda: os.sched_setaffinity(0, cpus))
+
+
+def measure(workers: int, server_cpus: Set[int], client_cpus: List[int]) -> float:
+    """
+    Measure the throughput of the server with the given number of workers.
+
+    Args:
+        workers: Number of workers
+        server_cpus: CPUs of the server
+        client_cpus: CPUs of the load generators, one process per CPU
+
+    Returns:
+        float: Requests per second
+    """
+    port = free_port()
+    url = f'http://127.0.0.1:{port}/films'
+    with ExitStack() as cleanup:
+        server = cleanup.enter_context(serve(workers, port, server_cpus))
+        cleanup.callback(server.terminate)
+        asyncio.run(wait_ready(url))
+        answered = run_clients(url, DURATION, client_cpus)
+    return answered / DURATION
+
+
+def split_cpus() -> Tuple[Set[int], List[int]]:
+    """
+    Split the CPUs between the server and the load generators.
+
+    Half of the CPUs run the server and the other half generate the load, so that the two do not compete. On a single
+    CPU they share it, and the numbers show only the overhead of the workers.
+
+    Returns:
+        Tuple[Set[int], List[int]]: CPUs of the server and of the load generators
+    """
+    cpus = sorted(os.sched_getaffinity(0))
+    server_cpus = set(cpus[:max(len(cpus) // 2, 1)])
+    return server_cpus, cpus[len(server_cpus):] or cpus
+
+
+def worker_counts(cpus: int) -> List[int]:
+    """
+    Get the numbers of workers to measure: the powers of two up to the number of CPUs.
+
+    Args:
+        cpus: Number of CPUs of the server
+
+    Returns:
+        List[int]: Numbers of workers
+    """
+    return [2 ** power for power in range(cpus.bit_length())]
+
+
+def main():
+    """Print the throughput of the server for a growing number of workers, and how close it is to linear scaling."""
+    cpus = split_cpus()
+    throughputs = {workers: measure(workers, *cpus) for workers in worker_counts(len(cpus[0]))}
+    print(f'{"workers":<10}{"requests/s":>12}{"speedup":>10}{"efficiency":>12}')
+    for workers, throughput in throughputs.items():
+        speedup = throughput / throughputs[1]
+        print(f'{workers:<10}{throughput:>12,.0f}{speedup:>9.2f}x{speedup / workers:>11.0%}')
+
+
+if __name__ == '__main__':
+    main()
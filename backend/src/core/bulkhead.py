@@ -0,0 +1,98 @@
+import asyncio
+from collections import Counter
+from typing import Dict, Optional
+
+from core.config import CONFIG
+
+
+class BulkheadFull(Exception):
+    """Exception raised when both the concurrency and the queue of a bulkhead are exhausted."""
+
+    def __init__(self, name: str):
+        """
+        When initializing the exception, it accepts the name of the bulkhead.
+
+        Args:
+            name: Name of the bulkhead
+        """
+        super().__init__(f'Bulkhead {name} is full')
+        self.name = name
+
+
+class Bulkhead:
+    """Class for isolating a workload in its own pool of concurrent requests, so that it cannot starve the others."""
+
+    def __init__(self, name: str, concurrency: int, queue: int):
+        """
+        When initializing the class, it accepts the size of the pool and of the queue in front of it.
+
+        Args:
+            name: Name of the workload
+            concurrency: Number of requests of the workload processed at the same time
+            queue: Number of requests of the workload waiting for the pool, the others are rejected
+        """
+        self.name = name
+        self.concurrency = concurrency
+        self.queue = queue
+        self.counters: Counter = Counter(active=0, waiting=0, rejected=0, completed=0)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """
+        Get the pool, creating it on first use inside the running event loop.
+
+        Before Python 3.10 a semaphore binds to the event loop current at its creation, which at import time is not
+        the loop of the worker.
+
+        Returns:
+            asyncio.Semaphore: The pool of the workload
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    async def __aenter__(self):
+        """
+        Take a place in the pool, waiting in the queue if the pool is busy.
+
+        Raises:
+            BulkheadFull: If the queue is full too.
+        """
+        if self.semaphore.locked() and self.counters['waiting'] >= self.queue:
+            self.counters['rejected'] += 1
+            raise BulkheadFull(self.name)
+        self.counters['waiting'] += 1
+        try:
+            await self.semaphore.acquire()
+        except asyncio.CancelledError:
+            self.counters['waiting'] -= 1
+            raise
+        self.counters['waiting'] -= 1
+        self.counters['active'] += 1
+
+    async def __aexit__(self, *args):
+        """
+        Free the place in the pool.
+
+        Args:
+            args: Exception details, if any
+        """
+        self.counters['active'] -= 1
+        self.counters['completed'] += 1
+        self.semaphore.release()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the current state of the bulkhead for monitoring.
+
+        Returns:
+            Dict[str, int]: Requests in progress, waiting, rejected and completed
+        """
+        return dict(self.counters)
+
+
+BULKHEADS: Dict[str, Bulkhead] = {
+    name: Bulkhead(name, concurrency=config.concurrency, queue=config.queue)
+    for name, config in CONFIG.bulkheads
+}
@@ -0,0 +1,98 @@
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack
+from contextvars import ContextVar
+from typing import Awaitable, DefaultDict, Dict, Optional, TypeVar
+
+Outcome = TypeVar('Outcome')
+
+
+class CallStats:
+    """Class for counting the calls to the databases and the time spent on them."""
+
+    def __init__(self):
+        """When initializing the class, it starts with no calls."""
+        self.counts: Counter = Counter()
+        self.seconds: DefaultDict[str, float] = defaultdict(float)
+
+    def record(self, backend: str, elapsed: float):
+        """
+        Record a call to the database.
+
+        Args:
+            backend: Name of the database
+            elapsed: Duration of the call in seconds
+        """
+        self.counts[backend] += 1
+        self.seconds[backend] += elapsed
+
+    def merge(self, other: 'CallStats'):
+        """
+        Add the calls counted by other stats.
+
+        Args:
+            other: Stats of the calls to add
+        """
+        self.counts.update(other.counts)
+        for backend, seconds in other.seconds.items():
+            self.seconds[backend] += seconds
+
+    def headers(self) -> Dict[str, str]:
+        """
+        Get the debug headers of the response with the calls made for the request.
+
+        Returns:
+            Dict[str, str]: Number of calls and their total time in milliseconds by database
+        """
+        headers = {}
+        for backend in ('elastic', 'redis'):
+            headers[f'X-{backend.title()}-Calls'] = str(self.counts[backend])
+            headers[f'X-{backend.title()}-Time'] = '{ms:.1f}'.format(ms=self.seconds[backend] * 1000)
+        return headers
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the calls for monitoring.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Number of calls and their total time in milliseconds by database
+        """
+        return {
+            backend: {'calls': count, 'ms': round(self.seconds[backend] * 1000, 1)}
+            for backend, count in self.counts.items()
+        }
+
+
+current_calls: ContextVar[Optional[CallStats]] = ContextVar('calls', default=None)
+TOTALS = CallStats()
+REQUESTS: Counter = Counter()
+
+
+def record(backend: str, started: float):
+    """
+    Record a finished call to the database for the current request.
+
+    Args:
+        backend: Name of the database
+        started: Start time of the call
+    """
+    calls = current_calls.get()
+    if calls is not None:
+        calls.record(backend, time.monotonic() - started)
+
+
+async def counted(backend: str, awaitable: Awaitable[Outcome]) -> Outcome:
+    """
+    Make a call to the database, recording it for the current request whether it succeeds or fails.
+
+    Args:
+        backend: Name of the database
+        awaitable: The call
+
+    Returns:
+        Outcome: The result of the call
+    """
+    with ExitStack() as timing:
+        timing.callback(record, backend, time.monotonic())
+        outcome = await awaitable
+    return outcome
@@ -0,0 +1,112 @@
+import asyncio
+import gzip
+from typing import Callable, Dict, Optional
+
+import brotli
+import zstandard
+
+from core.config import CONFIG
+
+IDENTITY = 'identity'
+
+CODECS: Dict[str, Callable[[bytes], bytes]] = {
+    'br': lambda body: brotli.compress(body, quality=CONFIG.compression.brotli),
+    'zstd': lambda body: zstandard.ZstdCompressor(level=CONFIG.compression.zstd).compress(body),
+    'gzip': lambda body: gzip.compress(body, compresslevel=CONFIG.compression.gzip),
+}
+
+
+def compress(body: bytes) -> Dict[str, bytes]:
+    """
+    Compress the response body with every supported content encoding.
+
+    Args:
+        body: Response body
+
+    Returns:
+        Dict[str, bytes]: Compressed copies of the body by content encoding
+    """
+    return {encoding: codec(body) for encoding, codec in CODECS.items()}
+
+
+async def precompress(body: bytes) -> Dict[str, bytes]:
+    """
+    Compress the response body with every supported content encoding in the executor of the loop.
+
+    Compressing a large body takes milliseconds of CPU, which would otherwise stall all requests of the worker.
+
+    Args:
+        body: Response body
+
+    Returns:
+        Dict[str, bytes]: Compressed copies of the body by content encoding
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, compress, body)
+
+
+def encode(body: bytes, encoding: str) -> bytes:
+    """
+    Compress the response body with a single content encoding.
+
+    Args:
+        body: Response body
+        encoding: Content encoding accepted by the client
+
+    Returns:
+        bytes: The compressed body, or the body itself for the identity encoding
+    """
+    return body if encoding == IDENTITY else CODECS[encoding](body)
+
+
+def parse_quality(params: str) -> Optional[float]:
+    """
+    Get the weight of a content encoding from its parameters in the Accept-Encoding header.
+
+    Args:
+        params: Parameters of the encoding, such as q=0.5
+
+    Returns:
+        Optional[float]: The weight, 1 if it is not given, or None if it is invalid
+    """
+    _, _, quality = params.strip().partition('q=')
+    try:
+        return float(quality) if quality else 1.0
+    except ValueError:
+        return None
+
+
+def parse_weights(accept_encoding: str) -> Dict[str, float]:
+    """
+    Get the weights of the content encodings listed in the Accept-Encoding header, skipping the invalid ones.
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding header
+
+    Returns:
+        Dict[str, float]: Weights by content encoding
+    """
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(','):
+        encoding, _, params = item.strip().partition(';')
+        quality = parse_quality(params)
+        if quality is not None:
+            weights[encoding.strip()] = quality
+    return weights
+
+
+def negotiate(accept_encoding: str) -> str:
+    """
+    Choose the content encoding for the response from the Accept-Encoding header of the request.
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding header
+
+    Returns:
+        str: The accepted encoding with the highest client weight, preferring the server order on ties
+    """
+    weights = parse_weights(accept_encoding)
+    weight, _, encoding = max(
+        (weights.get(codec, weights.get('*', 0)), -order, codec)
+        for order, codec in enumerate(CODECS)
+    )
+    return encoding if weight > 0 else IDENTITY
@@ -1,14 +1,14 @@
 from functools import lru_cache
-from typing import ClassVar, Union
+from typing import ClassVar, List, Literal, Optional, Union
 
-from pydantic import BaseSettings, Field
+from pydantic import BaseSettings, Field, validator
 
 from models.film import Film, FilmList, FilmModified
 from models.genre import Genre, GenreList
-from models.person import Person, PersonList
+from models.person import Person, PersonList, PersonModified, PersonModifiedList
 
-CinemaObject = Union[Film, FilmModified, Person, Genre]
-CinemaObjectList = Union[FilmList, PersonList, GenreList]
+CinemaObject = Union[Film, FilmModified, Person, PersonModified, Genre]
+CinemaObjectList = Union[FilmList, PersonList, PersonModifiedList, GenreList]
 
 
 class RedisConfig(BaseSettings):
@@ -16,6 +16,26 @@ class RedisConfig(BaseSettings):
 
     host: str = '127.0.0.1'
     port: int = 6379
+    backend: Literal['redis', 'memory'] = 'redis'
+    nodes: List[str] = Field(default_factory=list)
+    ejection: int = 30
+    threshold: int = 1024
+    level: int = 3
+
+    @validator('nodes', pre=True)
+    def split_nodes(cls, nodes: Union[str, List[str]]) -> List[str]:
+        """
+        Split the addresses of the Redis nodes given in an environment variable.
+
+        Args:
+            nodes: Addresses in the host:port format separated by commas, or their list
+
+        Returns:
+            List[str]: Addresses of the nodes
+        """
+        if isinstance(nodes, str):
+            return [node.strip() for node in nodes.split(',') if node.strip()]
+        return nodes
 
 
 class ElasticConfig(BaseSettings):
@@ -23,6 +43,27 @@ class ElasticConfig(BaseSettings):
 
     host: str = '127.0.0.1'
     port: int = 9200
+    hosts: List[str] = Field(default_factory=list)
+    sniff: bool = False
+    maxsize: int = 25
+    keepalive: float = 60
+    retry: bool = True
+    retries: int = 2
+
+    @validator('hosts', pre=True)
+    def split_hosts(cls, hosts: Union[str, List[str]]) -> List[str]:
+        """
+        Split the addresses of the Elasticsearch nodes given in an environment variable.
+
+        Args:
+            hosts: Addresses in the host:port format separated by commas, or their list
+
+        Returns:
+            List[str]: Addresses of the nodes
+        """
+        if isinstance(hosts, str):
+            return [host.strip() for host in hosts.split(',') if host.strip()]
+        return hosts
 
 
 class LogstashConfig(BaseSettings):
@@ -41,7 +82,136 @@ class FastApiConfig(BaseSettings):
     docs: str = 'openapi'
     secret_key: str = 'secret_key'
     project_name: str = 'Read-only API for an online cinema'
+    warmup: bool = True
+    readiness_retry_in_seconds: ClassVar[int] = 1
     cache_expire_in_seconds: ClassVar[int] = 60
+    microcache_expire_in_seconds: ClassVar[int] = 5
+    suggest_size: ClassVar[int] = 10
+
+
+class CompressionConfig(BaseSettings):
+    """Class with compression levels of the cached response bodies."""
+
+    gzip: int = 6
+    brotli: int = 5
+    zstd: int = 3
+
+
+class WarmerConfig(BaseSettings):
+    """Class with settings for warming up the cache of the hottest API pages."""
+
+    enabled: bool = False
+    concurrency: int = 4
+    pages: int = 3
+    size: int = 50
+    interval: int = 45
+    paths: List[str] = Field(default_factory=list)
+    logfile: Optional[str] = None
+    top: int = 20
+
+
+class HitsConfig(BaseSettings):
+    """Class with settings for caching the hits of Elasticsearch queries in the memory of the worker."""
+
+    enabled: bool = False
+    expire: int = 30
+    size: int = 10000
+
+
+class LimiterConfig(BaseSettings):
+    """Class with settings for the adaptive concurrency limit of the requests to Elasticsearch."""
+
+    enabled: bool = False
+    initial: int = 20
+    minimum: int = 4
+    maximum: int = 200
+    latency: float = 0.5
+    decrease: float = 0.9
+    retry: int = 1
+
+
+class BulkheadConfig(BaseSettings):
+    """Class with the size of the pool of concurrent requests of a workload and of the queue in front of it."""
+
+    concurrency: int = 20
+    queue: int = 40
+
+
+class BulkheadsConfig(BaseSettings):
+    """Class with settings for isolating the workloads of the API from each other."""
+
+    detail: BulkheadConfig = Field(default_factory=BulkheadConfig)
+    list: BulkheadConfig = Field(default_factory=BulkheadConfig)
+    search: BulkheadConfig = Field(default_factory=BulkheadConfig)
+    enrichment: BulkheadConfig = Field(default_factory=BulkheadConfig)
+    related: BulkheadConfig = Field(default_factory=BulkheadConfig)
+    fills: BulkheadConfig = Field(default_factory=BulkheadConfig)
+
+
+class DeadlinesConfig(BaseSettings):
+    """Class with the latency budgets of the endpoint families in seconds."""
+
+    detail: float = 1
+    list: float = 2
+    search: float = 2
+    suggest: float = 0.5
+
+
+class HedgingConfig(BaseSettings):
+    """Class with settings for hedging the Elasticsearch reads that are slower than usual."""
+
+    enabled: bool = False
+    percentile: float = 95
+    budget: float = 0.05
+    window: int = 1000
+
+
+class ProfilingConfig(BaseSettings):
+    """Class with settings for profiling the Elasticsearch queries and logging the slow ones."""
+
+    sample: float = 0
+    slow: float = 0.5
+
+
+class CallsConfig(BaseSettings):
+    """Class with settings for counting the database calls of every request."""
+
+    headers: bool = False
+    budget: int = 10
+
+
+class MonitorConfig(BaseSettings):
+    """Class with settings for monitoring the lag of the event loop."""
+
+    enabled: bool = True
+    interval: float = 0.1
+    threshold: float = 0.1
+
+
+class DebuggerConfig(BaseSettings):
+    """Class with settings for the endpoints that profile the CPU and the memory of a live worker."""
+
+    enabled: bool = False
+    interval: float = 0.005
+    seconds: int = 60
+    frames: int = 10
+    snapshots: int = 5
+
+
+class ServingConfig(BaseSettings):
+    """Class with settings of the Gunicorn server and its Uvicorn workers."""
+
+    workers: int = 0
+    connections: int = 1000
+    backlog: int = 2048
+    preload: bool = False
+    loop: Literal['auto', 'uvloop', 'asyncio'] = 'auto'
+    http: Literal['auto', 'httptools', 'h11'] = 'auto'
+    requests: int = 10000
+    jitter: int = 1000
+    timeout: int = 30
+    drain: int = 30
+    keepalive: int = 5
 
 
 class MainSettings(BaseSettings):
@@ -51,6 +221,18 @@ class MainSettings(BaseSettings):
     elastic: ElasticConfig = Field(default_factory=ElasticConfig)
     redis: RedisConfig = Field(default_factory=RedisConfig)
     logstash: LogstashConfig = Field(default_factory=LogstashConfig)
+    warmer: WarmerConfig = Field(default_factory=WarmerConfig)
+    compression: CompressionConfig = Field(default_factory=CompressionConfig)
+    hits: HitsConfig = Field(default_factory=HitsConfig)
+    limiter: LimiterConfig = Field(default_factory=LimiterConfig)
+    bulkheads: BulkheadsConfig = Field(default_factory=BulkheadsConfig)
+    deadlines: DeadlinesConfig = Field(default_factory=DeadlinesConfig)
+    hedging: HedgingConfig = Field(default_factory=HedgingConfig)
+    profiling: ProfilingConfig = Field(default_factory=ProfilingConfig)
+    calls: CallsConfig = Field(default_factory=CallsConfig)
+    monitor: MonitorConfig = Field(default_factory=MonitorConfig)
+    debugger: DebuggerConfig = Field(default_factory=DebuggerConfig)
+    serving: ServingConfig = Field(default_factory=ServingConfig)
 
 
 @lru_cache()
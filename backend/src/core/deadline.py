@@ -0,0 +1,66 @@
+import asyncio
+import time
+from contextvars import ContextVar
+from typing import Awaitable, Optional, TypeVar
+
+Outcome = TypeVar('Outcome')
+
+deadline: ContextVar[Optional[float]] = ContextVar('deadline', default=None)
+
+
+class DeadlineExceeded(Exception):
+    """Exception raised when the latency budget of the request runs out."""
+
+
+def start(budget: float):
+    """
+    Set the deadline of the current request.
+
+    Args:
+        budget: Latency budget of the request in seconds
+    """
+    deadline.set(time.monotonic() + budget)
+
+
+def remaining() -> Optional[float]:
+    """
+    Get the remaining latency budget of the current request.
+
+    Raises:
+        DeadlineExceeded: If the budget has run out.
+
+    Returns:
+        Optional[float]: Remaining budget in seconds, or None if the work is not bound to a request
+    """
+    expires = deadline.get()
+    if expires is None:
+        return None
+    left = expires - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceeded
+    return left
+
+
+async def bounded(awaitable: Awaitable[Outcome]) -> Outcome:
+    """
+    Wait for a downstream call no longer than the remaining latency budget, cancelling it when the budget runs out.
+
+    Args:
+        awaitable: The downstream call
+
+    Raises:
+        DeadlineExceeded: If the budget runs out before the call completes.
+
+    Returns:
+        Outcome: The result of the call
+    """
+    try:
+        left = remaining()
+    except DeadlineExceeded:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise
+    try:
+        return await asyncio.wait_for(awaitable, left)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded
@@ -0,0 +1,132 @@
+import asyncio
+import time
+from collections import Counter, deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set
+
+Nodes = List[Any]
+
+# Nodes already used by the reads of a hedged call, so that the transport sends the hedge to another node.
+used_nodes: ContextVar[Optional[Nodes]] = ContextVar('used_nodes', default=None)
+
+
+async def on_other_node(read: Callable[[], Awaitable[Any]], nodes: Nodes) -> Any:
+    """
+    Make a read of a hedged call, sharing with the other reads of the call the nodes they were sent to.
+
+    Args:
+        read: Function that starts the read
+        nodes: Nodes used by the reads of the call
+
+    Returns:
+        Any: The response of the read
+    """
+    used_nodes.set(nodes)
+    return await read()
+
+
+class Hedger:
+    """Class for hedging slow reads: a read that outlives the usual latency is repeated, and the first reply wins.
+
+    The delay before the hedge is a percentile of the recent latencies, and the hedges are limited to a share of the
+    reads, so that they cut the tail latency without overloading a cluster that is slow as a whole.
+    """
+
+    def __init__(self, percentile: float, budget: float, window: int, samples: int = 20):
+        """
+        When initializing the class, it accepts the hedging policy.
+
+        Args:
+            percentile: Percentile of the recent latencies after which a read is hedged
+            budget: Maximum share of the reads that may be hedged
+            window: Number of the recent reads the latencies and the budget are measured on
+            samples: Number of latencies required before the reads are hedged, and between updates of the delay
+        """
+        self.percentile = percentile
+        self.budget = budget
+        self.samples = samples
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.counters: Counter = Counter(reads=0, hedges=0, wins=0)
+        self.delay: Optional[float] = None
+
+    def record(self, latency: float):
+        """
+        Record the latency of a read, updating the hedging delay every few reads and decaying the budget counters once
+        the window is exceeded.
+
+        Args:
+            latency: Duration of the read in seconds
+        """
+        self.latencies.append(latency)
+        self.counters['reads'] += 1
+        if len(self.latencies) >= self.samples and self.counters['reads'] % self.samples == 0:
+            latencies = sorted(self.latencies)
+            self.delay = latencies[min(int(len(latencies) * self.percentile / 100), len(latencies) - 1)]
+        if self.counters['reads'] > (self.latencies.maxlen or 0):
+            self.counters['reads'] //= 2
+            self.counters['hedges'] //= 2
+
+    async def run(self, read: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Make a read, repeating it on another node if it is slower than usual and the budget allows.
+
+        Args:
+            read: Function that starts the read
+
+        Returns:
+            Any: The first successful reply, or the error of the last read to fail
+        """
+        nodes: Nodes = []
+        primary = asyncio.ensure_future(on_other_node(read, nodes))
+        reads: Set[asyncio.Future] = {primary}
+        with ExitStack() as cleanup:
+            cleanup.callback(self.finish, reads, time.monotonic())
+            winner = await self.race(read, nodes, reads)
+        self.counters['wins'] += winner is not primary
+        return winner.result()
+
+    async def race(self, read: Callable[[], Awaitable[Any]], nodes: Nodes, reads: Set[asyncio.Future]) -> Any:
+        """
+        Wait for the first successful read, adding the hedge once the delay has passed.
+
+        Args:
+            read: Function that starts the read
+            nodes: Nodes used by the reads of the call
+            reads: Reads in progress, which the finished ones are removed from
+
+        Returns:
+            Any: The first successful read, or the last read to fail
+        """
+        if self.delay is not None:
+            done, _ = await asyncio.wait(reads, timeout=self.delay)
+            if not done and self.counters['hedges'] < self.budget * self.counters['reads']:
+                self.counters['hedges'] += 1
+                reads.add(asyncio.ensure_future(on_other_node(read, nodes)))
+        while True:
+            done, _ = await asyncio.wait(reads, return_when=asyncio.FIRST_COMPLETED)
+            reads -= done
+            winner = next((future for future in done if future.exception() is None), None)
+            if winner or not reads:
+                return winner or done.pop()
+
+    def finish(self, reads: Set[asyncio.Future], started: float):
+        """
+        Cancel the reads that lost the race and record the latency of the call.
+
+        Args:
+            reads: Reads still in progress
+            started: Start time of the call
+        """
+        for future in reads:
+            future.cancel()
+        self.record(time.monotonic() - started)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the current state of the hedging for monitoring.
+
+        Returns:
+            Dict[str, Any]: Current delay, recent reads, hedged reads and the hedges that replied first
+        """
+        return {'delay': self.delay, **self.counters}
@@ -0,0 +1,64 @@
+from collections import Counter
+from typing import Dict
+
+
+class AdaptiveLimiter:
+    """Class for limiting the concurrency of requests to a database by their latency with the AIMD algorithm.
+
+    The limit grows by one request per limit of fast responses while it is in use, and shrinks by a factor after every
+    slow or failed response, so that the requests beyond the limit are rejected instead of queuing up.
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int, latency: float, decrease: float):
+        """
+        When initializing the class, it accepts the bounds of the limit and the target latency.
+
+        Args:
+            initial: Initial number of concurrent requests
+            minimum: Lower bound of the limit
+            maximum: Upper bound of the limit
+            latency: Target latency of a request in seconds
+            decrease: Factor by which the limit shrinks after a slow response
+        """
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency = latency
+        self.decrease = decrease
+        self.counters = Counter(inflight=0, rejected=0)
+
+    def acquire(self) -> bool:
+        """
+        Take a slot for a request if the limit allows it.
+
+        Returns:
+            bool: True if the request may proceed, False if it must be rejected
+        """
+        if self.counters['inflight'] >= int(self.limit):
+            self.counters['rejected'] += 1
+            return False
+        self.counters['inflight'] += 1
+        return True
+
+    def release(self, latency: float, failed: bool = False):
+        """
+        Free the slot of a finished request and adjust the limit by its latency.
+
+        Args:
+            latency: Duration of the request in seconds
+            failed: Whether the request timed out or lost the connection
+        """
+        self.counters['inflight'] -= 1
+        if failed or latency > self.latency:
+            self.limit = max(float(self.minimum), self.limit * self.decrease)
+        elif self.counters['inflight'] * 2 >= self.limit:
+            self.limit = min(float(self.maximum), self.limit + 1 / self.limit)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the current state of the limiter for monitoring.
+
+        Returns:
+            Dict[str, int]: Limit, requests in progress and the number of rejected requests
+        """
+        return {'limit': int(self.limit), **self.counters}
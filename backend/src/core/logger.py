@@ -1,10 +1,13 @@
 import logging
+from contextvars import ContextVar
 from logging import config as logging_config
 from secrets import token_hex
 from typing import Optional
 
 from core.config import CONFIG
 
+current_request_id: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
+
 
 class RequestIdFilter(logging.Filter):
     """A class for an additional log message filter to add request ID information to the log messages."""
@@ -77,6 +80,7 @@ LOGGING = {
         'app': {
             'handlers': ['logstash', 'console'],
             'level': 'INFO',
+            'propagate': False,
         },
         'uvicorn.error': {
             'level': 'INFO',
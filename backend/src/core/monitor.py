@@ -0,0 +1,124 @@
+import asyncio
+import bisect
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, List, Optional
+
+logger = logging.getLogger('app.monitor')
+
+BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class LagHistogram:
+    """Class for counting the lags of the event loop by their duration."""
+
+    def __init__(self):
+        """When initializing the class, it starts with no measurements."""
+        self.buckets: List[int] = [0 for _ in range(len(BUCKETS_MS) + 1)]
+        self.samples = 0
+        self.max_lag: float = 0
+        self.blocked = 0
+
+    def observe(self, lag: float):
+        """
+        Add a lag measurement to the histogram.
+
+        Args:
+            lag: Delay of the wake-up in seconds
+        """
+        self.buckets[bisect.bisect_left(BUCKETS_MS, lag * 1000)] += 1
+        self.samples += 1
+        self.max_lag = max(self.max_lag, lag)
+
+    def stats(self) -> Dict:
+        """
+        Get the lag of the loop for monitoring.
+
+        Returns:
+            Dict: Number of measurements, maximum lag, number of stalls and the lag histogram by upper bound in ms
+        """
+        bounds = [str(bound) for bound in BUCKETS_MS] + ['+Inf']
+        return {
+            'samples': self.samples,
+            'max_ms': round(self.max_lag * 1000, 1),
+            'blocked': self.blocked,
+            'histogram': dict(zip(bounds, self.buckets)),
+        }
+
+
+class LoopMonitor:
+    """Class for measuring the lag of the event loop and catching the code that blocks it.
+
+    A task on the loop wakes up at a fixed interval, and the delay of the wake-up is the lag. A watchdog thread checks
+    the last wake-up, and when the loop has been stuck for longer than the threshold, it logs the stack of the loop
+    thread, which points at the blocking code while it still runs.
+    """
+
+    def __init__(self, interval: float, threshold: float):
+        """
+        When initializing the class, it accepts the measurement interval and the lag considered blocking.
+
+        Args:
+            interval: Interval between the measurements in seconds
+            threshold: Lag after which the loop is considered blocked in seconds
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self.histogram = LagHistogram()
+        self.heartbeat = time.monotonic()
+        self.task: Optional[asyncio.Task] = None
+        self.stopped = threading.Event()
+
+    def start(self):
+        """Start measuring the lag of the running loop and watching it from a separate thread."""
+        self.heartbeat = time.monotonic()
+        self.task = asyncio.create_task(self.measure())
+        threading.Thread(target=self.watch, args=(threading.get_ident(),), name='loop-watchdog', daemon=True).start()
+
+    def stop(self):
+        """Stop the measurements and the watchdog."""
+        self.stopped.set()
+        if self.task:
+            self.task.cancel()
+
+    async def measure(self):
+        """Measure the delay of every wake-up of the loop."""
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self.heartbeat = time.monotonic()
+            self.histogram.observe(max(self.heartbeat - started - self.interval, 0))
+
+    def watch(self, thread_id: int):
+        """
+        Log the stack of the loop thread once for every stall longer than the threshold.
+
+        Args:
+            thread_id: Identifier of the thread that runs the loop
+        """
+        reported = None
+        while not self.stopped.wait(self.interval):
+            heartbeat = self.heartbeat
+            stalled = time.monotonic() - heartbeat - self.interval
+            if stalled < self.threshold or reported == heartbeat:
+                continue
+            reported = heartbeat
+            self.histogram.blocked += 1
+            frame = sys._current_frames().get(thread_id)
+            stack = ''.join(traceback.format_stack(frame)) if frame else ''
+            logger.warning(f'Event loop is blocked for {stalled * 1000:.0f} ms at:\n{stack}')
+
+    def stats(self) -> Dict:
+        """
+        Get the lag of the loop for monitoring.
+
+        Returns:
+            Dict: Number of measurements, maximum lag, number of stalls and the lag histogram by upper bound in ms
+        """
+        return self.histogram.stats()
+
+
+monitor: Optional[LoopMonitor] = None
@@ -0,0 +1,165 @@
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import ExitStack
+from types import FrameType
+from typing import Dict, List, Optional, OrderedDict, Sequence, Union
+
+Statistics = Sequence[Union[tracemalloc.Statistic, tracemalloc.StatisticDiff]]
+
+
+def fold_stack(frame: Optional[FrameType]) -> str:
+    """
+    Fold the stack of a frame into a line of the collapsed stack format read by flamegraph tools.
+
+    Args:
+        frame: The innermost frame of the stack
+
+    Returns:
+        str: Functions from the outermost to the innermost separated by semicolons
+    """
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f'{code.co_name} ({code.co_filename}:{frame.f_lineno})')
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+def sample_stacks(thread_id: int, seconds: float, interval: float) -> Counter:
+    """
+    Sample the stack of a thread at a fixed interval, to be run in another thread.
+
+    Args:
+        thread_id: Identifier of the sampled thread
+        seconds: Duration of the profiling
+        interval: Interval between the samples in seconds
+
+    Returns:
+        Counter: Number of samples by the folded stack
+    """
+    stacks: Counter = Counter()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        if frame is not None:
+            stacks[fold_stack(frame)] += 1
+        time.sleep(interval)
+    return stacks
+
+
+class CpuProfiler:
+    """Class for profiling the CPU of the event loop by sampling its stack, one profile at a time.
+
+    Nothing runs between the profiles: the sampling thread exists only while a profile is being taken.
+    """
+
+    def __init__(self, interval: float):
+        """
+        When initializing the class, it accepts the sampling interval.
+
+        Args:
+            interval: Interval between the samples in seconds
+        """
+        self.interval = interval
+        self.lock = threading.Lock()
+
+    def profile(self, thread_id: int, seconds: float) -> Optional[str]:
+        """
+        Profile a thread for the given time.
+
+        Args:
+            thread_id: Identifier of the profiled thread
+            seconds: Duration of the profiling
+
+        Returns:
+            Optional[str]: Folded stacks with the number of samples, one per line, or None if a profile is already
+                being taken
+        """
+        if not self.lock.acquire(blocking=False):
+            return None
+        with ExitStack() as cleanup:
+            cleanup.callback(self.lock.release)
+            stacks = sample_stacks(thread_id, seconds, self.interval)
+        return ''.join(f'{stack} {count}\n' for stack, count in stacks.most_common())
+
+
+class MemoryTracer:
+    """Class for taking tracemalloc snapshots of the worker and comparing them.
+
+    Tracing slows down every allocation, so it is started by the first snapshot and stopped explicitly. Snapshots are
+    taken and compared outside the event loop, so the methods may run in several threads at once.
+    """
+
+    def __init__(self, frames: int, limit: int):
+        """
+        When initializing the class, it accepts the depth of the traces and how many snapshots to keep.
+
+        Args:
+            frames: Number of frames stored for every allocation
+            limit: Number of the latest snapshots kept in memory
+        """
+        self.frames = frames
+        self.limit = limit
+        self.snapshots: OrderedDict[int, tracemalloc.Snapshot] = OrderedDict()
+        self.counter = 0
+        self.lock = threading.Lock()
+
+    def snapshot(self) -> int:
+        """
+        Take a snapshot of the memory allocations, starting the tracing if it is not running.
+
+        Returns:
+            int: Identifier of the snapshot
+        """
+        with self.lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+            self.counter += 1
+            self.snapshots[self.counter] = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__),
+            ))
+            while len(self.snapshots) > self.limit:
+                self.snapshots.popitem(last=False)
+            return self.counter
+
+    def stop(self):
+        """Stop the tracing and forget the snapshots."""
+        with self.lock:
+            tracemalloc.stop()
+            self.snapshots.clear()
+
+    def top(self, snapshot_id: int, base_id: Optional[int] = None, top: int = 25) -> Optional[List[Dict]]:
+        """
+        Get the lines that allocate the most memory in a snapshot, or whose allocations grew the most since another.
+
+        Args:
+            snapshot_id: Identifier of the snapshot
+            base_id: Identifier of the earlier snapshot to compare with, if any
+            top: Number of lines to return
+
+        Returns:
+            Optional[List[Dict]]: Allocation size, its growth and the number of blocks by the source line, or None if
+                any of the snapshots is not kept
+        """
+        with self.lock:
+            snapshot = self.snapshots.get(snapshot_id)
+            base = None if base_id is None else self.snapshots.get(base_id)
+        if snapshot is None or (base_id is not None and base is None):
+            return None
+        if base is None:
+            stats: Statistics = snapshot.statistics('lineno')
+        else:
+            stats = snapshot.compare_to(base, 'lineno')
+        return [
+            {
+                'line': str(stat.traceback),
+                'size': stat.size,
+                'size_diff': getattr(stat, 'size_diff', None),
+                'count': stat.count,
+                'count_diff': getattr(stat, 'count_diff', None),
+            }
+            for stat in stats[:top]
+        ]
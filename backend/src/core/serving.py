@@ -0,0 +1,70 @@
+import math
+import os
+from pathlib import Path
+from typing import Optional
+
+from uvicorn.workers import UvicornWorker
+
+from core.config import CONFIG
+
+
+def cgroup_cpus() -> Optional[float]:
+    """
+    Read the CPU quota of the container from its cgroup, for v2 and then v1.
+
+    Returns:
+        Optional[float]: Number of CPUs allowed by the quota, or None if there is no quota
+    """
+    cpu_max = Path('/sys/fs/cgroup/cpu.max')
+    if cpu_max.exists():
+        limit, period = cpu_max.read_text().split()[:2]
+        return None if limit == 'max' else int(limit) / int(period)
+    cfs = Path('/sys/fs/cgroup/cpu')
+    if (cfs / 'cpu.cfs_quota_us').exists():
+        quota_us = int((cfs / 'cpu.cfs_quota_us').read_text())
+        return quota_us / int((cfs / 'cpu.cfs_period_us').read_text()) if quota_us > 0 else None
+    return None
+
+
+def available_cpus() -> int:
+    """
+    Count the CPUs the server may use: those it is pinned to, limited by the quota of the container.
+
+    Returns:
+        int: Number of CPUs, at least one
+    """
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+    try:
+        quota = cgroup_cpus()
+    except (OSError, ValueError):
+        quota = None
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(cpus, 1)
+
+
+def worker_count() -> int:
+    """
+    Get the number of workers: the configured one, or one per available CPU.
+
+    A worker runs a single event loop that keeps its CPU busy while the databases answer, so more workers than CPUs
+    only add context switches and connection pools.
+
+    Returns:
+        int: Number of workers
+    """
+    return CONFIG.serving.workers or available_cpus()
+
+
+class ServingWorker(UvicornWorker):
+    """Uvicorn worker with the configured event loop and HTTP parser, limiting its concurrent connections.
+
+    The automatic choice takes uvloop and httptools when they are installed and falls back to asyncio and h11.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """When initializing the class, it answers the connections over the limit of the worker with HTTP 503."""
+        super().__init__(*args, **kwargs)
+        self.config.loop = CONFIG.serving.loop
+        self.config.http = CONFIG.serving.http
+        self.config.limit_concurrency = self.cfg.worker_connections
@@ -0,0 +1,278 @@
+import abc
+import math
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+from aioredis import Redis
+from aioredis.commands import MultiExec
+
+# Sorted sets of the keys tagged with a surrogate key, scored by their expiration time. The prefix differs from the
+# plain sets of the earlier releases, which would otherwise fail the writes with WRONGTYPE until they expire.
+TAG_PREFIX = 'surrogates::'
+
+# Keys of the values by the surrogate key, by which they can be purged together.
+Tags = Dict[str, List[str]]
+
+
+def expiration(expire: int, now: float) -> float:
+    """
+    Get the time at which a value expires.
+
+    Args:
+        expire: Expiration time of the value in seconds, 0 for no expiration
+        now: Current time
+
+    Returns:
+        float: Time of the expiration, infinity for no expiration
+    """
+    return now + expire if expire else math.inf
+
+
+def prune_tag(tagged: Dict[str, float], now: float) -> Dict[str, float]:
+    """
+    Drop the expired keys from the keys tagged with a surrogate key.
+
+    Args:
+        tagged: Expiration times of the tagged keys by key
+        now: Current time
+
+    Returns:
+        Dict[str, float]: Expiration times of the live keys
+    """
+    return {key: expires_at for key, expires_at in tagged.items() if expires_at > now}
+
+
+def add_tag(transaction: MultiExec, tag_key: str, keys: List[str], expire: int):
+    """
+    Add the keys to the sorted set of the surrogate key in the transaction, dropping the keys that have expired.
+
+    The keys are scored by their expiration time, so that the set of a hot surrogate key, which never expires itself,
+    holds only the live keys instead of growing with every write.
+
+    Args:
+        transaction: Transaction writing the values
+        tag_key: Key of the sorted set of the surrogate key
+        keys: Keys of the tagged values
+        expire: Expiration time of the values, 0 for no expiration
+    """
+    now = time.time()
+    transaction.zadd(tag_key, *[member for key in keys for member in (expiration(expire, now), key)])
+    transaction.zremrangebyscore(tag_key, max=now)
+    if expire:
+        transaction.expire(tag_key, expire)
+
+
+class CacheBackend(abc.ABC):
+    """Abstract cache backend behind the Redis storage."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a value by key.
+
+        Args:
+            key: The key of the value
+
+        Returns:
+            Optional[bytes]: The value, None if it is missing
+        """
+        found = await self.mget([key])
+        return found[0]
+
+    @abc.abstractmethod
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Get several values in a single request, in the order of the keys."""
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: Union[str, bytes], expire: int = 0, exist: Optional[str] = None) -> bool:
+        """Set a value by key, optionally only if the key does not exist yet."""
+
+    @abc.abstractmethod
+    async def set_many(self, mapping: Dict[str, bytes], expire: int = 0, tags: Optional[Tags] = None):
+        """Set several values in a single transaction, tagging them with surrogate keys."""
+
+    @abc.abstractmethod
+    async def purge(self, tag: str) -> List[str]:
+        """Delete all values tagged with the surrogate key and return their keys."""
+
+    @abc.abstractmethod
+    async def ping(self) -> bool:
+        """Check that the backend responds to requests."""
+
+    @abc.abstractmethod
+    async def close(self):
+        """Close the connections of the backend."""
+
+
+class RedisBackend(CacheBackend):
+    """Cache backend on a single Redis node."""
+
+    def __init__(self, redis: Redis):
+        """
+        When initializing the class, it accepts a connection pool to the Redis node.
+
+        Args:
+            redis: Connection to Redis
+        """
+        self.redis = redis
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        """
+        Get several values with a single MGET command.
+
+        Args:
+            keys: The keys of the values
+
+        Returns:
+            List[Optional[bytes]]: The values in the order of the keys, None for missing keys
+        """
+        return await self.redis.mget(*keys) if keys else []
+
+    async def set(self, key: str, value: Union[str, bytes], expire: int = 0, exist: Optional[str] = None) -> bool:
+        """
+        Set a value by key.
+
+        Args:
+            key: The key of the value
+            value: The value to write
+            expire: Expiration time of the value
+            exist: Condition of the key existence, e.g. Redis.SET_IF_NOT_EXIST
+
+        Returns:
+            bool: True if the value was written
+        """
+        return await self.redis.set(key, value, expire=expire, exist=exist)
+
+    async def set_many(self, mapping: Dict[str, bytes], expire: int = 0, tags: Optional[Tags] = None):
+        """
+        Set several values in a single MULTI/EXEC transaction.
+
+        Args:
+            mapping: Values to write by key
+            expire: Expiration time of every value
+            tags: Keys of the values by the surrogate key, by which they can be purged together
+        """
+        transaction = self.redis.multi_exec()
+        for key, value in mapping.items():
+            transaction.set(key, value, expire=expire)
+        for tag, keys in (tags or {}).items():
+            add_tag(transaction, f'{TAG_PREFIX}{tag}', keys, expire)
+        await transaction.execute()
+
+    async def purge(self, tag: str) -> List[str]:
+        """
+        Delete all values tagged with the surrogate key.
+
+        Args:
+            tag: Surrogate key
+
+        Returns:
+            List[str]: Keys of the deleted values that had not expired
+        """
+        keys = await self.redis.zrangebyscore(f'{TAG_PREFIX}{tag}', min=time.time(), encoding='utf-8')
+        await self.redis.delete(f'{TAG_PREFIX}{tag}', *keys)
+        return keys
+
+    async def ping(self) -> bool:
+        """
+        Check that the Redis node responds to requests.
+
+        Returns:
+            bool: True if the node answered
+        """
+        return bool(await self.redis.ping())
+
+    async def close(self):
+        """Close the connection pool to the Redis node."""
+        self.redis.close()
+        await self.redis.wait_closed()
+
+
+class MemoryBackend(CacheBackend):
+    """Cache backend in the memory of the process, for tests and local development."""
+
+    def __init__(self):
+        """When initializing the class, it creates empty storages of values and surrogate keys."""
+        self.storage: Dict[str, Tuple[bytes, float]] = {}
+        self.tags: Dict[str, Dict[str, float]] = {}
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        """
+        Get several values, removing the expired ones.
+
+        Args:
+            keys: The keys of the values
+
+        Returns:
+            List[Optional[bytes]]: The values in the order of the keys, None for missing or expired keys
+        """
+        now = time.monotonic()
+        expired = {key for key in keys if self.storage.get(key, (b'', math.inf))[1] <= now}
+        for stale in expired:
+            self.storage.pop(stale)
+        return [self.storage[key][0] if key in self.storage else None for key in keys]
+
+    async def set(self, key: str, value: Union[str, bytes], expire: int = 0, exist: Optional[str] = None) -> bool:
+        """
+        Set a value by key.
+
+        Args:
+            key: The key of the value
+            value: The value to write
+            expire: Expiration time of the value
+            exist: Condition of the key existence, e.g. Redis.SET_IF_NOT_EXIST
+
+        Returns:
+            bool: True if the value was written
+        """
+        found = await self.get(key) if exist else None
+        if exist == Redis.SET_IF_NOT_EXIST and found is not None:
+            return False
+        if exist == Redis.SET_IF_EXIST and found is None:
+            return False
+        await self.set_many({key: value.encode() if isinstance(value, str) else value}, expire=expire)
+        return True
+
+    async def set_many(self, mapping: Dict[str, bytes], expire: int = 0, tags: Optional[Tags] = None):
+        """
+        Set several values.
+
+        Args:
+            mapping: Values to write by key
+            expire: Expiration time of every value, 0 for no expiration
+            tags: Keys of the values by the surrogate key, by which they can be purged together
+        """
+        now = time.monotonic()
+        self.storage.update({key: (value, expiration(expire, now)) for key, value in mapping.items()})
+        for tag, keys in (tags or {}).items():
+            self.tags[tag] = prune_tag({**self.tags.get(tag, {}), **dict.fromkeys(keys, expiration(expire, now))}, now)
+
+    async def purge(self, tag: str) -> List[str]:
+        """
+        Delete all values tagged with the surrogate key.
+
+        Args:
+            tag: Surrogate key
+
+        Returns:
+            List[str]: Keys of the deleted values that had not expired
+        """
+        tagged = list(self.tags.pop(tag, {}))
+        found = await self.mget(tagged)
+        keys = [key for key, value in zip(tagged, found) if value is not None]
+        for key in keys:
+            self.storage.pop(key)
+        return keys
+
+    async def ping(self) -> bool:
+        """
+        Check that the backend responds to requests.
+
+        Returns:
+            bool: Always True
+        """
+        return True
+
+    async def close(self):
+        """Drop all values."""
+        self.storage.clear()
+        self.tags.clear()
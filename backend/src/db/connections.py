@@ -1,136 +1,103 @@
+import asyncio
 import logging
+from typing import Tuple
 
 import aioredis
-from elasticsearch import AsyncElasticsearch, RequestError
+from aioredis.errors import RedisError
+from elasticsearch import AsyncElasticsearch, TransportError
 
 from core.config import CONFIG
 from db import elastic, redis
-
-SETTINGS = {
-    'refresh_interval': '1s',
-    'analysis': {
-        'filter': {
-            'english_stop': {'type': 'stop', 'stopwords': '_english_'},
-            'english_stemmer': {'type': 'stemmer', 'language': 'english'},
-            'english_possessive_stemmer': {'type': 'stemmer', 'language': 'possessive_english'},
-            'russian_stop': {'type': 'stop', 'stopwords': '_russian_'},
-            'russian_stemmer': {'type': 'stemmer', 'language': 'russian'},
-        },
-        'analyzer': {
-            'ru_en': {'tokenizer': 'standard', 'filter': [
-                'lowercase',
-                'english_stop',
-                'english_stemmer',
-                'english_possessive_stemmer',
-                'russian_stop',
-                'russian_stemmer',
-            ]},
-        },
-    },
-}
-
-
-async def create_movies_index():
-    """Create an index for movies."""
-    try:
-        await elastic.connection.indices.create(
-            index='movies',
-            body={
-                'settings': SETTINGS,
-                'mappings': {
-                    'dynamic': 'strict',
-                    'properties': {
-                        'id': {'type': 'keyword'},
-                        'imdb_rating': {'type': 'float'},
-                        'genre': {'type': 'keyword'},
-                        'title': {'type': 'text', 'analyzer': 'ru_en', 'fields': {'raw': {'type': 'keyword'}}},
-                        'description': {'type': 'text', 'analyzer': 'ru_en'},
-                        'director': {'type': 'text', 'analyzer': 'ru_en'},
-                        'actors_names': {'type': 'text', 'analyzer': 'ru_en'},
-                        'writers_names': {'type': 'text', 'analyzer': 'ru_en'},
-                        'actors': {'type': 'nested', 'dynamic': 'strict', 'properties': {
-                            'id': {'type': 'keyword'},
-                            'name': {'type': 'text', 'analyzer': 'ru_en'},
-                        }},
-                        'writers': {'type': 'nested', 'dynamic': 'strict', 'properties': {
-                            'id': {'type': 'keyword'},
-                            'name': {'type': 'text', 'analyzer': 'ru_en'},
-                        }},
-                    },
-                },
-            },
-        )
-    except RequestError as exc:
-        logging.error(exc)
-    else:
-        logging.info('Movies index created.')
+from db.backends import MemoryBackend, RedisBackend
+from db.pooling import HedgingTransport, PooledConnection
+from db.sharding import ShardedBackend
 
 
-async def create_persons_index():
-    """Create an index for persons."""
-    try:
-        await elastic.connection.indices.create(
-            index='persons',
-            body={
-                'settings': SETTINGS,
-                'mappings': {
-                    'dynamic': 'strict',
-                    'properties': {
-                        'id': {'type': 'keyword'},
-                        'full_name': {'type': 'text', 'analyzer': 'ru_en', 'fields': {'raw': {'type': 'keyword'}}},
-                    },
-                },
-            },
-        )
-    except RequestError as exc:
-        logging.error(exc)
-    else:
-        logging.info('Persons index created.')
+async def start_elasticsearch():
+    """Coroutine to connect to the Elasticsearch cluster, spreading the requests across its nodes."""
+    elastic.connection = AsyncElasticsearch(
+        hosts=CONFIG.elastic.hosts or ['{host}:{port}'.format(host=CONFIG.elastic.host, port=CONFIG.elastic.port)],
+        connection_class=PooledConnection,
+        transport_class=HedgingTransport,
+        maxsize=CONFIG.elastic.maxsize,
+        keepalive=CONFIG.elastic.keepalive,
+        sniff_on_start=CONFIG.elastic.sniff,
+        sniff_on_connection_fail=CONFIG.elastic.sniff,
+        retry_on_timeout=CONFIG.elastic.retry,
+        max_retries=CONFIG.elastic.retries,
+    )
 
 
-async def create_genres_index():
-    """Create an index for genres."""
-    try:
-        await elastic.connection.indices.create(
-            index='genres',
-            body={
-                'settings': SETTINGS,
-                'mappings': {
-                    'dynamic': 'strict',
-                    'properties': {
-                        'id': {'type': 'keyword'},
-                        'name': {'type': 'text', 'analyzer': 'ru_en', 'fields': {'raw': {'type': 'keyword'}}},
-                        'description': {'type': 'text', 'analyzer': 'ru_en'},
-                    },
-                },
-            },
-        )
-    except RequestError as exc:
-        logging.error(exc)
+async def start_redis():
+    """Coroutine to connect to the Redis database, sharding the cache if several nodes are set."""
+    if CONFIG.redis.backend == 'memory':
+        redis.connection = MemoryBackend()
+        return
+    addresses = CONFIG.redis.nodes or ['{host}:{port}'.format(host=CONFIG.redis.host, port=CONFIG.redis.port)]
+    pools = await asyncio.gather(*[
+        aioredis.create_redis_pool(address=parse_address(address), minsize=10, maxsize=20)
+        for address in addresses
+    ])
+    nodes = {address: RedisBackend(pool) for address, pool in zip(addresses, pools)}
+    if len(nodes) == 1:
+        redis.connection = nodes[addresses[0]]
     else:
-        logging.info('Genres index created.')
+        redis.connection = ShardedBackend(nodes, ejection=CONFIG.redis.ejection)
 
 
-async def start_elasticsearch():
-    """Coroutine to connect to the Elasticsearch database."""
-    elastic.connection = AsyncElasticsearch(
-        hosts=['{host}:{port}'.format(host=CONFIG.elastic.host, port=CONFIG.elastic.port)],
-    )
+def parse_address(address: str) -> Tuple[str, int]:
+    """
+    Split the address of a Redis node into the host and the port.
 
+    Args:
+        address: Address in the host:port format
 
-async def start_redis():
-    """Coroutine to connect to the Redis database."""
-    redis.connection = await aioredis.create_redis_pool(
-        address=(CONFIG.redis.host, CONFIG.redis.port), minsize=10, maxsize=20,
-    )
+    Returns:
+        Tuple[str, int]: Host and port
+    """
+    host, _, port = address.rpartition(':')
+    return host, int(port)
 
 
 async def stop_redis():
     """Coroutine to disconnect from the Redis database."""
-    redis.connection.close()
-    await redis.connection.wait_closed()
+    await redis.connection.close()
 
 
 async def stop_elasticsearch():
     """Coroutine to disconnect from the Elasticsearch database."""
     await elastic.connection.close()
+
+
+async def verify_connections() -> bool:
+    """
+    Check that both databases respond to requests.
+
+    Returns:
+        bool: True if Redis and Elasticsearch are available
+    """
+    if redis.connection is None or elastic.connection is None:
+        return False
+    try:
+        pong, available = await asyncio.gather(redis.connection.ping(), elastic.connection.ping())
+    except (RedisError, OSError) as exc:
+        logging.error(f'Databases are not available: {exc}!')
+        return False
+    return bool(pong) and available
+
+
+async def warm_elasticsearch(indices: tuple = ('movies', 'persons', 'genres')):
+    """
+    Open the Elasticsearch connection pool and load the indices with a cheap query to each of them.
+
+    Args:
+        indices: Indices to be queried
+    """
+    if elastic.connection is None:
+        return
+    try:
+        await asyncio.gather(*[
+            elastic.connection.count(index=index, ignore_unavailable=True) for index in indices
+        ])
+    except TransportError as exc:
+        logging.error(f'Elasticsearch warmup failed: {exc}!')
@@ -1,14 +1,20 @@
+from functools import partial
 from http import HTTPStatus
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from elasticsearch import AsyncElasticsearch, NotFoundError
-from elasticsearch.exceptions import ConnectionError
+from elasticsearch import AsyncElasticsearch, ConnectionError, NotFoundError
 from fastapi import HTTPException
 
+from db import reads
 from db.base import DatabaseModel
+from db.hits import Hits, cache_hits, cached_hits, canonical_key
+from db.profiling import observe, sample_profile
+from core.deadline import DeadlineExceeded
 from core.decorators import backoff
 
+Search = Tuple[str, Dict]
+
 connection: Optional[AsyncElasticsearch] = None
 
 
@@ -22,19 +28,65 @@ async def get_elastic() -> AsyncElasticsearch:
     return connection
 
 
+def profiled(search: Search) -> Search:
+    """
+    Ask Elasticsearch to profile a sampled query of a multi-search.
+
+    Args:
+        search: Pair of an index with documents and a query body
+
+    Returns:
+        Search: The pair with the profiled query body if the query is sampled
+    """
+    index, query = search
+    return (index, {**query, 'profile': True}) if sample_profile() else search
+
+
+def msearch_body(searches: List[Search]) -> List[Dict]:
+    """
+    Get the body of a multi-search with a header line before every query.
+
+    Args:
+        searches: Pairs of an index with documents and a query body
+
+    Returns:
+        List[Dict]: Lines of the multi-search body
+    """
+    return [line for index, query in searches for line in ({'index': index}, query)]
+
+
+def search_hits(response: Dict[str, Any]) -> Hits:
+    """
+    Get the document data of a search response.
+
+    Args:
+        response: Response of a search or of a query of a multi-search
+
+    Raises:
+        HTTPException: If the query failed, return its HTTP status.
+
+    Returns:
+        Hits: Document data without information about the request results
+    """
+    if 'error' in response:
+        raise HTTPException(status_code=response.get('status', HTTPStatus.INTERNAL_SERVER_ERROR))
+    return [doc['_source'] for doc in response['hits']['hits']]
+
+
 class ElasticStorage(DatabaseModel):
     """Class for working with Elasticsearch storage as the primary database."""
 
     elastic: AsyncElasticsearch
 
     @backoff(errors=(ConnectionError))
-    async def get_elastic_doc(self, index: str, doc_id: UUID) -> Dict:
+    async def get_elastic_doc(self, index: str, doc_id: UUID, source: Optional[Sequence[str]] = None) -> Dict:
         """
         Get a document from Elasticsearch.
 
         Args:
             index: Index with documents
             doc_id: Document ID
+            source: Fields of the document to return, all fields if not set
 
         Raises:
             HTTPException: If the document doesn't exist, return an HTTP 404 status.
@@ -42,29 +94,112 @@ class ElasticStorage(DatabaseModel):
         Returns:
             Dict: Document data without information about the request results
         """
+        params = {'id': str(doc_id), '_source': source}
+        read = partial(self.elastic.get, index=index, id=doc_id, _source_includes=source, **reads.timeouts())
         try:
-            doc = await self.elastic.get(index=index, id=doc_id)
+            doc = await reads.coalesce(
+                canonical_key('get', index, params), partial(observe, 'get', [(index, params)], read),
+            )
         except NotFoundError:
             raise HTTPException(status_code=HTTPStatus.NOT_FOUND)
         return doc['_source']
 
     @backoff(errors=(ConnectionError))
-    async def search_elastic_docs(self, index: str, queryset: Optional[Dict] = None) -> List[Dict]:
+    async def search_elastic_docs(
+        self, index: str, queryset: Optional[Dict] = None, source: Optional[Sequence[str]] = None,
+    ) -> List[Dict]:
         """
         Get a list of documents from Elasticsearch.
 
         Args:
             index: Index with documents
             queryset: Query parameters for searching data
+            source: Fields of the documents to return, all fields if not set
 
         Raises:
             HTTPException: If there are no documents for the query, return an HTTP 404 status.
+            DeadlineExceeded: If Elasticsearch ran out of the budget and returned partial hits.
 
         Returns:
             List[dict]: List of document data without information about the request results
         """
+        key = canonical_key('search', index, {**(queryset or {}), '_source': source})
+        cached = cached_hits([key])[0]
+        if cached is not None:
+            return cached
+        params = dict(queryset or {})
+        if sample_profile():
+            params['body'] = {**params.get('body', {}), 'profile': True}
         try:
-            docs = await self.elastic.search(index=index, **queryset or {})
+            docs = await reads.coalesce(
+                canonical_key('search', index, {**params, '_source': source}),
+                partial(observe, 'search', [(index, params)], partial(
+                    self.elastic.search, index=index, _source_includes=source, **params, **reads.timeouts(server=True),
+                )),
+            )
         except NotFoundError:
             raise HTTPException(status_code=HTTPStatus.NOT_FOUND)
-        return [doc['_source'] for doc in docs['hits']['hits']]
+        if docs.get('timed_out'):
+            raise DeadlineExceeded
+        cached = search_hits(docs)
+        cache_hits({key: cached})
+        return cached
+
+    @backoff(errors=(ConnectionError))
+    async def get_elastic_docs(
+        self, index: str, doc_ids: List[UUID], source: Optional[Sequence[str]] = None,
+    ) -> List[Dict]:
+        """
+        Get several documents from Elasticsearch in a single request.
+
+        Args:
+            index: Index with documents
+            doc_ids: Document IDs
+            source: Fields of the documents to return, all fields if not set
+
+        Returns:
+            List[Dict]: Data of the found documents in the order of the IDs
+        """
+        body = {'ids': [str(doc_id) for doc_id in doc_ids]}
+        read = partial(self.elastic.mget, index=index, body=body, _source_includes=source, **reads.timeouts())
+        docs = await reads.coalesce(
+            canonical_key('mget', index, {**body, '_source': source}), partial(observe, 'mget', [(index, body)], read),
+        )
+        return [doc['_source'] for doc in docs['docs'] if doc.get('found')]
+
+    @backoff(errors=(ConnectionError))
+    async def msearch_elastic_docs(self, searches: List[Search]) -> List[Hits]:
+        """
+        Get lists of documents for several queries from Elasticsearch in a single request.
+
+        Args:
+            searches: Pairs of an index with documents and a query body
+
+        Returns:
+            List[Hits]: Lists of document data in the order of the queries
+        """
+        keys = [canonical_key('search', *search) for search in searches]
+        found = dict(zip(keys, cached_hits(keys)))
+        missing = {key: search for key, search in zip(keys, searches) if found[key] is None}
+        if missing:
+            found.update(await self.fetch_searches(missing))
+        return [found[key] for key in keys]  # type: ignore[misc]
+
+    async def fetch_searches(self, missing: Dict[str, Search]) -> Dict[str, Hits]:
+        """
+        Run the queries that are not cached in a single multi-search request, caching their hits.
+
+        Args:
+            missing: Pairs of an index with documents and a query body by the key of the query
+
+        Returns:
+            Dict[str, Hits]: Lists of document data by the key of the query
+        """
+        searches = list(map(profiled, missing.values()))
+        body = msearch_body(searches)
+        docs = await reads.coalesce(canonical_key('msearch', '', body), partial(
+            observe, 'msearch', searches, partial(self.elastic.msearch, body=body, **reads.timeouts()),
+        ))
+        fetched = dict(zip(missing, map(search_hits, docs['responses'])))
+        cache_hits(fetched)
+        return fetched
@@ -0,0 +1,116 @@
+import hashlib
+import time
+from typing import Any, Dict, List, Optional, OrderedDict, Tuple
+
+import orjson
+
+from core.config import CONFIG
+
+Hits = List[Dict]
+
+
+def canonical_key(method: str, index: str, body: Any) -> str:
+    """
+    Get the key of an Elasticsearch read that is the same for identical reads regardless of the order of the fields.
+
+    Args:
+        method: Name of the Elasticsearch API method
+        index: Index with documents
+        body: Parameters of the read
+
+    Returns:
+        str: JSON of the method, index and parameters with the sorted keys
+    """
+    return orjson.dumps([method, index, body], option=orjson.OPT_SORT_KEYS).decode()
+
+
+class HitCache:
+    """Class for caching the hits of Elasticsearch queries in the memory of the worker, shared by all endpoints."""
+
+    def __init__(self, size: int, expire: int):
+        """
+        When initializing the class, it accepts the limits of the cache.
+
+        Args:
+            size: Maximum number of the cached hits, the least recently used ones are evicted first
+            expire: Lifetime of the cached hits in seconds
+        """
+        self.size = size
+        self.expire = expire
+        self.entries: OrderedDict[str, Tuple[float, Hits]] = OrderedDict()
+
+    def hash(self, key: str) -> str:
+        """
+        Get the short digest of the query key, so that large query bodies are not kept in memory.
+
+        Args:
+            key: Canonical key of the query
+
+        Returns:
+            str: Digest of the key
+        """
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Hits]:
+        """
+        Get the unexpired hits of the query.
+
+        Args:
+            key: Canonical key of the query
+
+        Returns:
+            Optional[Hits]: Document data, or None if the hits are not cached
+        """
+        digest = self.hash(key)
+        entry = self.entries.get(digest)
+        if entry is None:
+            return None
+        expires, docs = entry
+        if expires < time.monotonic():
+            self.entries.pop(digest)
+            return None
+        self.entries.move_to_end(digest)
+        return docs
+
+    def set(self, key: str, docs: Hits):
+        """
+        Cache the hits of the query, evicting the least recently used hits beyond the size limit.
+
+        Args:
+            key: Canonical key of the query
+            docs: Document data
+        """
+        self.entries[self.hash(key)] = (time.monotonic() + self.expire, docs)
+        self.entries.move_to_end(self.hash(key))
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+
+hit_cache: Optional[HitCache] = (
+    HitCache(size=CONFIG.hits.size, expire=CONFIG.hits.expire) if CONFIG.hits.enabled else None
+)
+
+
+def cached_hits(keys: List[str]) -> List[Optional[Hits]]:
+    """
+    Get the cached hits of several queries.
+
+    Args:
+        keys: Canonical keys of the queries
+
+    Returns:
+        List[Optional[Hits]]: Document data in the order of the keys, None for the queries that are not cached
+    """
+    return [hit_cache.get(key) if hit_cache else None for key in keys]
+
+
+def cache_hits(found: Dict[str, Hits]):
+    """
+    Cache the hits of several queries if the cache is enabled.
+
+    Args:
+        found: Document data by the canonical key of the query
+    """
+    if hit_cache:
+        for key, docs in found.items():
+            hit_cache.set(key, docs)
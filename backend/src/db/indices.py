@@ -0,0 +1,140 @@
+import asyncio
+import logging
+
+from elasticsearch import RequestError, TransportError
+
+from db import connections, elastic
+
+SETTINGS = {
+    'refresh_interval': '1s',
+    'analysis': {
+        'filter': {
+            'english_stop': {'type': 'stop', 'stopwords': '_english_'},
+            'english_stemmer': {'type': 'stemmer', 'language': 'english'},
+            'english_possessive_stemmer': {'type': 'stemmer', 'language': 'possessive_english'},
+            'russian_stop': {'type': 'stop', 'stopwords': '_russian_'},
+            'russian_stemmer': {'type': 'stemmer', 'language': 'russian'},
+        },
+        'analyzer': {
+            'ru_en': {'tokenizer': 'standard', 'filter': [
+                'lowercase',
+                'english_stop',
+                'english_stemmer',
+                'english_possessive_stemmer',
+                'russian_stop',
+                'russian_stemmer',
+            ]},
+        },
+    },
+}
+
+
+async def create_movies_index():
+    """Create an index for movies."""
+    try:
+        await elastic.connection.indices.create(
+            index='movies',
+            body={
+                'settings': SETTINGS,
+                'mappings': {
+                    'dynamic': 'strict',
+                    'properties': {
+                        'id': {'type': 'keyword'},
+                        'imdb_rating': {'type': 'float'},
+                        'genre': {'type': 'keyword'},
+                        'title': {'type': 'text', 'analyzer': 'ru_en', 'fields': {
+                            'raw': {'type': 'keyword'},
+                            'suggest': {'type': 'search_as_you_type'},
+                        }},
+                        'description': {'type': 'text', 'analyzer': 'ru_en'},
+                        'director': {'type': 'text', 'analyzer': 'ru_en'},
+                        'actors_names': {'type': 'text', 'analyzer': 'ru_en'},
+                        'writers_names': {'type': 'text', 'analyzer': 'ru_en'},
+                        'actors': {'type': 'nested', 'dynamic': 'strict', 'properties': {
+                            'id': {'type': 'keyword'},
+                            'name': {'type': 'text', 'analyzer': 'ru_en'},
+                        }},
+                        'writers': {'type': 'nested', 'dynamic': 'strict', 'properties': {
+                            'id': {'type': 'keyword'},
+                            'name': {'type': 'text', 'analyzer': 'ru_en'},
+                        }},
+                    },
+                },
+            },
+        )
+    except RequestError as exc:
+        logging.error(exc)
+    else:
+        logging.info('Movies index created.')
+
+
+async def create_persons_index():
+    """Create an index for persons."""
+    try:
+        await elastic.connection.indices.create(
+            index='persons',
+            body={
+                'settings': SETTINGS,
+                'mappings': {
+                    'dynamic': 'strict',
+                    'properties': {
+                        'id': {'type': 'keyword'},
+                        'full_name': {'type': 'text', 'analyzer': 'ru_en', 'fields': {
+                            'raw': {'type': 'keyword'},
+                            'suggest': {'type': 'search_as_you_type'},
+                        }},
+                    },
+                },
+            },
+        )
+    except RequestError as exc:
+        logging.error(exc)
+    else:
+        logging.info('Persons index created.')
+
+
+async def create_genres_index():
+    """Create an index for genres."""
+    try:
+        await elastic.connection.indices.create(
+            index='genres',
+            body={
+                'settings': SETTINGS,
+                'mappings': {
+                    'dynamic': 'strict',
+                    'properties': {
+                        'id': {'type': 'keyword'},
+                        'name': {'type': 'text', 'analyzer': 'ru_en', 'fields': {'raw': {'type': 'keyword'}}},
+                        'description': {'type': 'text', 'analyzer': 'ru_en'},
+                    },
+                },
+            },
+        )
+    except RequestError as exc:
+        logging.error(exc)
+    else:
+        logging.info('Genres index created.')
+
+
+async def create_indices():
+    """Create all cinema indices concurrently."""
+    await asyncio.gather(
+        create_genres_index(),
+        create_persons_index(),
+        create_movies_index(),
+    )
+
+
+async def main():
+    """Connect to Elasticsearch, create the indices and disconnect, outside of the request-serving process."""
+    await connections.start_elasticsearch()
+    try:
+        await create_indices()
+    except TransportError as exc:
+        logging.error(f'Indices are not created: {exc}!')
+    finally:
+        await connections.stop_elasticsearch()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+import asyncio
+from typing import Any, Dict, Optional
+
+import aiohttp
+from elasticsearch import AIOHttpConnection, AsyncTransport, Connection
+from elasticsearch._async.http_aiohttp import ESClientResponse
+
+from db import elastic
+from core.hedging import used_nodes
+
+
+class PooledConnection(AIOHttpConnection):
+    """Connection to an Elasticsearch node that keeps idle HTTP connections alive and reports the pool usage."""
+
+    session: Optional[aiohttp.ClientSession]
+    loop: Optional[asyncio.AbstractEventLoop]
+
+    def __init__(self, *args, maxsize: int = 10, keepalive: float = 15, **kwargs):
+        """
+        When initializing the class, it accepts the size of the HTTP connection pool and its keep-alive timeout.
+
+        Args:
+            args: Positional arguments of the connection
+            maxsize: Maximum number of HTTP connections to the node
+            keepalive: Keep-alive timeout of idle HTTP connections in seconds
+            kwargs: Named arguments of the connection
+        """
+        super().__init__(*args, maxsize=maxsize, **kwargs)
+        self.maxsize = maxsize
+        self.keepalive = keepalive
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the usage of the HTTP connection pool of the node for monitoring.
+
+        aiohttp does not expose the usage of its pool, so the counts are read from the connector when it has them, and
+        are zero otherwise.
+
+        Returns:
+            Dict[str, int]: Size of the pool, HTTP connections in use and idle, and requests waiting for one
+        """
+        connector = self.session.connector if self.session else None
+        return {
+            'maxsize': self.maxsize,
+            'active': len(getattr(connector, '_acquired', ())),
+            'idle': sum(map(len, getattr(connector, '_conns', {}).values())),
+            'waiting': sum(map(len, getattr(connector, '_waiters', {}).values())),
+        }
+
+    async def perform_request(self, *args, **kwargs) -> Any:
+        """
+        Send a request to the node, creating the HTTP session with the keep-alive timeout of the pool on first use.
+
+        Args:
+            args: Positional arguments of the request
+            kwargs: Named arguments of the request
+
+        Returns:
+            Any: Status, headers and body of the response
+        """
+        if self.session is None:
+            self.loop = self.loop or asyncio.get_running_loop()
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                auto_decompress=True,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                response_class=ESClientResponse,
+                connector=aiohttp.TCPConnector(
+                    limit=self.maxsize, ssl=self._ssl_context, keepalive_timeout=self.keepalive,
+                ),
+            )
+        return await super().perform_request(*args, **kwargs)
+
+
+class HedgingTransport(AsyncTransport):
+    """Transport that sends the reads of a hedged call to different nodes, while there are unused live nodes."""
+
+    def get_connection(self) -> Connection:
+        """
+        Get the connection of the next node, skipping the nodes already used by the hedged call.
+
+        Returns:
+            Connection: Connection to the node
+        """
+        connection = super().get_connection()
+        nodes = used_nodes.get()
+        if nodes is None:
+            return connection
+        if connection in nodes:
+            connection = next((other for other in self.connection_pool.connections if other not in nodes), connection)
+        nodes.append(connection)
+        return connection
+
+
+def elasticsearch_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get the usage of the HTTP connection pools of the Elasticsearch nodes.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Usage of the pool by the address of the live nodes, none before the connection
+    """
+    if elastic.connection is None:
+        return {}
+    pool = elastic.connection.transport.connection_pool
+    return {connection.host: connection.stats() for connection in pool.connections}
@@ -0,0 +1,114 @@
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+import orjson
+
+from core.calls import counted
+from core.config import CONFIG
+from core.logger import current_request_id
+
+Read = Callable[[], Awaitable[Any]]
+
+logger = logging.getLogger('app.elastic')
+
+
+def summarize_profile(profile: Dict) -> List[Dict]:
+    """
+    Get the timings of a profiled search on every shard.
+
+    Args:
+        profile: Profile of the search returned by Elasticsearch
+
+    Returns:
+        List[Dict]: Shard ID with the time spent on the query and on collecting the hits in milliseconds
+    """
+    return [
+        {
+            'shard': shard['id'],
+            'query_ms': sum(query['time_in_nanos'] for search in shard['searches'] for query in search['query']) / 1e6,
+            'collect_ms': sum(
+                collector['time_in_nanos'] for search in shard['searches'] for collector in search['collector']
+            ) / 1e6,
+        }
+        for shard in profile.get('shards', [])
+    ]
+
+
+def log_query(method: str, index: str, body: Any, elapsed: float, response: Any):
+    """
+    Log an Elasticsearch query that was slow or profiled, with its shape and timings.
+
+    Args:
+        method: Name of the Elasticsearch API method
+        index: Index with documents
+        body: Parameters of the query
+        elapsed: Duration of the query measured by the client in seconds
+        response: The response of Elasticsearch
+    """
+    details: Dict[str, Any] = {
+        'request_id': current_request_id.get(),
+        'method': method,
+        'index': index,
+        'body': orjson.dumps(body, option=orjson.OPT_SORT_KEYS).decode(),
+        'elapsed_ms': round(elapsed * 1000, 1),
+    }
+    if isinstance(response, dict):
+        details.update(took_ms=response.get('took'), shards=response.get('_shards'))
+        profile = response.get('profile')
+        if profile:
+            details.update(profile=summarize_profile(profile))
+    slow = elapsed >= CONFIG.profiling.slow
+    logger.log(
+        logging.WARNING if slow else logging.INFO,
+        '{kind} Elasticsearch query to {index} took {elapsed} ms: {body}'.format(
+            kind='Slow' if slow else 'Profiled', index=index, elapsed=details['elapsed_ms'], body=details['body'],
+        ),
+        extra=details,
+    )
+
+
+def sample_profile() -> bool:
+    """
+    Decide whether to profile a query, so that the configured share of queries is profiled.
+
+    Returns:
+        bool: True if the query should be run with profiling
+    """
+    return CONFIG.profiling.sample > 0 and random.random() < CONFIG.profiling.sample
+
+
+def log_queries(method: str, searches: List[Tuple[str, Any]], response: Any, elapsed: float):
+    """
+    Log the queries of an Elasticsearch read that were slow or profiled.
+
+    Args:
+        method: Name of the Elasticsearch API method
+        searches: Pairs of an index and query parameters, one for every query of the read
+        response: The response of Elasticsearch
+        elapsed: Duration of the read measured by the client in seconds
+    """
+    replies = response['responses'] if method == 'msearch' else [response]
+    for (index, body), reply in zip(searches, replies):
+        took = reply.get('took', 0) / 1000 if method == 'msearch' else elapsed
+        if took >= CONFIG.profiling.slow or 'profile' in reply:
+            log_query(method, index, body, took, reply)
+
+
+async def observe(method: str, searches: List[Tuple[str, Any]], read: Read) -> Any:
+    """
+    Make an Elasticsearch read, counting it and logging its queries if they are slow or profiled.
+
+    Args:
+        method: Name of the Elasticsearch API method
+        searches: Pairs of an index and query parameters, one for every query of the read
+        read: Function that starts the read
+
+    Returns:
+        Any: The response of Elasticsearch
+    """
+    started = time.monotonic()
+    response = await counted('elastic', read())
+    log_queries(method, searches, response, time.monotonic() - started)
+    return response
@@ -1,7 +1,7 @@
 from typing import Dict, List, Optional
 
 from elasticsearch_dsl import Search
-from elasticsearch_dsl.query import MatchPhrase, Nested, QueryString, Term, Terms
+from elasticsearch_dsl.query import MatchPhrase, MultiMatch, Nested, SimpleQueryString, Term, Terms
 
 
 def genres_by_film(film: Dict) -> Dict:
@@ -67,7 +67,7 @@ def films_by_genre(genre: Dict) -> Dict:
 
 def search_data(query_str: str, fields: Optional[List] = None) -> Dict:
     """
-    Retrieve a query in Elasticsearch for the purpose of full-text search.
+    Retrieve a query in Elasticsearch for the purpose of full-text search, scoring the results by relevance.
 
     Args:
         query_str (str): Query for full-text search.
@@ -76,5 +76,22 @@ def search_data(query_str: str, fields: Optional[List] = None) -> Dict:
     Returns:
         Dict: A query in Elasticsearch for full-text search purposes.
     """
-    query = Search().filter(QueryString(query=query_str, fields=fields))
+    query = Search().query(SimpleQueryString(query=query_str, fields=fields, default_operator='and'))
+    return query.to_dict()
+
+
+def suggest_data(query_str: str, field: str) -> Dict:
+    """
+    Retrieve a query in Elasticsearch for autocompletion of the text being typed.
+
+    Args:
+        query_str: Beginning of the text, the last word of which can be incomplete
+        field: Index field of the search_as_you_type type
+
+    Returns:
+        Dict: A query in Elasticsearch matching the words and the prefix of the last one
+    """
+    query = Search().query(MultiMatch(
+        query=query_str, type='bool_prefix', fields=[field, f'{field}._2gram', f'{field}._3gram'],
+    ))
     return query.to_dict()
@@ -0,0 +1,144 @@
+import asyncio
+import time
+from contextvars import ContextVar
+from functools import partial
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from elasticsearch import ConnectionError
+from fastapi import HTTPException
+
+from core.config import CONFIG
+from core.deadline import bounded, remaining
+from core.hedging import Hedger
+from core.limiter import AdaptiveLimiter
+
+Read = Callable[[], Awaitable[Any]]
+Memo = Dict[str, Any]
+
+inflight: Dict[str, asyncio.Future] = {}
+memo: ContextVar[Optional[Memo]] = ContextVar('elastic_memo', default=None)
+
+limiter: Optional[AdaptiveLimiter] = AdaptiveLimiter(
+    initial=CONFIG.limiter.initial,
+    minimum=CONFIG.limiter.minimum,
+    maximum=CONFIG.limiter.maximum,
+    latency=CONFIG.limiter.latency,
+    decrease=CONFIG.limiter.decrease,
+) if CONFIG.limiter.enabled else None
+
+hedger: Optional[Hedger] = Hedger(
+    percentile=CONFIG.hedging.percentile,
+    budget=CONFIG.hedging.budget,
+    window=CONFIG.hedging.window,
+) if CONFIG.hedging.enabled else None
+
+
+def forget(key: str, future: asyncio.Future):
+    """
+    Remove a finished read from the in-flight reads, retrieving its exception so that it is not reported as lost.
+
+    Args:
+        key: Key of the read
+        future: Result of the read
+    """
+    inflight.pop(key, None)
+    if not future.cancelled():
+        future.exception()
+
+
+def timeouts(server: bool = False) -> Dict[str, Any]:
+    """
+    Get the timeouts of an Elasticsearch read from the remaining latency budget of the request.
+
+    Args:
+        server: Whether the API method also accepts a timeout for Elasticsearch itself
+
+    Returns:
+        Dict[str, Any]: Parameters of the client and server timeouts, no parameters without a deadline
+    """
+    left = remaining()
+    if left is None:
+        return {}
+    params: Dict[str, Any] = {'request_timeout': left}
+    if server:
+        params['timeout'] = '{ms}ms'.format(ms=int(left * 1000))
+    return params
+
+
+async def hedge(read: Read) -> Any:
+    """
+    Make an Elasticsearch read, hedging it on another node if hedging is enabled.
+
+    Args:
+        read: Function that starts the read
+
+    Returns:
+        Any: The response of Elasticsearch
+    """
+    return await (hedger.run(read) if hedger else read())
+
+
+def admit():
+    """
+    Take a slot of the adaptive concurrency limit for a new Elasticsearch read.
+
+    Only the request that starts a read is shed, while the requests that join a read in flight are always served.
+
+    Raises:
+        HTTPException: If the limit is exhausted, return an HTTP 503 status with the time to retry.
+    """
+    if limiter and not limiter.acquire():
+        raise HTTPException(
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE, headers={'Retry-After': str(CONFIG.limiter.retry)},
+        )
+
+
+async def limit(read: Read) -> Any:
+    """
+    Make an admitted Elasticsearch read, adjusting the adaptive concurrency limit by its latency.
+
+    Args:
+        read: Function that starts the read
+
+    Returns:
+        Any: The response of Elasticsearch
+    """
+    if limiter is None:
+        return await hedge(read)
+    started, failed = time.monotonic(), False
+    try:
+        return await hedge(read)
+    except (ConnectionError, asyncio.TimeoutError):
+        failed = True
+        raise
+    finally:
+        limiter.release(time.monotonic() - started, failed)
+
+
+async def coalesce(key: str, read: Read) -> Any:
+    """
+    Share one Elasticsearch read between identical concurrent reads and within the lifetime of a request.
+
+    The shared results must not be mutated by their consumers.
+
+    Args:
+        key: Canonical key of the read
+        read: Function that starts the read
+
+    Returns:
+        Any: The response of Elasticsearch
+    """
+    responses = memo.get()
+    if responses is not None and key in responses:
+        return responses[key]
+    future = inflight.get(key)
+    if future is None:
+        admit()
+        future = asyncio.ensure_future(limit(read))
+        inflight[key] = future
+        future.add_done_callback(partial(forget, key))
+    response = await bounded(asyncio.shield(future))
+    if responses is not None:
+        responses[key] = response
+    return response
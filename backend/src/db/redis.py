@@ -1,31 +1,88 @@
-from typing import Optional
+from typing import Awaitable, Dict, List, Optional, TypeVar
 
-from aioredis import Redis
+import zstandard
 from aioredis.errors import ConnectionClosedError
 
+from db.backends import CacheBackend, Tags
 from db.base import DatabaseModel
+from core.calls import counted
+from core.config import CONFIG
+from core.deadline import bounded
 from core.decorators import backoff
 
-connection: Optional[Redis] = None
+Outcome = TypeVar('Outcome')
 
+connection: Optional[CacheBackend] = None
 
-async def get_redis() -> Redis:
+ZSTD_HEADER = b'\x01'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+compressor = zstandard.ZstdCompressor(level=CONFIG.redis.level)
+decompressor = zstandard.ZstdDecompressor()
+
+
+async def get_redis() -> Optional[CacheBackend]:
     """
     Establish a connection to Redis, which is required when implementing dependencies.
 
     Returns:
-        Redis: Redis connection
+        Optional[CacheBackend]: Cache backend on one or several Redis nodes, None before the connection
     """
     return connection
 
 
+def pack(data: bytes) -> bytes:
+    """
+    Compress a large value before writing it to the cache, marking it with a header byte.
+
+    Args:
+        data: Value to write
+
+    Returns:
+        bytes: Header byte and the zstd frame, or the value itself if it is small or incompressible
+    """
+    if not CONFIG.redis.threshold or len(data) < CONFIG.redis.threshold:
+        return data
+    packed = ZSTD_HEADER + compressor.compress(data)
+    return packed if len(packed) < len(data) else data
+
+
+def unpack(value: Optional[bytes]) -> Optional[bytes]:
+    """
+    Decompress a value read from the cache if it has the header byte followed by a zstd frame.
+
+    Values without the header, including the ones written before compression was enabled, are returned as is.
+
+    Args:
+        value: Value from the cache
+
+    Returns:
+        Optional[bytes]: The original value
+    """
+    if value and value[:1] == ZSTD_HEADER and value[1:5] == ZSTD_MAGIC:
+        return decompressor.decompress(value[1:])
+    return value
+
+
 class RedisStorage(DatabaseModel):
     """A class for working with Redis storage in the form of a data cache."""
 
-    redis: Redis
+    redis: CacheBackend
+
+    async def command(self, awaitable: Awaitable[Outcome], budget: bool = True) -> Outcome:
+        """
+        Run a Redis command, counting it for the request.
+
+        Args:
+            awaitable: The command
+            budget: Whether the command is bound by the latency budget of the request
+
+        Returns:
+            Outcome: The result of the command
+        """
+        return await counted('redis', bounded(awaitable) if budget else awaitable)
 
     @backoff(errors=(ConnectionClosedError))
-    async def get_redis_value(self, key: str) -> bytes:
+    async def get_redis_value(self, key: str) -> Optional[bytes]:
         """
         Get data from Redis cache.
 
@@ -33,19 +90,69 @@ class RedisStorage(DatabaseModel):
             key: The key of the data
 
         Returns:
-            bytes: Data from cache
+            Optional[bytes]: Data from cache, None if it is missing
+        """
+        value = await self.command(self.redis.get(key))
+        return unpack(value)
+
+    @backoff(errors=(ConnectionClosedError))
+    async def get_redis_values(self, keys: List[str]) -> List[Optional[bytes]]:
+        """
+        Get several data entries from Redis cache in a single request.
+
+        Args:
+            keys: The keys of the data
+
+        Returns:
+            List[Optional[bytes]]: Data from cache in the order of the keys, None for missing keys
         """
-        value = await self.redis.get(key=key)
-        return value
+        return [unpack(value) for value in await self.command(self.redis.mget(keys))]
 
     @backoff(errors=(ConnectionClosedError))
-    async def set_redis_value(self, key: str, data: str, **kwargs):
+    async def set_redis_value(self, key: str, data: str, **kwargs) -> bool:
         """
-        Write data to Redis cache.
+        Write data to Redis cache, compressing it if it is large.
+
+        The write-back is not bound by the latency budget, so that a response computed at the end of the budget is
+        still cached.
 
         Args:
             key: Data key
             data: Data to write
             kwargs: Optional named arguments
+
+        Returns:
+            bool: True if the data was written
+        """
+        return await self.command(self.redis.set(key, pack(data.encode()), **kwargs), budget=False)
+
+    @backoff(errors=(ConnectionClosedError))
+    async def set_redis_values(
+        self, mapping: Dict[str, bytes], expire: int = 0, tags: Optional[Tags] = None,
+    ):
+        """
+        Write several data entries to Redis cache in a single transaction, compressing the large ones.
+
+        As the single write, the write-back is not bound by the latency budget.
+
+        Args:
+            mapping: Data to write by key
+            expire: Expiration time of every entry
+            tags: Keys of the entries by the surrogate key, by which they can be purged together
+        """
+        await self.command(self.redis.set_many(
+            {key: pack(data) for key, data in mapping.items()}, expire=expire, tags=tags,
+        ), budget=False)
+
+    @backoff(errors=(ConnectionClosedError))
+    async def purge_redis_tag(self, tag: str) -> List[str]:
+        """
+        Delete all data entries tagged with the surrogate key from Redis cache.
+
+        Args:
+            tag: Surrogate key
+
+        Returns:
+            List[str]: Keys of the deleted data
         """
-        await self.redis.set(key, data, **kwargs)
+        return await self.command(self.redis.purge(tag))
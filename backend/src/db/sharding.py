@@ -0,0 +1,260 @@
+import asyncio
+import bisect
+import hashlib
+import logging
+from itertools import chain
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple, Union
+
+from aioredis.errors import RedisError
+
+from db.backends import CacheBackend, Tags
+
+# Errors of an unavailable node, after which it is removed from the ring instead of failing the request.
+NODE_ERRORS = (RedisError, OSError)
+
+
+def ring_position(key: str) -> int:
+    """
+    Get the position of the key on the ring.
+
+    Args:
+        key: The key
+
+    Returns:
+        int: 64-bit position
+    """
+    return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], 'big')
+
+
+def split_tags(tags: Optional[Tags], shard: List[str]) -> Tags:
+    """
+    Get the surrogate keys of the values stored on a node.
+
+    Args:
+        tags: Keys of the values by the surrogate key
+        shard: Keys of the values stored on the node
+
+    Returns:
+        Tags: Keys of the values stored on the node by the surrogate key
+    """
+    keys = set(shard)
+    split = {tag: [key for key in tagged if key in keys] for tag, tagged in (tags or {}).items()}
+    return {tag: tagged for tag, tagged in split.items() if tagged}
+
+
+class HashRing:
+    """Consistent hashing ring that maps keys to nodes, moving only the keys of a node when it is removed."""
+
+    def __init__(self, nodes: Iterable[str], replicas: int = 128, ejection: int = 30):
+        """
+        When initializing the class, it places virtual points of every node on the ring.
+
+        Args:
+            nodes: Names of the nodes
+            replicas: Number of virtual points per node for an even distribution of keys
+            ejection: Time in seconds for which a failed node is removed from the ring
+        """
+        self.replicas = replicas
+        self.ejection = ejection
+        self.points: List[Tuple[int, str]] = []
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: str):
+        """
+        Place the node on the ring.
+
+        Args:
+            node: Name of the node
+        """
+        if node in self:
+            return
+        for replica in range(self.replicas):
+            bisect.insort(self.points, (ring_position(f'{node}#{replica}'), node))
+
+    def remove(self, node: str):
+        """
+        Remove the node from the ring, so that its keys move to the next nodes.
+
+        Args:
+            node: Name of the node
+        """
+        self.points = [point for point in self.points if point[1] != node]
+
+    def eject(self, node: str, exc: Exception):
+        """
+        Remove the failed node from the ring and return it after the ejection time.
+
+        While the node is removed, its keys are cache misses on the next nodes of the ring.
+
+        Args:
+            node: Name of the node
+            exc: Error of the node
+        """
+        if node not in self:
+            return
+        logging.error(f'Cache node {node} failed and is removed for {self.ejection} seconds: {exc}!')
+        self.remove(node)
+        asyncio.get_running_loop().call_later(self.ejection, self.add, node)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get the node that owns the key.
+
+        Args:
+            key: The key
+
+        Returns:
+            Optional[str]: Name of the node, None if the ring is empty
+        """
+        if not self.points:
+            return None
+        index = bisect.bisect_left(self.points, (ring_position(key), ''))
+        return self.points[index % len(self.points)][1]
+
+    def route(self, keys: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Group the keys by the nodes that own them.
+
+        Args:
+            keys: The keys
+
+        Returns:
+            Dict[str, List[str]]: Keys by the name of the node, without keys when no node is available
+        """
+        shards: Dict[str, List[str]] = {}
+        for key in keys:
+            node = self.get(key)
+            if node:
+                shards.setdefault(node, []).append(key)
+        return shards
+
+    def __contains__(self, node: str) -> bool:
+        """
+        Check that the node is on the ring.
+
+        Args:
+            node: Name of the node
+
+        Returns:
+            bool: True if the node is on the ring
+        """
+        return any(point[1] == node for point in self.points)
+
+
+async def call_nodes(ring: HashRing, calls: Dict[str, Awaitable]) -> Dict[str, Any]:
+    """
+    Send requests to the nodes concurrently, ejecting the nodes that are not available.
+
+    Args:
+        ring: Ring of the nodes
+        calls: Requests by the name of the node
+
+    Raises:
+        BaseException: Any error of a node other than its unavailability
+
+    Returns:
+        Dict[str, Any]: Answers by the name of the node, without the nodes that failed
+    """
+    answers = await asyncio.gather(*calls.values(), return_exceptions=True)
+    replied: Dict[str, Any] = {}
+    for node, answer in zip(calls, answers):
+        if isinstance(answer, NODE_ERRORS):
+            ring.eject(node, answer)
+        elif isinstance(answer, BaseException):
+            raise answer
+        else:
+            replied[node] = answer
+    return replied
+
+
+class ShardedBackend(CacheBackend):
+    """Cache backend that spreads keys over several nodes with consistent hashing."""
+
+    def __init__(self, nodes: Dict[str, CacheBackend], ejection: int = 30):
+        """
+        When initializing the class, it accepts the backends of the nodes.
+
+        Args:
+            nodes: Backends by the name of the node
+            ejection: Time in seconds for which a failed node is removed from the ring
+        """
+        self.nodes = nodes
+        self.ring = HashRing(nodes, ejection=ejection)
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        """
+        Get several values with one MGET per node, sent to all nodes concurrently.
+
+        Args:
+            keys: The keys of the values
+
+        Returns:
+            List[Optional[bytes]]: The values in the order of the keys, None for missing keys
+        """
+        shards = self.ring.route(keys)
+        replied = await call_nodes(self.ring, {node: self.nodes[node].mget(shard) for node, shard in shards.items()})
+        found = dict(zip(chain.from_iterable(shards[node] for node in replied), chain.from_iterable(replied.values())))
+        return list(map(found.get, keys))
+
+    async def set(self, key: str, value: Union[str, bytes], expire: int = 0, exist: Optional[str] = None) -> bool:
+        """
+        Set a value by key on the node that owns it.
+
+        Args:
+            key: The key of the value
+            value: The value to write
+            expire: Expiration time of the value
+            exist: Condition of the key existence, e.g. Redis.SET_IF_NOT_EXIST
+
+        Returns:
+            bool: True if the value was written
+        """
+        node = self.ring.get(key)
+        if not node:
+            return False
+        replied = await call_nodes(self.ring, {node: self.nodes[node].set(key, value, expire=expire, exist=exist)})
+        return replied.get(node, False)
+
+    async def set_many(self, mapping: Dict[str, bytes], expire: int = 0, tags: Optional[Tags] = None):
+        """
+        Set several values with one transaction per node, tagging them on the node where they are stored.
+
+        Args:
+            mapping: Values to write by key
+            expire: Expiration time of every value
+            tags: Keys of the values by the surrogate key, by which they can be purged together
+        """
+        await call_nodes(self.ring, {
+            node: self.nodes[node].set_many(
+                {key: mapping[key] for key in shard}, expire=expire, tags=split_tags(tags, shard),
+            )
+            for node, shard in self.ring.route(mapping).items()
+        })
+
+    async def purge(self, tag: str) -> List[str]:
+        """
+        Delete all values tagged with the surrogate key on every node.
+
+        Args:
+            tag: Surrogate key
+
+        Returns:
+            List[str]: Keys of the deleted values that had not expired
+        """
+        replied = await call_nodes(self.ring, {name: node.purge(tag) for name, node in self.nodes.items()})
+        return [key for keys in replied.values() for key in keys]
+
+    async def ping(self) -> bool:
+        """
+        Check that at least one node responds to requests, so that the cache is partially available.
+
+        Returns:
+            bool: True if any node answered
+        """
+        pongs = await asyncio.gather(*[node.ping() for node in self.nodes.values()], return_exceptions=True)
+        return any(pong is True for pong in pongs)
+
+    async def close(self):
+        """Close the connections to all nodes."""
+        await asyncio.gather(*[node.close() for node in self.nodes.values()])
@@ -0,0 +1,39 @@
+# Gunicorn settings for serving the API in production, taken from the serving section of the project settings.
+import gc
+
+from core.config import CONFIG
+from core.serving import worker_count
+
+worker_class = 'core.serving.ServingWorker'
+workers = worker_count()
+worker_connections = CONFIG.serving.connections
+backlog = CONFIG.serving.backlog
+keepalive = CONFIG.serving.keepalive
+
+# Importing the application once in the master shares its modules and models with the workers copy-on-write.
+preload_app = CONFIG.serving.preload
+
+# Workers are restarted after a random number of requests in the range, so that they do not restart all at once.
+max_requests = CONFIG.serving.requests
+max_requests_jitter = CONFIG.serving.jitter
+
+# A stopped worker closes its socket and finishes the requests in progress before it is killed.
+graceful_timeout = CONFIG.serving.drain
+timeout = CONFIG.serving.timeout
+
+# Heartbeats of the workers go to memory, as the disk of the container may stall them.
+worker_tmp_dir = '/dev/shm'
+
+
+def when_ready(server):
+    """
+    Move the objects of the preloaded application out of the garbage collector before the workers are forked.
+
+    The collector writes to every object it tracks, which would copy the shared memory pages into each worker.
+
+    Args:
+        server: Gunicorn arbiter
+    """
+    if preload_app:
+        gc.freeze()
+    server.log.info(f'Serving with {workers} workers of {worker_connections} connections.')
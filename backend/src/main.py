@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from http import HTTPStatus
 from typing import Callable
@@ -7,10 +8,15 @@ import uvicorn
 from fastapi import Depends, FastAPI, Header, Request, Response
 from fastapi.responses import ORJSONResponse
 
+from api import cache, debug, health, middleware
+from api.warmer import CacheWarmer
 from api.views import router
+from core import monitor
+from core.bulkhead import BulkheadFull
 from core.config import CONFIG
-from core.logger import LOGGING, RequestIdFilter
-from db import connections
+from core.deadline import DeadlineExceeded
+from core.logger import LOGGING, RequestIdFilter, current_request_id
+from db import connections, elastic, indices, redis
 
 
 async def logging_request_id(request_id: str = Header(default=None, alias='X-Request-Id')):
@@ -20,7 +26,9 @@ async def logging_request_id(request_id: str = Header(default=None, alias='X-Req
         request_id (str): The X-Request-Id passed in the request header.
     """
     logger = logging.getLogger('uvicorn.access')
-    logger.addFilter(RequestIdFilter(request_id))
+    request_filter = RequestIdFilter(request_id)
+    current_request_id.set(request_filter.request_id)
+    logger.addFilter(request_filter)
 
 
 app = FastAPI(
@@ -34,14 +42,30 @@ app = FastAPI(
 )
 
 
+async def warmup():
+    """Verify connections to databases and warm them up, then mark the worker as ready to accept traffic."""
+    while not await connections.verify_connections():
+        await asyncio.sleep(CONFIG.fastapi.readiness_retry_in_seconds)
+    if CONFIG.fastapi.warmup:
+        await connections.warm_elasticsearch()
+    warmer = CacheWarmer(elastic=elastic.connection, redis=redis.connection)
+    if CONFIG.warmer.enabled:
+        await warmer.warm()
+    app.state.ready = True
+    logging.info('Worker is ready to accept traffic.')
+    if CONFIG.warmer.enabled:
+        await warmer.run()
+
+
 @app.on_event('startup')
 async def startup():
-    """Connect to databases when the server starts."""
-    await connections.start_redis()
-    await connections.start_elasticsearch()
-    await connections.create_genres_index()
-    await connections.create_persons_index()
-    await connections.create_movies_index()
+    """Connect to databases when the server starts and start the warmup in the background."""
+    app.state.ready = False
+    if CONFIG.monitor.enabled:
+        monitor.monitor = monitor.LoopMonitor(interval=CONFIG.monitor.interval, threshold=CONFIG.monitor.threshold)
+        monitor.monitor.start()
+    await asyncio.gather(connections.start_redis(), connections.start_elasticsearch())
+    app.state.warmup = asyncio.create_task(warmup())
 
 
 @app.middleware('http')
@@ -56,7 +80,8 @@ async def access_control(request: Request, call_next: Callable) -> Response:
         Response: The server's response.
     """
     url_path, headers = request.scope['path'], request.headers
-    if url_path in {app.docs_url, f'{app.docs_url}/', app.openapi_url}:
+    probes = {request.app.url_path_for('live'), request.app.url_path_for('ready')}
+    if url_path in {app.docs_url, f'{app.docs_url}/', app.openapi_url} | probes:
         return await call_next(request)
     if CONFIG.fastapi.debug is False and url_path != request.app.url_path_for('films'):
         try:
@@ -75,17 +100,32 @@ async def access_control(request: Request, call_next: Callable) -> Response:
     return await call_next(request)
 
 
+app.middleware('http')(middleware.cache_control)
+app.middleware('http')(middleware.elastic_memo)
+app.middleware('http')(middleware.count_calls)
+app.add_exception_handler(BulkheadFull, middleware.bulkhead_full)
+app.add_exception_handler(DeadlineExceeded, middleware.deadline_exceeded)
+
+
 @app.on_event('shutdown')
 async def shutdown():
     """Disconnect from databases when the server shuts down."""
+    app.state.warmup.cancel()
+    if monitor.monitor:
+        monitor.monitor.stop()
     await connections.stop_redis()
     await connections.stop_elasticsearch()
 
 
 app.include_router(router, prefix='/api/v1')
+app.include_router(health.router)
+app.include_router(cache.router)
+if CONFIG.debugger.enabled:
+    app.include_router(debug.router)
 
 
 if __name__ == '__main__':
+    asyncio.run(indices.main())
     uvicorn.run(
         'main:app',
         host=CONFIG.fastapi.host,
@@ -1,8 +1,18 @@
-from typing import Callable
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, Type, TypeVar
 from uuid import UUID
 
 import orjson
 from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField, Undefined
+from pydantic.utils import lenient_issubclass
+
+Model = TypeVar('Model', bound=BaseModel)
+
+# A field of the model with its nested model and whether the field is a list of them.
+FieldSpec = Tuple[ModelField, Optional[Type[BaseModel]], bool]
+
+# Fields of every model, described on its first construction.
+FIELDS: Dict[Type[BaseModel], Tuple[FieldSpec, ...]] = {}
 
 
 def orjson_dumps(value: object, *, default: Callable) -> str:
@@ -19,10 +29,89 @@ def orjson_dumps(value: object, *, default: Callable) -> str:
     return orjson.dumps(value, default=default).decode()
 
 
+def describe_field(model: Type[BaseModel], name: str, field: ModelField) -> FieldSpec:
+    """
+    Describe the model field for its construction without validation.
+
+    Args:
+        model: Pydantic model
+        name: Name of the field
+        field: The field
+
+    Raises:
+        TypeError: If the field holds nested models in a shape other than a single model or a list of them
+
+    Returns:
+        FieldSpec: The field with its nested model and whether the field is a list of them
+    """
+    nested = field.type_ if lenient_issubclass(field.type_, BaseModel) else None
+    if nested and field.shape not in {SHAPE_SINGLETON, SHAPE_LIST}:
+        raise TypeError(f'Field {name} of {model.__name__} cannot be constructed without validation!')
+    return field, nested, field.shape == SHAPE_LIST
+
+
+def get_fields(model: Type[BaseModel]) -> Tuple[FieldSpec, ...]:
+    """
+    Get the description of the model fields needed to construct it without validation.
+
+    Args:
+        model: Pydantic model
+
+    Returns:
+        Tuple: Every field with its nested model and whether the field is a list of them
+    """
+    if model not in FIELDS:
+        FIELDS[model] = tuple(describe_field(model, name, field) for name, field in model.__fields__.items())
+    return FIELDS[model]
+
+
+def get_value(spec: FieldSpec, data: Dict) -> Any:
+    """
+    Get the value of the field from trusted data by its alias or name, constructing the nested models.
+
+    Args:
+        spec: Field with its nested model and whether the field is a list of them
+        data: Trusted data
+
+    Returns:
+        Any: Value of the field, its default if the data has none
+    """
+    field, nested, many = spec
+    value = data.get(field.alias, data.get(field.name, Undefined))
+    if value is Undefined:
+        return field.get_default()
+    if nested and value is not None:
+        return [construct(nested, item) for item in value] if many else construct(nested, value)
+    return value
+
+
+def construct(model: Type[Model], data: Dict) -> Model:
+    """
+    Create a model from trusted data without validation, including the nested models.
+
+    The data is taken by field aliases or names as is, without type conversion,
+    so it must already match the model, like the documents of the strictly mapped indices.
+
+    Args:
+        model: Pydantic model
+        data: Trusted data
+
+    Returns:
+        Model: Model instance
+    """
+    attributes = {spec[0].name: get_value(spec, data) for spec in get_fields(model)}
+    obj = object.__new__(model)
+    object.__setattr__(obj, '__dict__', attributes)
+    object.__setattr__(obj, '__fields_set__', set(attributes))
+    obj._init_private_attributes()
+    return obj
+
+
 class UUIDMixin(BaseModel):
     """Mixin for storing primary keys."""
 
     uuid: UUID
+    fragment: ClassVar[str] = 'id'
 
 
 class OrjsonMixin(BaseModel):
@@ -47,6 +47,7 @@ class FilmModified(UUIDMixin, OrjsonMixin):
 
     title: str
     imdb_rating: float
+    fragment: ClassVar[str] = 'brief'
 
 
 class FilmList(OrjsonMixin):
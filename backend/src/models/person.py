@@ -21,8 +21,22 @@ class Person(UUIDMixin, OrjsonMixin):
     film_ids: List[UUID]
 
 
+class PersonModified(UUIDMixin, OrjsonMixin):
+    """A model persona with brief information."""
+
+    full_name: str
+    fragment: ClassVar[str] = 'brief'
+
+
 class PersonList(OrjsonMixin):
     """A model for parsing a list of persons with information about their roles and movies."""
 
     __root__: List[Person]
     item: ClassVar[type] = Person
+
+
+class PersonModifiedList(OrjsonMixin):
+    """A model for parsing a list of persons with brief information."""
+
+    __root__: List[PersonModified]
+    item: ClassVar[type] = PersonModified
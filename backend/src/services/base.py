@@ -1,10 +1,16 @@
 import abc
 from enum import Enum
 from functools import wraps
-from typing import Callable, Type, Union
+from http import HTTPStatus
+from typing import Callable, Dict, List, Optional, Type, Union
 
-from pydantic import BaseModel, parse_obj_as, parse_raw_as
+from fastapi import Response
+from pydantic import parse_obj_as
 
+from services.entries import (
+    ETAG, TAGS, entry_key, entry_parts, etag_matches, make_digest, make_etag, object_surrogate_keys,
+)
+from core.compression import IDENTITY, encode, negotiate, precompress
 from core.config import CinemaObject, CinemaObjectList
 from db.elastic import ElasticStorage
 from db.redis import RedisStorage
@@ -23,6 +29,9 @@ class BaseService(ElasticStorage, RedisStorage, abc.ABC):
 
     index: ElasticIndices
     model: Type[Union[CinemaObject, CinemaObjectList]]
+    cache_refresh: bool = False
+    accept_encoding: str = ''
+    if_none_match: Optional[str] = None
 
     @property
     @abc.abstractmethod
@@ -30,8 +39,91 @@ class BaseService(ElasticStorage, RedisStorage, abc.ABC):
         """Key for Redis cache data as a string."""
 
     @abc.abstractmethod
-    async def get(self) -> Union[CinemaObject, CinemaObjectList]:
-        """Retrieve a representation of cinema data."""
+    async def get(self) -> Union[CinemaObject, CinemaObjectList, Response]:
+        """Retrieve a representation of cinema data, or the HTTP response with it."""
+
+    def surrogate_keys(self, obj: Union[CinemaObject, CinemaObjectList]) -> List[str]:
+        """
+        Get the surrogate keys of cinema data: its index and every cinema object it contains.
+
+        Args:
+            obj: Cinema data
+
+        Returns:
+            List[str]: Unique surrogate keys in the form of an index and an ID separated by a colon
+        """
+        keys = [str(self.index)]
+        for item in getattr(obj, '__root__', [obj]):
+            keys.extend(object_surrogate_keys(item, str(self.index)))
+        return list(dict.fromkeys(keys))
+
+    async def serialize(self, obj: Union[CinemaObject, CinemaObjectList]) -> bytes:
+        """
+        Serialize cinema data into the response body.
+
+        Args:
+            obj: Cinema data
+
+        Returns:
+            bytes: JSON representation of the data
+        """
+        return obj.json().encode()
+
+    async def build_cache_entry(self, obj: Union[CinemaObject, CinemaObjectList], body: bytes) -> Dict[str, bytes]:
+        """
+        Build the cache entry of the response body along with its precompressed copies, entity tag and surrogate keys.
+
+        Args:
+            obj: Cinema data
+            body: Serialized cinema data
+
+        Returns:
+            Dict[str, bytes]: Parts of the cache entry by content encoding or metadata name
+        """
+        return {
+            IDENTITY: body,
+            **await precompress(body),
+            ETAG: make_digest(body),
+            TAGS: ' '.join(self.surrogate_keys(obj)).encode(),
+        }
+
+    async def set_cache_entries(self, entries: Dict[str, Dict[str, bytes]], expire: int):
+        """
+        Write cache entries to Redis in a single transaction, tagging them with their surrogate keys.
+
+        Args:
+            entries: Parts of the cache entries by the key of the uncompressed response body
+            expire: Cache expiration time
+        """
+        mapping: Dict[str, bytes] = {}
+        tags: Dict[str, List[str]] = {}
+        for key, entry in entries.items():
+            mapping.update(entry_parts(key, entry))
+            for tag in entry[TAGS].decode().split():
+                tags.setdefault(tag, []).extend(entry_parts(key, entry))
+        await self.set_redis_values(mapping, expire=expire, tags=tags)
+
+    def make_response(self, entry: Dict[str, bytes], encoding: str) -> Response:
+        """
+        Create the HTTP response from the cache entry, or a 304 response if the client already has it.
+
+        The body is compressed on the fly when the entry has no precompressed copy in the content encoding.
+
+        Args:
+            entry: Parts of the cache entry by content encoding or metadata name
+            encoding: Content encoding accepted by the client
+
+        Returns:
+            Response: The server's response with the body in the content encoding
+        """
+        etag = make_etag(entry[ETAG].decode(), encoding)
+        headers = {'Vary': 'Accept-Encoding', 'ETag': etag, 'Surrogate-Key': entry[TAGS].decode()}
+        if etag_matches(self.if_none_match, etag):
+            return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+        if encoding != IDENTITY:
+            headers['Content-Encoding'] = encoding
+        body = entry[encoding] if encoding in entry else encode(entry[IDENTITY], encoding)
+        return Response(content=body, media_type='application/json', headers=headers)
 
     class Config:
         """Validation settings."""
@@ -41,24 +133,27 @@ class BaseService(ElasticStorage, RedisStorage, abc.ABC):
 
 def redis_cache(expire: int) -> Callable:
     """
-    Decorate to fetch and cache cinema data in the Redis cache.
+    Decorate to fetch and cache cinema data in the Redis cache along with its precompressed copies.
 
     Args:
         expire (int): Cache expiration time
 
     Returns:
-        Callable: Decorated function that retrieves a representation of cinema data.
+        Callable: Decorated function that retrieves the response body in the content encoding accepted by the client.
     """
     def decorator(get) -> Callable:
         @wraps(get)
-        async def wrapper(*args, **kwargs) -> BaseModel:
-            self: BaseService = args[0]
-            data = await self.get_redis_value(self.redis_key)
-            if not data:
-                data = parse_obj_as(
-                    self.model, obj=await get(*args, **kwargs),
-                ).json()
-                await self.set_redis_value(self.redis_key, data, expire=expire)
-            return parse_raw_as(self.model, b=data)
+        async def wrapper(*args, **kwargs) -> Response:
+            service: BaseService = args[0]
+            encoding = negotiate(service.accept_encoding)
+            parts = [ETAG, TAGS, encoding]
+            entry = {} if service.cache_refresh else dict(zip(parts, await service.get_redis_values(
+                [entry_key(service.redis_key, part) for part in parts],
+            )))
+            if not all(entry.get(part) for part in parts):
+                obj = parse_obj_as(service.model, obj=await get(*args, **kwargs))
+                entry = await service.build_cache_entry(obj, await service.serialize(obj))
+                await service.set_cache_entries({service.redis_key: entry}, expire=expire)
+            return service.make_response(entry, encoding)
         return wrapper
     return decorator
@@ -0,0 +1,121 @@
+import hashlib
+from typing import Dict, List, Optional
+
+from core.compression import CODECS, IDENTITY
+from core.config import CinemaObject
+from models.film import Film
+
+ETAG = 'etag'
+TAGS = 'tags'
+PARTS = (*CODECS, ETAG, TAGS)
+
+
+def entry_key(key: str, part: str) -> str:
+    """
+    Get the key of a part of the cache entry: the response body in a content encoding or its metadata.
+
+    Args:
+        key: Key of the uncompressed response body
+        part: Content encoding of the body or the name of the metadata
+
+    Returns:
+        str: Key of the part of the cache entry
+    """
+    return key if part == IDENTITY else f'{key}::{part}'
+
+
+def entry_parts(key: str, entry: Dict[str, bytes]) -> Dict[str, bytes]:
+    """
+    Get the parts of the cache entry by their keys.
+
+    Args:
+        key: Key of the uncompressed response body
+        entry: Parts of the cache entry by content encoding or metadata name
+
+    Returns:
+        Dict[str, bytes]: Parts of the cache entry by their keys
+    """
+    return {entry_key(key, part): body for part, body in entry.items()}
+
+
+def count_entries(keys: List[str]) -> int:
+    """
+    Count the cache entries that the keys of their parts belong to.
+
+    Args:
+        keys: Keys of the response bodies in every content encoding and of their metadata
+
+    Returns:
+        int: Number of distinct cache entries
+    """
+    entries = set()
+    for key in keys:
+        entry, _, part = key.rpartition('::')
+        entries.add(entry if part in PARTS else key)
+    return len(entries)
+
+
+def make_digest(body: bytes) -> bytes:
+    """
+    Compute the hash of the uncompressed response body for its entity tag.
+
+    Args:
+        body: Uncompressed response body
+
+    Returns:
+        bytes: Hexadecimal hash of the body
+    """
+    return hashlib.blake2b(body, digest_size=16).hexdigest().encode()
+
+
+def make_etag(digest: str, encoding: str) -> str:
+    """
+    Get a strong entity tag of the response body.
+
+    Args:
+        digest: Hash of the uncompressed response body
+        encoding: Content encoding of the representation
+
+    Returns:
+        str: Quoted entity tag, distinct for every content encoding of the same body
+    """
+    return f'"{digest}"' if encoding == IDENTITY else f'"{digest}-{encoding}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check whether the client already has the representation with the entity tag.
+
+    Args:
+        if_none_match: Value of the If-None-Match header
+        etag: Entity tag of the current representation
+
+    Returns:
+        bool: True if the representation has not been modified
+    """
+    if not if_none_match:
+        return False
+    tags = {tag.strip() for tag in if_none_match.split(',')}
+    tags |= {tag[2:] for tag in tags if tag.startswith('W/')}
+    return '*' in tags or etag in tags
+
+
+def object_surrogate_keys(obj: CinemaObject, index: str) -> List[str]:
+    """
+    Get the surrogate keys of a single cinema object: the object itself and the objects nested in it.
+
+    Args:
+        obj: Cinema object
+        index: Index of the object
+
+    Returns:
+        List[str]: Surrogate keys in the form of an index and an ID separated by a colon
+    """
+    keys = [f'{index}:{obj.uuid}']
+    if isinstance(obj, Film):
+        keys.extend(f'genres:{genre.uuid}' for genre in obj.genre or [])
+        keys.extend(
+            f'persons:{person.uuid}'
+            for people in (obj.directors, obj.actors, obj.writers) for person in people or []
+        )
+    return keys
@@ -1,5 +1,5 @@
 import abc
-from typing import Dict, List, Optional
+from typing import ClassVar, Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -28,6 +28,7 @@ class FilterFilms(BaseFilter):
     """Abstract class for film filters."""
 
     id: Optional[UUID]
+    index: ClassVar[str]
 
     @abc.abstractmethod
     async def get_query(self, service: BaseService) -> Dict:
@@ -51,6 +52,7 @@ class FilterGenreFilms(FilterFilms):
     """Class for filtering films by genre."""
 
     id: Optional[UUID] = Field(alias='genre_id')
+    index: ClassVar[str] = 'genres'
 
     async def get_query(self, service: BaseService) -> Dict:
         """
@@ -70,6 +72,7 @@ class FilterPersonFilms(FilterFilms):
     """Class for filtering films by a person."""
 
     id: Optional[UUID] = Field(alias='person_id')
+    index: ClassVar[str] = 'persons'
 
     async def get_query(self, service: BaseService) -> Dict:
         """
@@ -82,7 +85,7 @@ class FilterPersonFilms(FilterFilms):
             Dict: Query with person filtering
         """
         person = await service.get_elastic_doc(index='persons', doc_id=self.id)
-        return queries.films_by_person(person, fields=['id', 'title', 'imdb_rating'])
+        return queries.films_by_person(person)
 
 
 class QuerySearch(BaseFilter):
@@ -91,6 +94,15 @@ class QuerySearch(BaseFilter):
     q_string: Optional[str]
     fields: List[str] = Field(default_factory=list)
 
+    def get_query(self) -> Dict:
+        """
+        Retrieve a query for full-text search scored by relevance.
+
+        Returns:
+            Dict: Query with full-text search
+        """
+        return queries.search_data(query_str=str(self), fields=self.fields)
+
     def __str__(self) -> str:
         """
         Return the search query string as the provided search string.
@@ -99,3 +111,25 @@ class QuerySearch(BaseFilter):
             str: The search query string
         """
         return self.q_string or ''
+
+
+class QuerySuggest(QuerySearch):
+    """Class for autocompletion filter of the text being typed."""
+
+    def get_query(self) -> Dict:
+        """
+        Retrieve a query for autocompletion by the first search field.
+
+        Returns:
+            Dict: Query with prefix search
+        """
+        return queries.suggest_data(query_str=self.q_string or '', field=self.fields[0])
+
+    def __str__(self) -> str:
+        """
+        Return the text being typed, distinguished from the full-text search query of the same text.
+
+        Returns:
+            str: The text with the suggest prefix
+        """
+        return f'suggest:{self.q_string}'
@@ -1,11 +1,21 @@
-from typing import List, Type
+from typing import Dict, List, Type, Union
+from uuid import UUID
 
-from services.base import BaseService, redis_cache
-from services.mixins import QuerysetMixin, SingleObjectMixin
+import orjson
+from fastapi import Response
+
+from services.base import BaseService
+from services.entries import ETAG, TAGS, entry_key, etag_matches, make_etag
+from services.mixins import FragmentMixin, QuerysetMixin, get_source
+from core.bulkhead import BULKHEADS
+from core.compression import IDENTITY, negotiate
 from core.config import CONFIG, CinemaObject, CinemaObjectList
 
+# The uncompressed body of a list is joined from the fragments, so the list key keeps the IDs of the list instead.
+IDS = 'ids'
+
 
-class ListService(BaseService, SingleObjectMixin, QuerysetMixin):
+class ListService(BaseService, FragmentMixin, QuerysetMixin):
     """Service for representing a list of cinema objects."""
 
     model: Type[CinemaObjectList]
@@ -24,18 +34,83 @@ class ListService(BaseService, SingleObjectMixin, QuerysetMixin):
         ]
         return '{index}::{params}'.format(index=self.index, params='::'.join(params))
 
-    @redis_cache(expire=CONFIG.fastapi.cache_expire_in_seconds)
-    async def get(self) -> List[CinemaObject]:
+    def surrogate_keys(self, obj: Union[CinemaObject, CinemaObjectList]) -> List[str]:
+        """
+        Get the surrogate keys of the list, including the cinema object it is filtered by.
+
+        Args:
+            obj: List of cinema objects
+
+        Returns:
+            List[str]: Unique surrogate keys in the form of an index and an ID separated by a colon
+        """
+        keys = super().surrogate_keys(obj)
+        if self.filter:
+            keys.append(f'{self.filter.index}:{self.filter}')
+        return keys
+
+    async def get(self) -> Response:
         """
         Retrieve a list of cinema objects.
 
+        The list is cached under its key as the IDs of its objects next to the entity tag and the precompressed copies
+        of the assembled body. The objects are joined from their cached fragments only when the client has neither the
+        current representation nor accepts a precompressed one.
+
         Returns:
-            List[CinemaObject]: List of cinema objects
+            Response: JSON array of the cinema objects
         """
-        queryset = await self.filter_queryset(self.get_queryset())
-        page = self.paginate_queryset(queryset)
-        data = await self.search_elastic_docs(self.index, page)
-        obj_list = [
-            await self.get_object(item, self.model.item) for item in data
-        ]
-        return obj_list
+        encoding = negotiate(self.accept_encoding)
+        entry = {} if self.cache_refresh else await self.get_cached_list(encoding)
+        if not entry:
+            entry = await self.build_list_entry()
+        elif encoding not in entry and not etag_matches(self.if_none_match, make_etag(entry[ETAG].decode(), encoding)):
+            ids = [UUID(obj_id) for obj_id in orjson.loads(entry[IDS])]
+            entry[IDENTITY] = self.join_fragments(await self.get_fragments(self.model.item, ids))
+        return self.make_response(entry, encoding)
+
+    async def get_cached_list(self, encoding: str) -> Dict[str, bytes]:
+        """
+        Retrieve the cached list with its metadata and its body in the content encoding, if it is precompressed.
+
+        Args:
+            encoding: Content encoding accepted by the client
+
+        Returns:
+            Dict[str, bytes]: Parts of the cached list by content encoding or metadata name, empty if it is not cached
+        """
+        parts = list(dict.fromkeys((IDENTITY, ETAG, TAGS, encoding)))
+        cached = await self.get_redis_values([entry_key(self.redis_key, part) for part in parts])
+        entry = {IDS if part == IDENTITY else part: body for part, body in zip(parts, cached) if body}
+        return entry if {IDS, ETAG, TAGS} <= entry.keys() else {}
+
+    async def build_list_entry(self) -> Dict[str, bytes]:
+        """
+        Search for the list, and cache its objects as fragments and the list as their IDs with its compressed copies.
+
+        Returns:
+            Dict[str, bytes]: Parts of the cache entry of the list by content encoding or metadata name
+        """
+        obj_list = await self.search_objects()
+        entries = self.build_fragments(obj_list)
+        body = self.join_fragments(list(entries.values()))
+        entry = await self.build_cache_entry(self.model.parse_obj(obj_list), body)
+        entries[self.redis_key] = {**entry, IDENTITY: orjson.dumps([obj.uuid for obj in obj_list])}
+        await self.set_cache_entries(entries, expire=CONFIG.fastapi.cache_expire_in_seconds)
+        return entry
+
+    async def search_objects(self) -> List[CinemaObject]:
+        """
+        Search Elasticsearch for the cinema objects of the page.
+
+        Full-text searches and suggestions run in their own bulkhead, so that a burst of them does not starve the
+        cheap list pages.
+
+        Returns:
+            List[CinemaObject]: Cinema objects of the page
+        """
+        async with BULKHEADS['search' if self.query else 'list']:
+            queryset = await self.filter_queryset(self.get_queryset())
+            page = self.paginate_queryset(queryset)
+            data = await self.search_elastic_docs(self.index, page, source=get_source(self.model.item))
+        return await self.get_objects(data, self.model.item)
@@ -1,71 +1,158 @@
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Set, Tuple, Type, cast
+from uuid import UUID
 
 from pydantic import BaseModel
 
+from services.entries import IDENTITY, TAGS, entry_key, object_surrogate_keys
 from services.filters import FilterFilms, QuerySearch
-from core.config import CinemaObject
+from core.bulkhead import BULKHEADS
+from core.config import CONFIG, CinemaObject
 from db import queries
-from models.film import Film
+from models.base import construct
+from models.film import Film, GenreInFilm, PersonInFilm
+from models.genre import Genre
 from models.person import Person, RoleChoices
 
+ENRICHMENT_SOURCE: Dict[Type[BaseModel], Tuple[str, ...]] = {
+    Film: ('genre', 'director'),
+    Person: ('full_name',),
+}
+
+# Fields of the models filled from the other indices.
+ENRICHED_FIELDS: Dict[Type[BaseModel], Set[str]] = {
+    Film: {'genre', 'directors'},
+    Person: {'role', 'film_ids'},
+}
+
+# Index and model of the objects embedded in place of the brief references, by the model and the relation.
+Relation = Tuple[str, Type[CinemaObject]]
+RELATIONS: Dict[Type[BaseModel], Dict[str, Relation]] = {
+    Film: {
+        'genre': ('genres', Genre),
+        'directors': ('persons', Person),
+        'actors': ('persons', Person),
+        'writers': ('persons', Person),
+    },
+}
+
+# Fields of the documents by the model, collected once per model. A dictionary keyed by the model class keeps the
+# argument typed, unlike lru_cache, whose wrapper accepts only arguments that mypy sees as hashable.
+SOURCES: Dict[Type[BaseModel], Tuple[str, ...]] = {}
+
+
+def get_source(model: Type[BaseModel]) -> Tuple[str, ...]:
+    """
+    Get the fields of Elasticsearch documents needed to build the model, including the fields used for enrichment.
+
+    Args:
+        model: The model for which the documents are retrieved
+
+    Returns:
+        Tuple[str, ...]: Names of the document fields
+    """
+    if model not in SOURCES:
+        fields = {'id', *ENRICHMENT_SOURCE.get(model, ())}
+        for name, field in model.__fields__.items():
+            fields.update({name, field.alias})
+        SOURCES[model] = tuple(sorted(fields))
+    return SOURCES[model]
+
 
 class SingleObjectMixin(BaseModel):
     """Mixin for generating a movie theater object from Elasticsearch database."""
 
-    async def get_object(self, data: Dict, model: Type[CinemaObject]) -> CinemaObject:
+    async def get_object(self, data: Dict, model: Type[CinemaObject], enrich: bool = True) -> CinemaObject:
         """
         Retrieve object and fetch data from other Elasticsearch indexes for the corresponding model.
 
+        The related data of a single object is fetched in its own pool, so that the detail pages do not wait behind
+        the enrichment of the lists.
+
         Args:
             data: Data to be processed
             model: The model for which the object should be retrieved
+            enrich: Whether to fetch the fields filled from the other indexes
 
         Returns:
             CinemaObject: Movie theater object
         """
-        if model == Film:
-            data.update(await self.add_to_film(data))
-        elif model == Person:
-            data.update(await self.add_to_person(data))
-        return model(uuid=data['id'], **data)
+        found = await self.get_objects([data], model, enrich, bulkhead='related')
+        return found[0]
 
-    async def add_to_film(self, film: Dict) -> Dict:
+    async def get_objects(
+        self, data: List[Dict], model: Type[CinemaObject], enrich: bool = True, bulkhead: str = 'enrichment',
+    ) -> List[CinemaObject]:
         """
-        Add genre and director information to the movie data from the appropriate indexes.
+        Retrieve objects, fetching data from other Elasticsearch indexes for all of them in a single request.
+
+        The data of our strictly mapped indices is trusted, so the objects are validated only in debug mode.
 
         Args:
-            film (Dict): Movie data.
+            data: Data of the objects to be processed
+            model: The model for which the objects should be retrieved
+            enrich: Whether to fetch the fields filled from the other indexes
+            bulkhead: Name of the pool in which the other indexes are requested
 
         Returns:
-            Dict: Movie genres and directors.
+            List[CinemaObject]: Movie theater objects
         """
-        genres = await self.search_elastic_docs(  # type: ignore[attr-defined]
-            index='genres', queryset={'body': queries.genres_by_film(film)},
-        )
-        directors = await self.search_elastic_docs(  # type: ignore[attr-defined]
-            index='persons', queryset={'body': queries.directors_by_film(film)},
-        )
-        return {'genre': genres, 'directors': directors}
+        if enrich and model == Film:
+            additions = await self.add_to_films(data, bulkhead)
+        elif enrich and model == Person:
+            additions = await self.add_to_persons(data, bulkhead)
+        else:
+            additions = [{} for _ in data]
+        data = [{**item, **addition, 'uuid': item['id']} for item, addition in zip(data, additions)]
+        if CONFIG.fastapi.debug:
+            return [model(**item) for item in data]
+        return [cast(CinemaObject, construct(model, item)) for item in data]
 
-    async def add_to_person(self, person: Dict) -> Dict:
+    async def add_to_films(self, films: List[Dict], bulkhead: str = 'enrichment') -> List[Dict]:
         """
-        Add information about the persona's role and the movies related to the persona.
+        Add genre and director information to the movies data from the appropriate indexes.
 
         Args:
-            person: Persona data
+            films (List[Dict]): Movies data.
+            bulkhead (str): Name of the pool in which the indexes are requested.
 
         Returns:
-            Dict: Role and IDs of movies featuring the persona
+            List[Dict]: Genres and directors of each movie.
         """
-        films = await self.search_elastic_docs(  # type: ignore[attr-defined]
-            index='movies', queryset={'body': queries.films_by_person(
-                person, fields=['id', 'actors_names', 'writers_names', 'director'],
-            )},
-        )
-        return {
-            'film_ids': [film['id'] for film in films],
-            'role': self.parse_role(person['full_name'], films),
-        }
+        async with BULKHEADS[bulkhead]:
+            found = await self.msearch_elastic_docs([  # type: ignore[attr-defined]
+                search for film in films for search in (
+                    ('genres', {**queries.genres_by_film(film), '_source': get_source(GenreInFilm)}),
+                    ('persons', {**queries.directors_by_film(film), '_source': get_source(PersonInFilm)}),
+                )
+            ])
+        return [
+            {'genre': genres, 'directors': directors}
+            for genres, directors in zip(found[::2], found[1::2])
+        ]
+
+    async def add_to_persons(self, persons: List[Dict], bulkhead: str = 'enrichment') -> List[Dict]:
+        """
+        Add information about the personas' roles and the movies related to the personas.
+
+        Args:
+            persons: Personas data
+            bulkhead: Name of the pool in which the index is requested
+
+        Returns:
+            List[Dict]: Role and IDs of movies featuring each persona
+        """
+        async with BULKHEADS[bulkhead]:
+            found = await self.msearch_elastic_docs([  # type: ignore[attr-defined]
+                ('movies', queries.films_by_person(person, fields=['id', 'actors_names', 'writers_names', 'director']))
+                for person in persons
+            ])
+        return [
+            {
+                'film_ids': [film['id'] for film in films],
+                'role': self.parse_role(person['full_name'], films),
+            }
+            for person, films in zip(persons, found)
+        ]
 
     def parse_role(self, person_name: str, films: List[Dict]) -> str:
         """
@@ -80,12 +167,128 @@ class SingleObjectMixin(BaseModel):
         """
         person_roles = [
             RoleChoices[role].value
-            for film in films if film.pop('id')
-            for role, names in film.items() if person_name in names
+            for film in films
+            for role, names in film.items() if role != 'id' and person_name in names
         ]
         return max(person_roles, key=person_roles.count, default='')
 
 
+class FragmentMixin(SingleObjectMixin):
+    """Mixin for caching every cinema object as a JSON fragment and assembling responses from the fragments."""
+
+    def fragment_key(self, model: Type[CinemaObject], obj_id: UUID, index: Optional[str] = None) -> str:
+        """
+        Get the key of the cinema object fragment in the Redis cache, shared by all pages with this object.
+
+        Args:
+            model: The model in which the object is represented
+            obj_id: ID of the cinema object
+            index: Index of the object, the index of the service if not set
+
+        Returns:
+            str: Index, model representation and ID separated by colons
+        """
+        return '{index}::{fragment}::{id}'.format(
+            index=index or self.index, fragment=model.fragment, id=obj_id,  # type: ignore[attr-defined, union-attr]
+        )
+
+    def build_fragments(
+        self, cinema_objects: List[CinemaObject], index: Optional[str] = None,
+    ) -> Dict[str, Dict[str, bytes]]:
+        """
+        Serialize cinema objects into fragments along with their surrogate keys.
+
+        Args:
+            cinema_objects: Cinema objects
+            index: Index of the objects, the index of the service if not set
+
+        Returns:
+            Dict[str, Dict[str, bytes]]: Parts of the fragments by the fragment key
+        """
+        return {
+            self.fragment_key(type(obj), obj.uuid, index): {
+                IDENTITY: obj.json().encode(),
+                TAGS: ' '.join(object_surrogate_keys(obj, index or self.index)).encode(),  # type: ignore[attr-defined]
+            }
+            for obj in cinema_objects
+        }
+
+    async def get_fragments(
+        self, model: Type[CinemaObject], ids: List[UUID], index: Optional[str] = None,
+    ) -> List[Dict[str, bytes]]:
+        """
+        Retrieve fragments from the cache with one request, and the missing objects from Elasticsearch with another.
+
+        Args:
+            model: The model in which the objects are represented
+            ids: IDs of the cinema objects
+            index: Index of the objects, the index of the service if not set
+
+        Returns:
+            List[Dict[str, bytes]]: Parts of the fragments of the found objects in the order of the IDs
+        """
+        keys = [self.fragment_key(model, obj_id, index) for obj_id in ids]
+        fragments = await self.get_cached_fragments(keys)
+        missing = [obj_id for obj_id, key in zip(ids, keys) if key not in fragments]
+        if missing:
+            fragments.update(await self.fill_fragments(model, missing, index))
+        return [fragments[key] for key in keys if key in fragments]
+
+    async def get_cached_fragments(self, keys: List[str]) -> Dict[str, Dict[str, bytes]]:
+        """
+        Retrieve the fragments from the cache with one request.
+
+        Args:
+            keys: Keys of the fragments
+
+        Returns:
+            Dict[str, Dict[str, bytes]]: Parts of the cached fragments by the fragment key
+        """
+        cached = await self.get_redis_values(  # type: ignore[attr-defined]
+            [entry_key(key, part) for key in keys for part in (IDENTITY, TAGS)],
+        )
+        return {
+            key: {IDENTITY: body, TAGS: tags}
+            for key, body, tags in zip(keys, cached[::2], cached[1::2]) if body and tags
+        }
+
+    async def fill_fragments(
+        self, model: Type[CinemaObject], ids: List[UUID], index: Optional[str] = None,
+    ) -> Dict[str, Dict[str, bytes]]:
+        """
+        Retrieve the objects missing from the cache from Elasticsearch with one request and cache their fragments.
+
+        Args:
+            model: The model in which the objects are represented
+            ids: IDs of the missing cinema objects
+            index: Index of the objects, the index of the service if not set
+
+        Returns:
+            Dict[str, Dict[str, bytes]]: Parts of the fragments of the found objects by the fragment key
+        """
+        async with BULKHEADS['fills']:
+            data = await self.get_elastic_docs(  # type: ignore[attr-defined]
+                index or self.index, ids, source=get_source(model),  # type: ignore[attr-defined]
+            )
+        fills = self.build_fragments(await self.get_objects(data, model), index)
+        await self.set_cache_entries(  # type: ignore[attr-defined]
+            fills, expire=CONFIG.fastapi.cache_expire_in_seconds,
+        )
+        return fills
+
+    def join_fragments(self, fragments: List[Dict[str, bytes]]) -> bytes:
+        """
+        Assemble a JSON array from the serialized fragments without parsing them.
+
+        Args:
+            fragments: Parts of the fragments
+
+        Returns:
+            bytes: JSON array of the cinema objects
+        """
+        return b''.join((b'[', b','.join(fragment[IDENTITY] for fragment in fragments), b']'))
+
+
 class QuerysetMixin(BaseModel):
     """Mixin for forming a query to ElasticSearch database."""
 
@@ -125,7 +328,7 @@ class QuerysetMixin(BaseModel):
             )
         elif self.query:
             queryset.update(
-                body=queries.search_data(query_str=str(self.query), fields=self.query.fields),
+                body=self.query.get_query(),
             )
         return queryset
 
@@ -1,26 +1,105 @@
-from typing import Optional, Type
+import asyncio
+from typing import Dict, List, Optional, Tuple, Type, Union
 from uuid import UUID
 
+import orjson
+from fastapi import Response
+
 from services.base import BaseService, redis_cache
-from services.mixins import SingleObjectMixin
-from core.config import CONFIG, CinemaObject
+from services.entries import ETAG, TAGS, make_digest
+from services.mixins import ENRICHED_FIELDS, ENRICHMENT_SOURCE, RELATIONS, FragmentMixin, get_source
+from core.bulkhead import BULKHEADS
+from core.compression import IDENTITY, negotiate
+from core.config import CONFIG, CinemaObject, CinemaObjectList
 
 
-class RetrieveService(BaseService, SingleObjectMixin):
+class RetrieveService(BaseService, FragmentMixin):
     """Service for retrieving a cinema object by ID."""
 
     model: Type[CinemaObject]
     id: Optional[UUID]
+    fields: Optional[List[str]] = None
+    include: Optional[List[str]] = None
 
     @property
     def redis_key(self) -> str:
         """
         Get the key for data in the Redis cache in the format of index and the ID of the requested document.
 
+        The sparse fieldset and the embedded relations, if requested, are appended to the key.
+
         Returns:
             str: Index and ID separated by colons
         """
-        return '{index}::id::{id}'.format(index=self.index, id=self.id)
+        key = '{index}::id::{id}'.format(index=self.index, id=self.id)
+        if self.fields:
+            key += '::fields::{fields}'.format(fields=','.join(self.fields))
+        if self.include:
+            key += '::include::{include}'.format(include=','.join(self.include))
+        return key
+
+    def needs_enrichment(self) -> bool:
+        """
+        Check whether the requested fieldset or relations need the fields filled from the other indexes.
+
+        Validated models need complete objects, so they are always enriched in debug mode.
+
+        Returns:
+            bool: True if the object should be enriched
+        """
+        if not self.fields or CONFIG.fastapi.debug:
+            return True
+        return bool(ENRICHED_FIELDS.get(self.model, set()) & {*self.fields, *(self.include or [])})
+
+    def get_source(self) -> Tuple[str, ...]:
+        """
+        Get the fields of the document needed for the requested fieldset and relations.
+
+        Validated models need complete documents, so the fieldset does not narrow them in debug mode.
+
+        Returns:
+            Tuple[str, ...]: Names of the document fields
+        """
+        source = get_source(self.model)
+        if not self.fields or CONFIG.fastapi.debug:
+            return source
+        enrichment = ENRICHMENT_SOURCE.get(self.model, ()) if self.needs_enrichment() else ()
+        needed = {'id', *self.fields, *(self.include or []), *enrichment}
+        return tuple(field for field in source if field in needed)
+
+    async def serialize(self, obj: Union[CinemaObject, CinemaObjectList]) -> bytes:
+        """
+        Serialize the cinema object with the requested fields only, embedding the related objects.
+
+        The related objects are taken from their cached fragments, with one lookup per relation run concurrently.
+
+        Args:
+            obj: Cinema object
+
+        Returns:
+            bytes: JSON representation of the object
+        """
+        if not self.fields and not self.include:
+            return await super().serialize(obj)
+        include = self.include or []
+        data = obj.dict(include={'uuid', *self.fields, *include}) if self.fields else obj.dict()
+        data.update(zip(include, await asyncio.gather(*[self.embed(obj, relation) for relation in include])))
+        return orjson.dumps(data)
+
+    async def embed(self, obj: Union[CinemaObject, CinemaObjectList], relation: str) -> List[Dict]:
+        """
+        Get the full related objects in place of their brief references.
+
+        Args:
+            obj: Cinema object
+            relation: Name of the field with the references
+
+        Returns:
+            List[Dict]: Data of the related objects from their cached fragments
+        """
+        index, model = RELATIONS[self.model][relation]
+        fragments = await self.get_fragments(model, [item.uuid for item in getattr(obj, relation) or []], index)
+        return [orjson.loads(fragment[IDENTITY]) for fragment in fragments]
 
     @redis_cache(expire=CONFIG.fastapi.cache_expire_in_seconds)
     async def get(self) -> CinemaObject:
@@ -30,6 +109,39 @@ class RetrieveService(BaseService, SingleObjectMixin):
         Returns:
             CinemaObject: The cinema object
         """
-        data = await self.get_elastic_doc(self.index, self.id)
-        obj = await self.get_object(data, self.model)
+        async with BULKHEADS['detail']:
+            data = await self.get_elastic_doc(self.index, self.id, source=self.get_source())
+        obj = await self.get_object(data, self.model, enrich=self.needs_enrichment())
         return obj
+
+
+class MultiRetrieveService(BaseService, FragmentMixin):
+    """Service for retrieving several cinema objects by their IDs."""
+
+    model: Type[CinemaObject]
+    ids: List[UUID]
+
+    @property
+    def redis_key(self) -> str:
+        """
+        Get the key for data in the Redis cache in the format of index and the IDs of the requested documents.
+
+        Returns:
+            str: Index and IDs separated by colons
+        """
+        return '{index}::ids::{ids}'.format(index=self.index, ids=','.join(str(obj_id) for obj_id in self.ids))
+
+    async def get(self) -> Response:
+        """
+        Retrieve cinema objects by joining their cached fragments.
+
+        Returns:
+            Response: JSON array of the found cinema objects in the order of the IDs
+        """
+        fragments = await self.get_fragments(self.model, self.ids)
+        body = self.join_fragments(fragments)
+        surrogate_keys = dict.fromkeys(tag for fragment in fragments for tag in fragment[TAGS].split())
+        return self.make_response(
+            {IDENTITY: body, ETAG: make_digest(body), TAGS: b' '.join(surrogate_keys)},
+            negotiate(self.accept_encoding),
+        )
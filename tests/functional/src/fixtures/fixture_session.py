@@ -1,4 +1,5 @@
-from typing import AsyncGenerator, Callable, Dict, List, Union
+import http
+from typing import AsyncGenerator, Callable, Dict, List, Optional, Union
 
 import aiohttp
 import jwt
@@ -13,7 +14,7 @@ from settings import TEST_CONFIG, QueryParams
 class HttpResponse(BaseModel):
     """Class representing the server's HTTP response to a client request."""
     
-    body: Union[Dict, List[Dict]]
+    body: Optional[Union[Dict, List[Dict]]]
     headers: CIMultiDictProxy
     status: int
 
@@ -74,14 +75,34 @@ def make_get_request(session: aiohttp.ClientSession) -> Callable:
     Returns:
         Callable: Fixture function to fetch data from the HTTP server.
     """
-    async def inner(path: str, **params) -> HttpResponse:
+    async def inner(path: str, headers: Optional[Dict] = None, **params) -> HttpResponse:
         async with session.get(
             url=get_url_path(path=path),
             params=get_query_params(**params),
+            headers=headers,
         ) as response:
+            content = await response.read()
             return HttpResponse(
-                body=await response.json(),
+                body=await response.json() if content and response.status != http.HTTPStatus.NOT_MODIFIED else None,
                 headers=response.headers,
                 status=response.status,
             )
     return inner
+
+
+@pytest.fixture(scope='session')
+def assert_calls() -> Callable:
+    """
+    Fixture with a nested function for failing a test on a change in the number of database calls.
+
+    Returns:
+        Callable: Fixture function to check the debug headers of the response against the expected number of calls.
+    """
+    def inner(response: HttpResponse, elastic: int, redis: Optional[int] = None):
+        assert 'X-Elastic-Calls' in response.headers, 'Debug headers are disabled, set CALLS_HEADERS=true'
+        calls = int(response.headers['X-Elastic-Calls'])
+        assert calls == elastic, f'{calls} Elasticsearch calls made, {elastic} expected'
+        if redis is not None:
+            calls = int(response.headers['X-Redis-Calls'])
+            assert calls == redis, f'{calls} Redis calls made, {redis} expected'
+    return inner
@@ -0,0 +1,38 @@
+import http
+from typing import Callable
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    'path, page_size, calls',
+    [
+        ('/films', 7, 1),
+        ('/films', 43, 1),
+        ('/persons', 7, 2),
+        ('/persons', 43, 2),
+        ('/genres', 7, 1),
+    ],
+)
+@pytest.mark.asyncio
+async def test_list_calls(
+    path: str, page_size: int, calls: int,  # args
+    make_get_request: Callable, assert_calls: Callable,  # fixtures
+):
+    """
+    Test that the number of Elasticsearch calls of a list page does not grow with the page size.
+
+    The page is requested with no-cache, so that it is built from Elasticsearch and written back with one Redis call
+    even if an earlier test has cached it.
+
+    Args:
+        path: URL path
+        page_size: Number of objects on the page
+        calls: Expected number of Elasticsearch calls
+        make_get_request: Fixture for making HTTP requests
+        assert_calls: Fixture for checking the number of database calls
+    """
+    response = await make_get_request(path, headers={'Cache-Control': 'no-cache'}, page_size=page_size)
+
+    assert response.status == http.HTTPStatus.OK
+    assert_calls(response, elastic=calls, redis=1)
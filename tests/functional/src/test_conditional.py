@@ -0,0 +1,39 @@
+import http
+from typing import Callable
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    'path, index',
+    [
+        ('/films', 'movies'),
+        ('/films/{id}', 'movies'),
+        ('/persons/{id}', 'persons'),
+    ],
+)
+@pytest.mark.asyncio
+async def test_not_modified(
+    path: str, index: str,  # args
+    extract_data: Callable, make_get_request: Callable,  # fixtures
+):
+    """
+    Test that a conditional request with the entity tag of the cached response is answered without a body.
+
+    Args:
+        path: URL resource path
+        index: Elasticsearch index name
+        extract_data: Fixture for extracting data from the database
+        make_get_request: Fixture for making HTTP requests
+    """
+    expected = await extract_data(index)
+    path = path.format(id=expected['id'])
+
+    response = await make_get_request(path)
+    etag = response.headers['ETag']
+    conditional = await make_get_request(path, headers={'If-None-Match': etag})
+
+    assert response.status == http.HTTPStatus.OK
+    assert conditional.status == http.HTTPStatus.NOT_MODIFIED
+    assert conditional.headers['ETag'] == etag
+    assert not conditional.body
@@ -0,0 +1,33 @@
+import http
+from typing import Callable, Optional
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    'accept_encoding, content_encoding',
+    [
+        ('identity', None),
+        ('gzip', 'gzip'),
+        ('deflate, gzip;q=0.5', 'gzip'),
+        ('gzip, br;q=0', 'gzip'),
+    ],
+)
+@pytest.mark.asyncio
+async def test_content_encoding(
+    accept_encoding: str, content_encoding: Optional[str],  # args
+    make_get_request: Callable,  # fixtures
+):
+    """
+    Test that cached responses are sent in the content encoding accepted by the client.
+
+    Args:
+        accept_encoding: Content encodings accepted by the client
+        content_encoding: Expected content encoding of the response
+        make_get_request: Fixture for making HTTP requests
+    """
+    response = await make_get_request('/genres', headers={'Accept-Encoding': accept_encoding})
+
+    assert response.status == http.HTTPStatus.OK
+    assert response.headers.get('Content-Encoding') == content_encoding
+    assert response.body
@@ -0,0 +1,41 @@
+import http
+from typing import Callable
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_sparse_fieldset(extract_data: Callable, make_get_request: Callable):
+    """
+    Test that only the requested fields of the movie are returned.
+
+    Args:
+        extract_data: Fixture for extracting data from the database
+        make_get_request: Fixture for making HTTP requests
+    """
+    expected = await extract_data('movies')
+
+    response = await make_get_request(f'/films/{expected["id"]}?fields[films]=title,imdb_rating')
+
+    assert response.status == http.HTTPStatus.OK
+    assert response.body == {
+        'uuid': expected['id'], 'title': expected['title'], 'imdb_rating': expected['imdb_rating'],
+    }
+
+
+@pytest.mark.asyncio
+async def test_include(extract_data: Callable, make_get_request: Callable):
+    """
+    Test that the related persons are embedded in full into the movie.
+
+    Args:
+        extract_data: Fixture for extracting data from the database
+        make_get_request: Fixture for making HTTP requests
+    """
+    expected = await extract_data('movies')
+
+    response = await make_get_request(f'/films/{expected["id"]}?include=directors')
+
+    assert response.status == http.HTTPStatus.OK
+    assert {director['full_name'] for director in response.body['directors']} == set(expected['director'])
+    assert all('film_ids' in director for director in response.body['directors'])
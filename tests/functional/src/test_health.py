@@ -0,0 +1,35 @@
+import http
+
+import aiohttp
+import pytest
+
+from settings import TEST_CONFIG
+
+
+@pytest.mark.parametrize(
+    'path, status',
+    [
+        ('/health/live', 'alive'),
+        ('/health/ready', 'ready'),
+    ],
+)
+@pytest.mark.asyncio
+async def test_health(
+    path: str, status: str,  # args
+    session: aiohttp.ClientSession,  # fixtures
+):
+    """
+    Test liveness and readiness probes.
+
+    Args:
+        path: URL path of the probe
+        status: Expected probe status
+        session: Fixture with an HTTP client
+    """
+    url = '{url}{path}'.format(url=TEST_CONFIG.url.copy(update={'api_path': ''}), path=path)
+
+    async with session.get(url) as response:
+        body = await response.json()
+
+    assert response.status == http.HTTPStatus.OK
+    assert body['status'] == status
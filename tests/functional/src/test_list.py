@@ -1,7 +1,28 @@
 import http
-from typing import Callable
+import json
+from typing import Any, Callable
 
+import aioredis
 import pytest
+import zstandard
+
+# Header byte of the cached values compressed with zstd, other values are stored as plain JSON.
+ZSTD_HEADER = b'\x01'
+
+
+def decode_fragment(fragment: bytes) -> Any:
+    """
+    Decode a cached fragment, decompressing it if it was stored as a zstd frame.
+
+    Args:
+        fragment: Value of the fragment in the Redis cache
+
+    Returns:
+        Any: Data of the fragment
+    """
+    if fragment[:1] == ZSTD_HEADER:
+        fragment = zstandard.ZstdDecompressor().decompress(fragment[1:])
+    return json.loads(fragment)
 
 
 @pytest.mark.parametrize(
@@ -31,3 +52,32 @@ async def test_get_list(
 
     assert response.status == http.HTTPStatus.OK
     assert cache
+
+
+@pytest.mark.parametrize(
+    'path, fragment_key',
+    [
+        ('/films', 'movies::brief::{id}'),
+        ('/persons', 'persons::id::{id}'),
+        ('/genres', 'genres::id::{id}'),
+    ],
+)
+@pytest.mark.asyncio
+async def test_list_fragments(
+    path: str, fragment_key: str,  # args
+    make_get_request: Callable, redis: aioredis.Redis,  # fixtures
+):
+    """
+    Test that every object of the list is cached as a fragment shared with other pages.
+
+    Args:
+        path: URL path
+        fragment_key: Key of the object fragment in the Redis cache
+        make_get_request: Fixture for making HTTP requests
+        redis: Redis client fixture
+    """
+    response = await make_get_request(path, page_size=2)
+    fragments = await redis.mget(*[fragment_key.format(id=obj['uuid']) for obj in response.body])
+
+    assert response.status == http.HTTPStatus.OK
+    assert [decode_fragment(fragment) for fragment in fragments] == response.body
@@ -0,0 +1,36 @@
+import http
+import uuid
+from typing import Callable
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    'path, index',
+    [
+        ('/films', 'movies'),
+        ('/persons', 'persons'),
+        ('/genres', 'genres'),
+    ],
+)
+@pytest.mark.asyncio
+async def test_multiget(
+    path: str, index: str,  # args
+    extract_data: Callable, make_get_request: Callable,  # fixtures
+):
+    """
+    Test that several objects are returned by the list of their IDs, skipping the IDs that are not found.
+
+    Args:
+        path: URL resource path
+        index: Elasticsearch index name
+        extract_data: Fixture for extracting data from the database
+        make_get_request: Fixture for making HTTP requests
+    """
+    expected = await extract_data(index)
+    ids = ','.join([expected['id'], str(uuid.uuid4())])
+
+    response = await make_get_request(f'{path}?ids={ids}')
+
+    assert response.status == http.HTTPStatus.OK
+    assert [obj['uuid'] for obj in response.body] == [expected['id']]
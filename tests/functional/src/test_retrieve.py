@@ -35,4 +35,5 @@ async def test_get_by_id(
 
     assert response.status == http.HTTPStatus.OK
     assert response.body[check_field] == expected[check_field]
+    assert '{index}:{id}'.format(index=index, id=expected['id']) in response.headers['Surrogate-Key'].split()
     assert cache
@@ -0,0 +1,62 @@
+import http
+from typing import Callable, Optional
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    'path, index, search_field',
+    [
+        ('/films/suggest', 'movies', 'title'),
+        ('/persons/suggest', 'persons', 'full_name'),
+    ],
+)
+@pytest.mark.asyncio
+async def test_get_suggest(
+    path: str, index: str, search_field: str,  # args
+    extract_data: Callable, make_get_request: Callable,  # fixtures
+):
+    """
+    Test autocompletion by the beginning of the text being typed.
+
+    Args:
+        path: Path to the URL resource
+        index: Name of the Elasticsearch index
+        search_field: The field of the object to complete
+        extract_data: Fixture that extracts data from the database
+        make_get_request: Fixture that performs an HTTP request
+    """
+    expected = await extract_data(index)
+    prefix = expected[search_field][:-2]
+
+    response = await make_get_request(path, query=prefix)
+
+    assert response.status == http.HTTPStatus.OK
+    assert expected[search_field] in {data[search_field] for data in response.body}
+
+
+@pytest.mark.parametrize(
+    'path, query',
+    [
+        ('/films/suggest', None),
+        ('/films/suggest', ''),
+        ('/persons/suggest', None),
+        ('/persons/suggest', ''),
+    ],
+)
+@pytest.mark.asyncio
+async def test_suggest_without_query(
+    path: str, query: Optional[str],  # args
+    make_get_request: Callable,  # fixtures
+):
+    """
+    Test that autocompletion requires the beginning of the text being typed.
+
+    Args:
+        path: Path to the URL resource
+        query: Missing or empty text being typed
+        make_get_request: Fixture that performs an HTTP request
+    """
+    response = await make_get_request(path, query=query)
+
+    assert response.status == http.HTTPStatus.UNPROCESSABLE_ENTITY
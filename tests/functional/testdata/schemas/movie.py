@@ -1,4 +1,4 @@
-from elasticsearch_dsl import Float, InnerDoc, Keyword, MetaField, Nested, Text
+from elasticsearch_dsl import Float, InnerDoc, Keyword, MetaField, Nested, SearchAsYouType, Text
 
 from testdata.schemas.base import Mappings, Settings
 
@@ -18,7 +18,7 @@ class Movie(Mappings):
 
     imdb_rating = Float()
     genre = Keyword()
-    title = Text(analyzer='ru_en', fields={'raw': Keyword()})
+    title = Text(analyzer='ru_en', fields={'raw': Keyword(), 'suggest': SearchAsYouType()})
     description = Text(analyzer='ru_en')
     director = Text(analyzer='ru_en')
     actors_names = Text(analyzer='ru_en')
@@ -1,4 +1,4 @@
-from elasticsearch_dsl import Keyword, Text
+from elasticsearch_dsl import Keyword, SearchAsYouType, Text
 
 from testdata.schemas.base import Mappings, Settings
 
@@ -6,7 +6,7 @@ from testdata.schemas.base import Mappings, Settings
 class Person(Mappings):
     """Class for defining the document structure containing person data."""
 
-    full_name = Text(analyzer='ru_en', fields={'raw': Keyword()})
+    full_name = Text(analyzer='ru_en', fields={'raw': Keyword(), 'suggest': SearchAsYouType()})
 
     class Index(Settings):
         name = 'persons'
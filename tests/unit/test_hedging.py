@@ -0,0 +1,111 @@
+import asyncio
+from typing import AsyncIterator, Dict, List
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from elasticsearch import AsyncElasticsearch
+from elasticsearch.connection_pool import ConnectionSelector
+
+from core.hedging import Hedger
+from db.pooling import HedgingTransport
+
+STALL = 1
+
+
+class FirstSelector(ConnectionSelector):
+    """Selector that always picks the first node, so that a hedge is not spread to another node by chance."""
+
+    def select(self, connections: List) -> object:
+        """
+        Pick the first node.
+
+        Args:
+            connections: Connections to the live nodes
+
+        Returns:
+            object: Connection to the first node
+        """
+        return connections[0]
+
+
+class Node:
+    """Stand-in Elasticsearch node that records the reads it answers."""
+
+    def __init__(self, stalled: List[str]):
+        """
+        When initializing the class, it accepts the nodes that have stalled.
+
+        Args:
+            stalled: Addresses of the nodes that have stalled, shared by all nodes
+        """
+        self.stalled = stalled
+        self.reads = 0
+        self.address = ''
+
+    async def get_doc(self, request: web.Request) -> web.Response:
+        """
+        Answer a document read, stalling on the first read sent to any node.
+
+        Args:
+            request: Read of a document
+
+        Returns:
+            web.Response: The document with the address of the node
+        """
+        self.reads += 1
+        if not self.stalled:
+            self.stalled.append(self.address)
+            await asyncio.sleep(STALL)
+        doc_id = request.match_info['doc_id']
+        return web.json_response({'_id': doc_id, 'found': True, '_source': {'node': self.address}})
+
+
+async def start_node(node: Node) -> web.AppRunner:
+    """
+    Serve the stand-in node on a free local port.
+
+    Args:
+        node: Stand-in node
+
+    Returns:
+        web.AppRunner: Runner of the node
+    """
+    app = web.Application()
+    app.router.add_get('/{index}/_doc/{doc_id}', node.get_doc)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', 0).start()
+    node.address = '127.0.0.1:{port}'.format(port=runner.addresses[0][1])
+    return runner
+
+
+@pytest_asyncio.fixture
+async def nodes() -> AsyncIterator[Dict[str, Node]]:
+    """
+    Run two stand-in Elasticsearch nodes.
+
+    Yields:
+        Dict[str, Node]: Nodes by their address
+    """
+    stalled: List[str] = []
+    started = [Node(stalled), Node(stalled)]
+    runners = await asyncio.gather(*[start_node(node) for node in started])
+    yield {node.address: node for node in started}
+    await asyncio.gather(*[runner.cleanup() for runner in runners])
+
+
+@pytest.mark.asyncio
+async def test_hedge_on_other_node(nodes: Dict[str, Node]):
+    """Test that a read stalled on one node is hedged on the other node, which answers first."""
+    client = AsyncElasticsearch(hosts=list(nodes), transport_class=HedgingTransport, selector_class=FirstSelector)
+    hedger = Hedger(percentile=50, budget=1, window=10)
+    hedger.delay = 0.05
+    hedger.counters['reads'] = 1
+    doc = await hedger.run(lambda: client.get(index='movies', id='1'))
+    await client.close()
+    stalled = next(node for node in nodes.values() if node.address in node.stalled)
+
+    assert [node.reads for node in nodes.values()] == [1, 1]
+    assert doc['_source']['node'] != stalled.address
+    assert hedger.stats()['wins'] == 1
@@ -0,0 +1,64 @@
+import asyncio
+from http import HTTPStatus
+
+import pytest
+from fastapi import HTTPException
+
+from core.limiter import AdaptiveLimiter
+from db import reads
+
+
+async def slow_read() -> str:
+    """
+    Stand-in Elasticsearch read that takes long enough for other reads to arrive.
+
+    Returns:
+        str: Response of the read
+    """
+    await asyncio.sleep(0.05)
+    return 'response'
+
+
+@pytest.mark.asyncio
+async def test_coalesced_reads_are_not_shed(monkeypatch):
+    """
+    Test that identical reads join the admitted read, while only a new read beyond the limit is shed.
+
+    Args:
+        monkeypatch: Fixture for replacing the limiter
+    """
+    limiter = AdaptiveLimiter(initial=1, minimum=1, maximum=1, latency=1, decrease=0.5)
+    monkeypatch.setattr(reads, 'limiter', limiter)
+    outcomes = await asyncio.gather(
+        reads.coalesce('same', slow_read),
+        reads.coalesce('same', slow_read),
+        reads.coalesce('other', slow_read),
+        return_exceptions=True,
+    )
+
+    assert outcomes[:2] == ['response', 'response']
+    assert isinstance(outcomes[2], HTTPException)
+    assert outcomes[2].status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert limiter.stats() == {'limit': 1, 'inflight': 0, 'rejected': 1}
+
+
+@pytest.mark.asyncio
+async def test_shed_read_is_not_shared(monkeypatch):
+    """
+    Test that a shed read does not shed the identical read of another request once the limit allows it.
+
+    Args:
+        monkeypatch: Fixture for replacing the limiter
+    """
+    limiter = AdaptiveLimiter(initial=1, minimum=1, maximum=1, latency=1, decrease=0.5)
+    monkeypatch.setattr(reads, 'limiter', limiter)
+    limiter.acquire()
+    shed = asyncio.ensure_future(reads.coalesce('same', slow_read))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    limiter.release(latency=0)
+    served = await reads.coalesce('same', slow_read)
+
+    with pytest.raises(HTTPException):
+        await shed
+    assert served == 'response'
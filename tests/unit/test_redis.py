@@ -0,0 +1,54 @@
+import os
+
+import orjson
+
+from core.config import CONFIG
+from db.redis import ZSTD_HEADER, ZSTD_MAGIC, pack, unpack
+
+FILM = orjson.dumps({'uuid': '3d825f60-9fff-4dfe-b294-1a45fa1e115d', 'title': 'Star Wars', 'imdb_rating': 8.6})
+
+
+def test_small_value_is_not_packed():
+    """Test that a value below the threshold is stored as is."""
+    assert len(FILM) < CONFIG.redis.threshold
+    assert pack(FILM) == FILM
+
+
+def test_large_value_is_packed():
+    """Test that a large value is stored as the header byte followed by a zstd frame and read back."""
+    data = b'[' + b','.join([FILM] * 50) + b']'
+    packed = pack(data)
+
+    assert len(data) >= CONFIG.redis.threshold
+    assert packed[:1] == ZSTD_HEADER
+    assert packed[1:5] == ZSTD_MAGIC
+    assert len(packed) < len(data)
+    assert unpack(packed) == data
+
+
+def test_incompressible_value_is_not_packed():
+    """Test that a large value that does not shrink, such as a precompressed body, is stored as is."""
+    data = os.urandom(CONFIG.redis.threshold * 2)
+
+    assert pack(data) == data
+
+
+def test_disabled_threshold(monkeypatch):
+    """
+    Test that a zero threshold disables the compression.
+
+    Args:
+        monkeypatch: Fixture for changing the settings
+    """
+    monkeypatch.setattr(CONFIG.redis, 'threshold', 0)
+    data = FILM * 100
+
+    assert pack(data) == data
+
+
+def test_legacy_values_are_unpacked_as_is():
+    """Test that values without the header and the frame, like the ones written before compression, are returned."""
+    assert unpack(None) is None
+    assert unpack(b'') == b''
+    assert unpack(FILM) == FILM
+    assert unpack(ZSTD_HEADER + FILM) == ZSTD_HEADER + FILM
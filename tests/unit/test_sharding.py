@@ -0,0 +1,113 @@
+from typing import Dict, List, Optional
+
+import pytest
+
+from db.backends import MemoryBackend
+from db.sharding import HashRing, ShardedBackend
+
+NODES = ('first', 'second')
+KEYS = [f'movies::id::{number}' for number in range(100)]
+
+
+class RecordingBackend(MemoryBackend):
+    """Backend in memory that records the keys of every MGET."""
+
+    def __init__(self):
+        """When initializing the class, it creates an empty list of requests."""
+        super().__init__()
+        self.requests: List[List[str]] = []
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        """
+        Record the keys and get the values.
+
+        Args:
+            keys: The keys of the values
+
+        Returns:
+            List[Optional[bytes]]: The values in the order of the keys
+        """
+        self.requests.append(keys)
+        return await super().mget(keys)
+
+
+class FailingBackend(MemoryBackend):
+    """Backend in memory of a node that does not answer."""
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        """
+        Fail like an unavailable node.
+
+        Args:
+            keys: The keys of the values
+
+        Raises:
+            ConnectionRefusedError: Always
+        """
+        raise ConnectionRefusedError('Connection refused')
+
+
+def make_backend(**nodes: MemoryBackend) -> ShardedBackend:
+    """
+    Make a sharded backend over the nodes, the recording ones if not set.
+
+    Args:
+        nodes: Backends by the name of the node
+
+    Returns:
+        ShardedBackend: Sharded backend
+    """
+    return ShardedBackend(nodes or {node: RecordingBackend() for node in NODES})
+
+
+def test_ring_moves_only_removed_keys():
+    """Test that removing a node moves only its keys, and every node owns a share of the keys."""
+    ring = HashRing(NODES)
+    owners = {key: ring.get(key) for key in KEYS}
+    ring.remove('first')
+
+    assert set(owners.values()) == set(NODES)
+    assert all(ring.get(key) == 'second' for key in KEYS)
+    assert all(ring.get(key) == node for key, node in owners.items() if node == 'second')
+
+
+@pytest.mark.asyncio
+async def test_mget_per_shard():
+    """Test that reading several keys sends one MGET per node, with the keys the node owns."""
+    backend = make_backend()
+    mapping = {key: key.encode() for key in KEYS}
+    await backend.set_many(mapping)
+    found = await backend.mget(KEYS)
+
+    assert found == list(mapping.values())
+    for name, node in backend.nodes.items():
+        assert node.requests == [[key for key in KEYS if backend.ring.get(key) == name]]
+
+
+@pytest.mark.asyncio
+async def test_node_ejection():
+    """Test that a failed node is removed from the ring and its keys become misses on the other node."""
+    backend = make_backend(first=FailingBackend(), second=MemoryBackend())
+    await backend.set_many({key: key.encode() for key in KEYS})
+    owners: Dict[str, Optional[str]] = {key: backend.ring.get(key) for key in KEYS}
+    found = dict(zip(KEYS, await backend.mget(KEYS)))
+
+    assert 'first' not in backend.ring
+    assert all(found[key] is None for key, node in owners.items() if node == 'first')
+    assert all(found[key] == key.encode() for key, node in owners.items() if node == 'second')
+    assert await backend.set(KEYS[0], b'value')
+    assert await backend.get(KEYS[0]) == b'value'
+
+
+@pytest.mark.asyncio
+async def test_purge_broadcast():
+    """Test that purging a surrogate key deletes the tagged values on every node and counts them once."""
+    backend = make_backend()
+    await backend.set_many({key: key.encode() for key in KEYS}, expire=60, tags={'genres:1': KEYS[:50]})
+    purged = await backend.purge('genres:1')
+    found = await backend.mget(KEYS)
+
+    assert sorted(purged) == sorted(KEYS[:50])
+    assert {backend.ring.get(key) for key in purged} == set(NODES)
+    assert found[:50] == [None] * 50
+    assert all(found[50:])